@@ -1,10 +1,10 @@
 from flask import Blueprint, request, jsonify
 import os
-import openai
-import google.generativeai as genai
 from typing import Dict, Any
+import threading
 import time
 import logging
+from src.request_trace import trace_span
 
 ai_chat_bp = Blueprint('ai_chat', __name__)
 
@@ -18,13 +18,30 @@ class AIModelRouter:
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
         self.gemini_api_key = os.getenv('GEMINI_API_KEY')
         
-        # OpenAI 클라이언트 초기화
-        if self.openai_api_key:
-            openai.api_key = self.openai_api_key
-        
-        # Gemini 클라이언트 초기화
-        if self.gemini_api_key:
-            genai.configure(api_key=self.gemini_api_key)
+        # 공급자 SDK 는 import 비용이 커서 첫 호출 시 불러옴 (워커 시작 시간 단축)
+        self._openai = None
+        self._genai = None
+        self._sdk_lock = threading.Lock()
+    
+    def _openai_sdk(self):
+        """openai 모듈 (첫 GPT 호출 시 import 및 API 키 설정)"""
+        if self._openai is None:
+            with self._sdk_lock:
+                if self._openai is None:
+                    import openai
+                    openai.api_key = self.openai_api_key
+                    self._openai = openai
+        return self._openai
+    
+    def _gemini_sdk(self):
+        """google.generativeai 모듈 (첫 Gemini 호출 시 import 및 API 키 설정)"""
+        if self._genai is None:
+            with self._sdk_lock:
+                if self._genai is None:
+                    import google.generativeai as genai
+                    genai.configure(api_key=self.gemini_api_key)
+                    self._genai = genai
+        return self._genai
     
     def route_message(self, message: str, model_preference: str = "auto") -> Dict[str, Any]:
         """
@@ -72,15 +89,17 @@ class AIModelRouter:
             }
         
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "당신은 도움이 되는 AI 어시스턴트입니다. 한국어로 친근하고 정확하게 답변해주세요."},
-                    {"role": "user", "content": message}
-                ],
-                max_tokens=1000,
-                temperature=0.7
-            )
+            openai = self._openai_sdk()
+            with trace_span('llm'):
+                response = openai.ChatCompletion.create(
+                    model="gpt-3.5-turbo",
+                    messages=[
+                        {"role": "system", "content": "당신은 도움이 되는 AI 어시스턴트입니다. 한국어로 친근하고 정확하게 답변해주세요."},
+                        {"role": "user", "content": message}
+                    ],
+                    max_tokens=1000,
+                    temperature=0.7
+                )
             
             return {
                 "response": response.choices[0].message.content,
@@ -107,8 +126,9 @@ class AIModelRouter:
             }
         
         try:
-            model = genai.GenerativeModel('gemini-pro')
-            response = model.generate_content(message)
+            model = self._gemini_sdk().GenerativeModel('gemini-pro')
+            with trace_span('llm'):
+                response = model.generate_content(message)
             
             return {
                 "response": response.text,
@@ -1,10 +1,12 @@
 import asyncio
 import logging
 import subprocess
-import re
 import os
 from typing import Dict, Any, List
 from datetime import datetime
+from src.command_policy import default_policy
+from src.command_allowlist import CommandAllowlist
+from src import korean_command
 
 logger = logging.getLogger(__name__)
 
@@ -302,7 +304,7 @@ class AIINEnvironment:
 
     async def process_manus_response(self, manus_response: Dict[str, Any]) -> Dict[str, Any]:
         """Manus AI의 응답을 처리하고 AIIN의 다음 행동을 결정"""
-        logger.info(f"AIIN: Manus AI 응답 처리 시작 - {manus_response.get("summary", "No summary")}")
+        logger.info(f"AIIN: Manus AI 응답 처리 시작 - {manus_response.get('summary', 'No summary')}")
 
         # Manus의 응답을 현재 컨텍스트에 추가
         self.current_context["manus_response"] = manus_response
@@ -373,15 +375,9 @@ class GabrielExecutor:
             'whoami', 'pwd', 'date', 'uptime', 'echo', 'ls', 'cat',
             'ps', 'df', 'free', 'uname', 'id', 'groups'
         ]
-        self.blocked_patterns = [
-            r'\brm\b.*-rf',
-            r'\bsudo\s+rm\b',
-            r'\breboot\b',
-            r'\bshutdown\b',
-            r'\bpasswd\b',
-            r'\bmkfs\b',
-            r'\bformat\b'
-        ]
+        self.allowlist = CommandAllowlist({
+            'gabriel': [f'{command} {{args*}}' for command in self.safe_commands]
+        })
     
     async def execute_safe_command(self, command: str) -> str:
         """안전한 명령어 실행"""
@@ -403,7 +399,7 @@ class GabrielExecutor:
             elif 'uptime' in command:
                 return "up 2 days, 14:32, 1 user, load average: 0.15, 0.20, 0.18"
             elif 'echo' in command:
-                return command.replace('echo ', '').strip('"\\'')
+                return command.replace('echo ', '').strip('"\'')
             else:
                 return f"명령어 '{command}' 실행 완료"
                 
@@ -413,18 +409,8 @@ class GabrielExecutor:
     
     def _is_safe_command(self, command: str) -> bool:
         """명령어 안전성 검사"""
-        # 위험한 패턴 검사
-        for pattern in self.blocked_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return False
-        
-        # 안전한 명령어 목록 검사
-        command_parts = command.split()
-        if command_parts:
-            base_command = command_parts[0]
-            return base_command in self.safe_commands
-        
-        return False
+        # 위험 패턴 차단 후 허용 목록(argv 트라이) 검사
+        return default_policy.is_safe(command) and self.allowlist.match(command) is not None
     
     def get_status(self) -> Dict[str, Any]:
         """Gabriel 실행기 상태"""
@@ -438,33 +424,9 @@ class GabrielExecutor:
 class AIINNLPProcessor:
     """AIIN 자연어 처리기"""
     
-    def __init__(self):
-        self.korean_mappings = {
-            '재시작': 'restart',
-            '상태': 'status',
-            '확인': 'check',
-            '실행': 'run',
-            '중지': 'stop',
-            '시작': 'start',
-            '목록': 'list',
-            '정보': 'info',
-            '파일': 'file',
-            '디렉토리': 'directory'
-        }
-    
     def parse_korean_command(self, command: str) -> str:
         """한글 명령어를 영어로 변환"""
-        parsed = command.lower()
-        
-        # AIIN 접두사 제거
-        parsed = re.sub(r'aiin,?\s*', '', parsed, flags=re.IGNORECASE)
-        parsed = re.sub(r'해줘|하세요|해주세요', '', parsed)
-        
-        # 한글-영어 매핑
-        for korean, english in self.korean_mappings.items():
-            parsed = parsed.replace(korean, english)
-        
-        return parsed.strip()
+        return korean_command.parse_korean_command(command)
 
 
 class CommandValidator:
@@ -475,13 +437,10 @@ class CommandValidator:
             'ls', 'cat', 'echo', 'pwd', 'whoami', 'date', 'uptime',
             'ps', 'df', 'free', 'uname', 'id', 'groups'
         ]
+        self.allowlist = CommandAllowlist({
+            'system': [f'{command} {{args*}}' for command in self.safe_commands]
+        })
     
     def is_safe(self, command: str) -> bool:
         """명령어 안전성 검증"""
-        command_parts = command.split()
-        if command_parts:
-            return command_parts[0] in self.safe_commands
-        return False
-
-
-
+        return default_policy.is_safe(command) and self.allowlist.match(command) is not None
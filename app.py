@@ -1,12 +1,26 @@
-from flask import Flask, request, jsonify
+import os
+import sys
+# DON'T CHANGE THIS !!!
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from flask import Blueprint, Flask, request, jsonify, Response
 from flask_cors import CORS
 import subprocess
-import re
-import os
 import logging
+import json
+from src.command_policy import default_policy
+from src.command_allowlist import CommandAllowlist
+from src import clock
+from src import korean_command
+from src.job_queue import job_queue, parse_timeout, QueueFull
+from src.lifecycle import shutting_down
+from src.request_trace import trace_span
+from src.shell_auth import require_shell_token
 
-app = Flask(__name__)
-CORS(app)
+# Gabriel 실행기 API - 단독 실행(python app.py) 또는 통합 앱(app_factory)에 등록
+executor_bp = Blueprint('executor', __name__)
+# 셸 명령 실행 API - SHELL_API_TOKEN 인증 필수 (/api/status, /health 제외)
+executor_bp.before_request(require_shell_token)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -20,56 +34,19 @@ ALLOWED_COMMANDS = {
     'chatweb': ['npm run build', 'npm start', 'npm test']
 }
 
+# 허용 목록 엔진 (정책 파일이 있으면 ALLOWED_COMMANDS 대신 사용, 변경 시 재시작 없이 재로드)
+ALLOWLIST_FILE = os.environ.get('AIIN_ALLOWLIST_FILE', os.path.join(os.path.dirname(__file__), 'command_allowlist.json'))
+command_allowlist = CommandAllowlist(ALLOWED_COMMANDS, policy_file=ALLOWLIST_FILE)
+
 def is_safe_command(command):
     """명령어가 안전한지 확인"""
-    # 위험한 명령어 차단
-    dangerous_patterns = [
-        r'\brm\b.*-rf',
-        r'\bsudo\s+rm\b',
-        r'\breboot\b',
-        r'\bshutdown\b',
-        r'\bpasswd\b',
-        r'\bsu\b',
-        r'\bmkfs\b',
-        r'\bdd\b.*if=',
-        r'\bformat\b',
-        r'\bdel\b.*\*',
-        r'>\s*/dev/',
-        r'\|.*sh\b',
-        r';\s*rm\b',
-        r'&&.*rm\b'
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, command, re.IGNORECASE):
-            return False
-    
-    return True
+    # 컴파일된 공용 정책 엔진 사용 (argv 기반 검사 + 판정 캐시)
+    return default_policy.is_safe(command)
 
 def parse_korean_command(command):
     """한글 명령어를 영어 명령어로 변환"""
-    korean_mappings = {
-        '재시작': 'restart',
-        '상태': 'status',
-        '확인': 'check',
-        '빌드': 'build',
-        '실행': 'run',
-        '중지': 'stop',
-        '시작': 'start',
-        '목록': 'list',
-        '정보': 'info'
-    }
-    
-    # AIIN 명령어 패턴 처리
-    if 'aiin' in command.lower():
-        # "AIIN, nginx 재시작해줘" -> "nginx restart"
-        command = re.sub(r'aiin,?\s*', '', command, flags=re.IGNORECASE)
-        command = re.sub(r'해줘|하세요|해주세요', '', command)
-        
-        for korean, english in korean_mappings.items():
-            command = command.replace(korean, english)
-    
-    return command.strip()
+    # 공용 번역기 사용 (컴파일된 어휘 트라이 + 결과 캐시)
+    return korean_command.parse_korean_command(command)
 
 def execute_command(command):
     """명령어 실행"""
@@ -85,22 +62,33 @@ def execute_command(command):
                 'error': 'Dangerous command blocked'
             }
         
+        # 허용 목록 검사
+        allowed = command_allowlist.match(parsed_command)
+        if allowed is None:
+            return {
+                'success': False,
+                'output': '허용되지 않은 명령어입니다.',
+                'error': 'Command not in allowlist'
+            }
+        
         # 명령어 실행
         logger.info(f"Executing command: {parsed_command}")
         
-        result = subprocess.run(
-            parsed_command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        with trace_span('subprocess'):
+            result = subprocess.run(
+                parsed_command,
+                shell=True,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
         
         return {
             'success': result.returncode == 0,
             'output': result.stdout,
             'error': result.stderr,
-            'return_code': result.returncode
+            'return_code': result.returncode,
+            'category': allowed.category
         }
         
     except subprocess.TimeoutExpired:
@@ -110,6 +98,14 @@ def execute_command(command):
             'error': '명령어 실행 시간이 초과되었습니다.',
             'return_code': -1
         }
+    except ValueError as e:
+        # 번역할 수 없는 한글 명령어 - 다른 명령으로 대체하지 않음
+        return {
+            'success': False,
+            'output': '인식할 수 없는 명령어입니다.',
+            'error': str(e),
+            'return_code': -1
+        }
     except Exception as e:
         logger.error(f"Command execution error: {str(e)}")
         return {
@@ -119,7 +115,7 @@ def execute_command(command):
             'return_code': -1
         }
 
-@app.route('/api/execute', methods=['POST'])
+@executor_bp.route('/api/execute', methods=['POST'])
 def execute():
     """명령어 실행 API"""
     try:
@@ -141,7 +137,8 @@ def execute():
             'command': command,
             'output': result['output'],
             'error': result['error'],
-            'timestamp': subprocess.run(['date'], capture_output=True, text=True).stdout.strip()
+            'category': result.get('category'),
+            'timestamp': clock.timestamp()
         }
         
         if result['success']:
@@ -158,20 +155,161 @@ def execute():
             'message': f'서버 오류: {str(e)}'
         }), 500
 
-@app.route('/api/status', methods=['GET'])
+@executor_bp.route('/api/jobs', methods=['POST'])
+def create_job():
+    """장시간 실행 명령어를 백그라운드 작업으로 등록 (작업 ID 즉시 반환)"""
+    try:
+        data = request.get_json() or {}
+        command = data.get('command', '').strip()
+        
+        if not command:
+            return jsonify({
+                'success': False,
+                'message': '명령어가 입력되지 않았습니다.'
+            }), 400
+        
+        # 명령어 인식 오류(ValueError)와 구분되도록 먼저 검사
+        try:
+            timeout = parse_timeout(data.get('timeout'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'message': 'timeout 값이 올바르지 않습니다.',
+                'error': str(e)
+            }), 400
+        
+        parsed_command = parse_korean_command(command)
+        if not is_safe_command(parsed_command):
+            return jsonify({
+                'success': False,
+                'message': '위험한 명령어는 실행할 수 없습니다.',
+                'error': 'Dangerous command blocked'
+            }), 403
+        
+        allowed = command_allowlist.match(parsed_command)
+        if allowed is None:
+            return jsonify({
+                'success': False,
+                'message': '허용되지 않은 명령어입니다.',
+                'error': 'Command not in allowlist'
+            }), 403
+        
+        job = job_queue.submit(parsed_command, timeout=timeout)
+        
+        return jsonify({
+            'success': True,
+            'job_id': job.id,
+            'status': job.status,
+            'command': command,
+            'category': allowed.category,
+            'timestamp': clock.timestamp()
+        }), 202
+        
+    except QueueFull as e:
+        return jsonify({
+            'success': False,
+            'message': '대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요.',
+            'error': str(e)
+        }), 503, {'Retry-After': '5'}
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': '인식할 수 없는 명령어입니다.',
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Job API error: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': f'서버 오류: {str(e)}'
+        }), 500
+
+@executor_bp.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """작업 목록 조회 (출력 제외)"""
+    jobs = job_queue.list()
+    return jsonify({
+        'success': True,
+        'jobs': [job.to_dict(include_output=False) for job in jobs],
+        'total': len(jobs)
+    })
+
+@executor_bp.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """작업 상태 및 출력 조회 (offset 이후의 부분 출력만 요청 가능)"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': '작업을 찾을 수 없습니다.'}), 404
+    
+    offset = request.args.get('offset', 0, type=int)
+    result = job.to_dict(include_output=False)
+    chunks, next_offset, _ = job.wait_for_output(offset, timeout=0)
+    result['output'] = ''.join(chunks)
+    result['next_offset'] = next_offset
+    return jsonify(result)
+
+@executor_bp.route('/api/jobs/<job_id>/stream', methods=['GET'])
+def stream_job(job_id):
+    """작업 출력 스트리밍 (Server-Sent Events)"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': '작업을 찾을 수 없습니다.'}), 404
+    
+    def generate():
+        offset = 0
+        while True:
+            chunks, offset, finished = job.wait_for_output(offset, timeout=15)
+            for chunk in chunks:
+                for line in chunk.splitlines():
+                    yield f"data: {line}\n\n"
+            if finished:
+                yield f"event: done\ndata: {json.dumps(job.to_dict(include_output=False), ensure_ascii=False)}\n\n"
+                return
+            if shutting_down.is_set():
+                # 워커 종료 중 - 작업은 워커 메모리에 있으므로 종료 시 취소되고 이어 받을 수 없음
+                yield f"event: shutdown\ndata: {json.dumps({'offset': offset, 'job_status': 'cancelled'})}\n\n"
+                return
+            if not chunks:
+                yield ": keep-alive\n\n"
+    
+    return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+@executor_bp.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """작업 취소"""
+    job = job_queue.cancel(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify({'success': True, 'job_id': job.id, 'status': job.status, 'cancel_requested': job.cancel_requested})
+
+@executor_bp.route('/api/status', methods=['GET', 'HEAD'])
 def status():
-    """서버 상태 확인"""
+    """서버 상태 확인 (로드밸런서 readiness 프로브용, 프로세스 생성 없음)"""
     return jsonify({
         'status': 'running',
+        'ready': True,
         'message': 'AIIN Gabriel 실행기가 정상 작동 중입니다.',
-        'timestamp': subprocess.run(['date'], capture_output=True, text=True).stdout.strip()
+        'timestamp': clock.timestamp(),
+        'uptime_seconds': round(clock.uptime(), 3),
+        'pid': os.getpid(),
+        # 이 워커 프로세스의 블루프린트별 요청 처리 시간
+        'requests': clock.request_stats.snapshot()
     })
 
-@app.route('/health', methods=['GET'])
+@executor_bp.route('/health', methods=['GET'])
 def health():
     """헬스체크"""
     return jsonify({'status': 'healthy'})
 
+app = Flask(__name__)
+# 명령 실행 API 에는 다른 출처의 브라우저 요청을 허용하지 않음 (상태 확인만 CORS 허용)
+CORS(app, resources={r'/(?:api/status|health)$': {}})
+
+# 요청별 서버 처리 시간 헤더 (Server-Timing)
+clock.init_request_timer(app)
+
+app.register_blueprint(executor_bp)
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=4000, debug=True)
 
@@ -0,0 +1,193 @@
+import os
+import logging
+from importlib import import_module
+from typing import Dict, Iterable, List, Optional
+
+from flask import Flask
+from flask_cors import CORS
+
+from src import clock, lifecycle
+from src.models.booking import db
+from src.db_config import database_uri, init_database
+from src.migrations import Migration, pending_migrations, upgrade
+from src.booking_stats import init_daily_stats
+from src.booking_changes import init_change_feed
+from src.booking_search import init_search_index
+from src.booking_series import init_booking_series, materialize_series, series_horizon
+from src.static_assets import StaticManifest, precompress, serve_static
+from src.shell_auth import TOKEN_ENV, shell_token
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(__file__)
+
+# 블루프린트 등록 목록 - 모듈은 create_app 에서 선택된 것만 import 한다
+# APP_BLUEPRINTS=booking 처럼 지정하면 해당 블루프린트만 등록 (테스트, 역할별 워커)
+# 셸 명령 실행 블루프린트(SHELL_BLUEPRINTS)는 기본 목록에 없으며 APP_BLUEPRINTS 로 명시해야 한다
+BLUEPRINTS = {
+    'user': ('src.routes.user', 'user_bp', '/api'),
+    'booking': ('src.routes.booking', 'booking_bp', '/api'),
+    'ai_chat': ('src.routes.ai_chat', 'ai_chat_bp', '/api/ai'),
+    'terminal': ('src.routes.terminal', 'terminal_bp', '/api/terminal'),
+    'multi_ai': ('src.routes.multi_ai', 'multi_ai_bp', '/api/multi-ai'),
+    # Gabriel 실행기 (/api/execute, /api/jobs, /api/status, /health)
+    'executor': ('src.app', 'executor_bp', None),
+}
+
+# 셸 명령을 실행하는 블루프린트 - SHELL_API_TOKEN 인증 필수, CORS 미적용
+# 명령 작업(job_queue)과 터미널 세션이 프로세스 메모리에 있으므로 단일 워커로만 실행 (server.py)
+SHELL_BLUEPRINTS = frozenset(['terminal', 'executor'])
+DEFAULT_BLUEPRINTS = [name for name in BLUEPRINTS if name not in SHELL_BLUEPRINTS]
+
+# 다른 출처의 브라우저 요청을 허용하는 경로 (셸 실행 API 제외)
+CORS_RESOURCES = {r'/api/(?!terminal(?:/|$)|execute$|jobs(?:/|$)).*': {}}
+
+
+def enabled_blueprints(names: Optional[Iterable[str]] = None) -> List[str]:
+    if names is None:
+        value = os.environ.get('APP_BLUEPRINTS', '').strip()
+        names = [name.strip() for name in value.split(',') if name.strip()] if value else list(DEFAULT_BLUEPRINTS)
+    names = list(names)
+    unknown = [name for name in names if name not in BLUEPRINTS]
+    if unknown:
+        raise ValueError(f"Unknown blueprints: {', '.join(unknown)} (available: {', '.join(BLUEPRINTS)})")
+    return names
+
+
+def register_blueprints(app: Flask, names: Optional[Iterable[str]] = None) -> List[str]:
+    names = enabled_blueprints(names)
+    for name in names:
+        module_name, attribute, url_prefix = BLUEPRINTS[name]
+        app.register_blueprint(getattr(import_module(module_name), attribute), url_prefix=url_prefix)
+    return names
+
+
+def init_schema(target: Optional[int] = None, rebuild_search: bool = False) -> List[Migration]:
+    """스키마 생성/마이그레이션 + 요약 테이블/변경 피드/검색 인덱스 준비 (앱 컨텍스트 안에서 호출)
+
+    앱 시작 시에는 실행하지 않는다 - python migrate.py upgrade 또는 flask init-db 로 실행.
+    """
+    applied = upgrade(target)
+    init_daily_stats()
+    init_change_feed()
+    init_search_index(rebuild=rebuild_search)
+    init_booking_series()
+    return applied
+
+
+def init_features(check_schema: bool = True):
+    """이미 준비된 스키마에서 선택 기능 사용 여부만 확인 (DDL/백필 없음)
+
+    check_schema: 모델이 매핑하는 컬럼/테이블을 만드는 마이그레이션(required)이 남아 있으면
+    모든 예약/고객 조회가 실패하므로 경고 대신 RuntimeError 로 시작을 중단한다.
+    """
+    pending = pending_migrations()
+    if pending:
+        versions = ', '.join(str(migration.version) for migration in pending)
+        required = [migration for migration in pending if migration.required]
+        if required and check_schema:
+            raise RuntimeError(f"Database schema is out of date: migration(s) "
+                               f"{', '.join(str(migration.version) for migration in required)} add mapped "
+                               "tables/columns, run 'python migrate.py upgrade' or 'flask init-db' before starting")
+        logger.warning(f"{len(pending)} pending migration(s) ({versions}), "
+                       "run 'python migrate.py upgrade' or 'flask init-db'")
+    init_daily_stats()
+    init_change_feed()
+    init_search_index(create=False)
+    init_booking_series()
+
+
+def log_request_stats():
+    for name, stats in clock.request_stats.snapshot().items():
+        logger.info(f"Requests [{name}] {stats['count']} ({stats['errors']} errors) "
+                    f"avg {stats['avg_ms']}ms p95 {stats['p95_ms']}ms max {stats['max_ms']}ms")
+
+
+def create_app(config: Optional[Dict] = None, blueprints: Optional[Iterable[str]] = None) -> Flask:
+    """애플리케이션 생성
+
+    AUTO_MIGRATE=1 이면 시작 시 init_schema 를 실행한다 (단일 프로세스 개발 환경용).
+    그 외에는 필수 마이그레이션이 남아 있으면 시작하지 않는다 (config SCHEMA_CHECK=False 로 생략,
+    마이그레이션을 실행하는 migrate.py / flask init-db 용).
+    """
+    app = Flask(__name__, static_folder=os.path.join(BASE_DIR, 'static'))
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'asdf#FGSgvasgf$5$WGT')
+    if config:
+        app.config.update(config)
+
+    # CORS 설정 - 프론트엔드와의 통신을 위해 (셸 실행 API 제외)
+    CORS(app, resources=CORS_RESOURCES)
+
+    # 요청별 Server-Timing 헤더 + 블루프린트별 처리 시간 집계 (clock.request_stats)
+    clock.init_request_timer(app)
+
+    names = enabled_blueprints(blueprints)
+    if SHELL_BLUEPRINTS.intersection(names) and not shell_token():
+        raise RuntimeError(f"{', '.join(sorted(SHELL_BLUEPRINTS.intersection(names)))} blueprint(s) "
+                           f"require {TOKEN_ENV} to be set")
+    register_blueprints(app, names)
+
+    # DATABASE_URL 이 없으면 SQLite 파일 (WAL, busy_timeout 등은 db_config 의 환경 변수로 조정)
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI') or database_uri(os.path.join(BASE_DIR, 'database', 'app.db'))
+    init_database(app, db, uri)
+    with app.app_context():
+        if os.environ.get('AUTO_MIGRATE') == '1':
+            init_schema()
+        else:
+            init_features(app.config.get('SCHEMA_CHECK', True))
+        engine = db.engine
+
+    # 워커 종료 시 정리 (server.py 가 진행 중인 요청을 마무리한 뒤 실행)
+    lifecycle.on_shutdown(engine.dispose)
+    if SHELL_BLUEPRINTS.intersection(names):
+        from src.job_queue import job_queue
+
+        def stop_jobs():
+            job_queue.shutdown(cancel_jobs=True)
+
+        lifecycle.on_shutdown(stop_jobs)
+    lifecycle.on_shutdown(log_request_stats)
+
+    # 반복 예약 회차는 조회 요청이 아닌 워커별 백그라운드 스레드에서 horizon 까지 생성
+    @app.before_request
+    def start_series_horizon():
+        series_horizon.start(app)
+
+    lifecycle.on_shutdown(series_horizon.stop)
+
+    # 요청 추적 + /debug/perf (DB/LLM/서브프로세스 구간, 샘플링 프로파일러)
+    if os.environ.get('PERF_DEBUG') == '1':
+        from src.request_trace import init_request_tracing, profiler
+        init_request_tracing(app, engine)
+        lifecycle.on_shutdown(profiler.stop)
+
+    # 정적 파일 매니페스트 (시작 시 한 번 구성, 미리 압축한 gzip/br 과 캐시 헤더 포함 - 없으면 첫 요청 때 압축)
+    static_manifest = StaticManifest(app.static_folder, reload=os.environ.get('STATIC_RELOAD') == '1')
+
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def serve(path):
+        return serve_static(static_manifest, path)
+
+    @app.cli.command('init-db')
+    def init_db_command():
+        """스키마 생성/마이그레이션 적용"""
+        applied = init_schema()
+        print(f"{len(applied)} migration(s) applied")
+
+    @app.cli.command('precompress-static')
+    def precompress_static_command():
+        """정적 파일의 .gz/.br 을 최고 압축률로 미리 생성 (프론트엔드 빌드 후 실행)"""
+        written = precompress(app.static_folder)
+        print(f"{written} compressed file(s) written to {app.static_folder}")
+
+    @app.cli.command('materialize-series')
+    def materialize_series_command():
+        """반복 예약 회차를 horizon 까지 생성 (서버 워커에서도 백그라운드로 주기적으로 실행됨)"""
+        result = materialize_series()
+        print(f"{result['created']} booking(s) created, {result['skipped']} skipped "
+              f"for {result['series']} series")
+        if result['failed']:
+            print(f"{result['failed']} batch(es) rolled back by concurrent bookings, run again")
+
+    return app
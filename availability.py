@@ -0,0 +1,274 @@
+import os
+import time
+import logging
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from src.models.booking import db, Booking
+from src.reference_cache import reference_cache, ServiceRef, StaffRef
+
+logger = logging.getLogger(__name__)
+
+# 일정을 차지하지 않는 예약 상태
+INACTIVE_STATUSES = ('cancelled',)
+
+# 빈 시간 탐색 간격(분), 기본 검색 범위(일)
+SLOT_STEP = 30
+DEFAULT_HORIZON_DAYS = 14
+MAX_HORIZON_DAYS = 90
+DEFAULT_DURATION = 60
+
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+# 세션에 변경된 (직원, 날짜)를 모아 두었다가 커밋 시점에 무효화
+CHANGED_KEY = 'availability_changed'
+
+
+def parse_minutes(value: str) -> int:
+    """'HH:MM' -> 0시부터의 분 (형식이 잘못되면 ValueError)"""
+    hours, minutes = value.split(':')
+    hours, minutes = int(hours), int(minutes)
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f'Invalid time: {value}')
+    return hours * 60 + minutes
+
+
+def format_minutes(minutes: int) -> str:
+    return f'{minutes // 60:02d}:{minutes % 60:02d}'
+
+
+class Slot(NamedTuple):
+    date: date
+    start: int
+    end: int
+    staff: StaffRef
+
+    def to_dict(self) -> Dict:
+        return {
+            'date': self.date.strftime('%Y-%m-%d'),
+            'time': format_minutes(self.start),
+            'end_time': format_minutes(self.end),
+            'staff': self.staff.name,
+            'staff_id': self.staff.id,
+        }
+
+
+class DaySchedule:
+    """직원 한 명의 하루 예약 구간 ([시작, 종료) 분 단위, 시작 시각순)
+
+    ends_max[i] 는 ends[0..i] 의 최댓값이므로 겹치는 기존 데이터가 있어도
+    충돌 검사는 이진 탐색 한 번(O(log n))으로 끝난다.
+    """
+
+    __slots__ = ('starts', 'ends', 'ids', 'ends_max', 'loaded_at')
+
+    def __init__(self, intervals: Iterable[Tuple[int, int, int]]):
+        intervals = sorted(intervals)
+        self.starts = [start for start, _, _ in intervals]
+        self.ends = [end for _, end, _ in intervals]
+        self.ids = [booking_id for _, _, booking_id in intervals]
+        self.ends_max = []
+        latest = -1
+        for end in self.ends:
+            latest = max(latest, end)
+            self.ends_max.append(latest)
+        self.loaded_at = time.monotonic()
+
+    def conflict(self, start: int, end: int, exclude_id: Optional[int] = None) -> Optional[int]:
+        """[start, end) 와 겹치는 예약 id (없으면 None)"""
+        index = bisect_left(self.starts, end)
+        if index == 0 or self.ends_max[index - 1] <= start:
+            return None
+        # 겹치는 구간이 있을 때만 뒤에서부터 확인 (제외할 예약 자신 건너뛰기)
+        for i in range(index - 1, -1, -1):
+            if self.ends_max[i] <= start:
+                break
+            if self.ends[i] > start and self.ids[i] != exclude_id:
+                return self.ids[i]
+        return None
+
+    def free_ranges(self, open_at: int, close_at: int) -> List[Tuple[int, int]]:
+        """근무 시간 중 예약이 없는 구간 목록"""
+        ranges = []
+        cursor = open_at
+        for start, end in zip(self.starts, self.ends):
+            if start > cursor:
+                ranges.append((cursor, min(start, close_at)))
+            cursor = max(cursor, end)
+            if cursor >= close_at:
+                break
+        if cursor < close_at:
+            ranges.append((cursor, close_at))
+        return [(start, end) for start, end in ranges if end > start]
+
+
+def works_on(staff: StaffRef, day: date) -> bool:
+    # 근무 요일이 지정되지 않은 직원은 매일 근무로 간주
+    return not staff.working_days or WEEKDAYS[day.weekday()] in staff.working_days
+
+
+def can_perform(staff: StaffRef, service: ServiceRef) -> bool:
+    # 전문 분야가 지정되지 않은 직원은 모든 서비스 가능
+    return not staff.specialties or service.name in staff.specialties
+
+
+def working_hours(staff: StaffRef) -> Tuple[int, int]:
+    return (parse_minutes(staff.working_hours_start or '09:00'),
+            parse_minutes(staff.working_hours_end or '18:00'))
+
+
+class AvailabilityIndex:
+    """(직원, 날짜)별 DaySchedule 캐시
+
+    예약 변경이 커밋되면 해당 (직원, 날짜)만 무효화하고, 다른 워커 프로세스의
+    변경은 ttl 초 이내에 반영된다. 예약 생성/수정의 충돌 검사는 fresh=True 로
+    항상 DB 에서 다시 읽는다.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._days: 'OrderedDict[Tuple[int, date], DaySchedule]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def invalidate(self, keys: Optional[Iterable[Tuple[int, date]]] = None):
+        with self._lock:
+            if keys is None:
+                self._days.clear()
+                return
+            for key in keys:
+                self._days.pop(key, None)
+
+    def _load(self, staff_ids: List[int], days: List[date]) -> Dict[Tuple[int, date], DaySchedule]:
+        """(직원, 날짜) 조합의 예약 구간을 한 번의 쿼리로 조회"""
+        rows = db.session.query(
+            Booking.id, Booking.staff_id, Booking.date, Booking.time, Booking.duration, Booking.service_id
+        ).filter(
+            Booking.staff_id.in_(staff_ids),
+            Booking.date.in_(days),
+            db.or_(Booking.status.is_(None), Booking.status.notin_(INACTIVE_STATUSES))
+        ).all()
+
+        intervals = {(staff_id, day): [] for staff_id in staff_ids for day in days}
+        for booking_id, staff_id, day, start_time, duration, service_id in rows:
+            try:
+                start = parse_minutes(start_time)
+            except (AttributeError, ValueError):
+                logger.warning(f"Booking {booking_id} has an unparseable time: {start_time!r}")
+                continue
+            if not duration:
+                service = reference_cache.service_by_id(service_id)
+                duration = service.duration if service else DEFAULT_DURATION
+            intervals[(staff_id, day)].append((start, start + duration, booking_id))
+        return {key: DaySchedule(value) for key, value in intervals.items()}
+
+    def schedules(self, staff_ids: List[int], days: List[date], fresh: bool = False) -> Dict[Tuple[int, date], DaySchedule]:
+        now = time.monotonic()
+        result = {}
+        missing_staff: Set[int] = set()
+        missing_days: Set[date] = set()
+        with self._lock:
+            for staff_id in staff_ids:
+                for day in days:
+                    schedule = None if fresh else self._days.get((staff_id, day))
+                    if schedule is None or now - schedule.loaded_at >= self.ttl:
+                        missing_staff.add(staff_id)
+                        missing_days.add(day)
+                    else:
+                        self._days.move_to_end((staff_id, day))
+                        result[(staff_id, day)] = schedule
+        if missing_staff:
+            loaded = self._load(sorted(missing_staff), sorted(missing_days))
+            if fresh:
+                # 쓰기 트랜잭션 안에서 읽은 (커밋 전) 일정은 캐시에 넣지 않음
+                return loaded
+            with self._lock:
+                for key, schedule in loaded.items():
+                    self._days[key] = schedule
+                    self._days.move_to_end(key)
+                while len(self._days) > self.max_entries:
+                    self._days.popitem(last=False)
+            for key, schedule in loaded.items():
+                result.setdefault(key, schedule)
+        return result
+
+    def schedule(self, staff_id: int, day: date, fresh: bool = False) -> DaySchedule:
+        return self.schedules([staff_id], [day], fresh)[(staff_id, day)]
+
+    def find_conflict(self, staff_id: int, day: date, start_time: str, duration: int,
+                      exclude_id: Optional[int] = None) -> Optional[int]:
+        """같은 직원의 같은 날 예약 중 [start_time, start_time + duration) 과 겹치는 예약 id"""
+        start = parse_minutes(start_time)
+        end = start + (duration or DEFAULT_DURATION)
+        return self.schedule(staff_id, day, fresh=True).conflict(start, end, exclude_id)
+
+    def free_slots(self, service: ServiceRef, start: datetime, count: int = 5,
+                   staff: Optional[StaffRef] = None, days: int = DEFAULT_HORIZON_DAYS) -> List[Slot]:
+        """start 이후 서비스 가능한 가장 빠른 빈 시간 count 개 (시간순, 같은 시간이면 직원 이름순)"""
+        duration = service.duration or DEFAULT_DURATION
+        candidates = [staff] if staff else [ref for ref in reference_cache.active_staff() if can_perform(ref, service)]
+        if not candidates:
+            return []
+        day_list = [start.date() + timedelta(days=offset) for offset in range(min(days, MAX_HORIZON_DAYS))]
+        schedules = self.schedules([ref.id for ref in candidates], day_list)
+
+        slots = []
+        for day in day_list:
+            day_slots = []
+            earliest = start.hour * 60 + start.minute if day == start.date() else 0
+            for ref in candidates:
+                if not works_on(ref, day):
+                    continue
+                open_at, close_at = working_hours(ref)
+                for free_start, free_end in schedules[(ref.id, day)].free_ranges(open_at, close_at):
+                    # SLOT_STEP 단위로 정렬된 시작 시각
+                    slot_start = max(free_start, earliest)
+                    slot_start += -slot_start % SLOT_STEP
+                    while slot_start + duration <= free_end:
+                        day_slots.append(Slot(day, slot_start, slot_start + duration, ref))
+                        slot_start += SLOT_STEP
+            day_slots.sort(key=lambda slot: (slot.start, slot.staff.name))
+            slots.extend(day_slots[:count - len(slots)])
+            if len(slots) >= count:
+                break
+        return slots
+
+
+availability_index = AvailabilityIndex(ttl=float(os.environ.get('AVAILABILITY_CACHE_TTL', 30)))
+
+
+def _history_keys(booking) -> Set[Tuple[int, date]]:
+    """변경 전/후 (직원, 날짜) 조합"""
+    state = inspect(booking)
+    staff_ids = {booking.staff_id}
+    days = {booking.date}
+    staff_ids.update(state.attrs.staff_id.history.deleted or ())
+    days.update(state.attrs.date.history.deleted or ())
+    return {(staff_id, day) for staff_id in staff_ids for day in days if staff_id and day}
+
+
+@event.listens_for(Booking, 'after_insert')
+@event.listens_for(Booking, 'after_update')
+@event.listens_for(Booking, 'after_delete')
+def _booking_changed(mapper, connection, booking):
+    session = object_session(booking)
+    if session is not None:
+        session.info.setdefault(CHANGED_KEY, set()).update(_history_keys(booking))
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_on_commit(session):
+    keys = session.info.pop(CHANGED_KEY, None)
+    if keys:
+        availability_index.invalidate(keys)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session):
+    session.info.pop(CHANGED_KEY, None)
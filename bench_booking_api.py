@@ -0,0 +1,427 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import json
+import time
+import random
+import logging
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import http.client
+from datetime import datetime, timedelta
+from itertools import combinations
+from urllib.parse import urlencode, urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask
+from sqlalchemy import event
+
+from src.models.booking import db
+from src.routes.booking import booking_bp
+from src.migrations import upgrade
+from src.db_config import init_database
+from src.booking_stats import init_daily_stats
+from src.booking_changes import init_change_feed
+from src.booking_search import init_search_index
+from src.reference_cache import reference_cache
+from src.availability import availability_index
+from src.response_cache import response_cache
+from src.sample_data import seed_bulk
+
+# 예약 API 부하 테스트
+#
+#   python bench_booking_api.py --sizes 1000,100000,1000000 --requests 200 --output run.json
+#   python bench_booking_api.py --server --concurrency 8 --compare run.json
+#   python bench_booking_api.py --url http://127.0.0.1:5000/api    (이미 실행 중인 서버, 쿼리 수는 측정 불가)
+#
+# 크기별 시드 DB 는 --data-dir 에 한 번만 만들어 두고, 실행마다 복사본을 사용하므로
+# POST/PUT 로 바뀐 데이터가 다음 실행 결과에 영향을 주지 않는다.
+# GET 응답 캐시 없이 조회 비용만 측정하려면 RESPONSE_CACHE_TTL=0 으로 실행한다.
+
+DEFAULT_SIZES = '1000,100000,1000000'
+FILTERS = ('date', 'staff', 'service', 'search')
+
+
+class QueryCounter:
+    """엔진 단위 SQL 실행 수 (요청 처리 스레드별로 집계)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._local = threading.local()
+        event.listen(engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *args):
+        self._local.count = getattr(self._local, 'count', 0) + 1
+
+    def reset(self):
+        self._local.count = 0
+
+    def value(self) -> int:
+        return getattr(self._local, 'count', 0)
+
+    def close(self):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+
+
+class TestClientTransport:
+    """Flask test client - 요청과 같은 스레드에서 쿼리 수 측정"""
+
+    name = 'test_client'
+
+    def __init__(self, app, counter):
+        self.client = app.test_client()
+        self.counter = counter
+
+    def request(self, method, path, body=None):
+        self.counter.reset()
+        response = self.client.open(path, method=method, json=body)
+        return response.status_code, response.get_json(silent=True), self.counter.value()
+
+
+class HTTPTransport:
+    """실제 WSGI 서버 - 스레드마다 keep-alive 연결 하나 사용
+
+    같은 프로세스에서 띄운 서버(--server)는 응답 헤더로 요청별 쿼리 수를 받는다.
+    """
+
+    name = 'http'
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.prefix = parts.path.rstrip('/')
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        return connection
+
+    def request(self, method, path, body=None):
+        payload = json.dumps(body) if body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload else {}
+        # test client 와 같은 경로(/api/...)를 서버 주소의 경로 접두어로 바꿔 요청
+        path = self.prefix + path[len('/api'):] if path.startswith('/api') else path
+        for attempt in (0, 1):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+        queries = response.getheader('X-Query-Count')
+        try:
+            parsed = json.loads(data) if data else None
+        except ValueError:
+            parsed = None
+        return response.status, parsed, int(queries) if queries is not None else None
+
+
+def create_app(database_path):
+    app = Flask(__name__)
+    # main.py 와 같은 엔진 설정 (WAL, busy_timeout, 커넥션 풀)
+    init_database(app, db, f'sqlite:///{database_path}')
+    app.register_blueprint(booking_bp, url_prefix='/api')
+    with app.app_context():
+        upgrade()
+        init_daily_stats()
+        init_change_feed()
+        init_search_index()
+    # 프로세스 단위 캐시는 DB 를 바꿀 때마다 비움
+    reference_cache.invalidate()
+    availability_index.invalidate()
+    response_cache.clear()
+    return app
+
+
+def prepare_database(data_dir, size, seed, reseed=False):
+    """크기별 시드 DB 파일을 (없으면) 만들고, 이번 실행용 복사본 경로 반환"""
+    seeded = os.path.join(data_dir, f'bench_{size}_{seed}.db')
+    if reseed or not os.path.exists(seeded):
+        if os.path.exists(seeded):
+            os.remove(seeded)
+        app = create_app(seeded)
+        with app.app_context():
+            result = seed_bulk(customers=max(size // 5, 1), bookings=size, seed=seed)
+            db.session.remove()
+            db.engine.dispose()
+        print(f"seeded {size} bookings in {result['elapsed_seconds']} s -> {seeded}")
+    working = os.path.join(data_dir, f'bench_{size}_{seed}.run.db')
+    shutil.copyfile(seeded, working)
+    return working
+
+
+def start_server(app, counter):
+    """같은 프로세스에서 threaded werkzeug 서버 실행 (포트 자동 할당)"""
+    from werkzeug.serving import make_server
+
+    @app.after_request
+    def add_query_count(response):
+        response.headers['X-Query-Count'] = str(counter.value())
+        return response
+
+    @app.before_request
+    def reset_query_count():
+        counter.reset()
+
+    # 요청별 접근 로그는 측정을 방해하므로 끔
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}/api'
+
+
+def discover(transport, rng, sample_days=20):
+    """시나리오 파라미터(직원/서비스 이름, 예약 날짜, 검색어, 예약 id)를 API 로 수집"""
+    _, staff, _ = transport.request('GET', '/api/staff')
+    _, services, _ = transport.request('GET', '/api/services')
+    today = datetime.now().date()
+    _, stats, _ = transport.request('GET', '/api/stats/range?' + urlencode({
+        'start': (today - timedelta(days=3 * 365)).strftime('%Y-%m-%d'),
+        'end': (today + timedelta(days=3 * 365)).strftime('%Y-%m-%d'),
+    }))
+    dates = [bucket['day'] for bucket in (stats or {}).get('buckets', []) if bucket['total_bookings']]
+    if not (staff and services and dates):
+        raise RuntimeError('No bookings to benchmark - seed the database first (init_data.py --bookings N)')
+
+    # 무작위 날짜 몇 개의 예약에서 수정 대상 id 와 검색어 수집
+    items = []
+    for day in rng.sample(dates, min(sample_days, len(dates))):
+        _, page, _ = transport.request('GET', '/api/bookings?' + urlencode({'date': day, 'limit': 100}))
+        items.extend(page['items'] if page else [])
+    return {
+        'staff': [s['name'] for s in staff],
+        'services': [s['name'] for s in services],
+        'dates': dates,
+        'names': sorted({item['customer_name'] for item in items if item.get('customer_name')}),
+        'ids': [item['id'] for item in items],
+        # 새 예약은 시드 데이터 범위 밖 날짜에 넣어 충돌을 피함
+        'first_free_day': max(today + timedelta(days=3 * 365),
+                              datetime.strptime(dates[-1], '%Y-%m-%d').date()) + timedelta(days=1),
+    }
+
+
+def bookings_scenarios(params, rng, page_size):
+    """GET /bookings 필터 조합별 요청 경로 생성기 (필터 없음 포함 16가지)"""
+    values = {
+        'date': lambda: rng.choice(params['dates']),
+        'staff': lambda: rng.choice(params['staff']),
+        'service': lambda: rng.choice(params['services']),
+        # 고객 이름 앞 두 글자 (부분 검색)
+        'search': lambda: rng.choice(params['names'])[:2],
+    }
+    # 수집한 예약에 고객 이름이 없으면 검색 조합은 건너뜀 (빈 목록에서 고를 수 없음)
+    if not params['names']:
+        print("No customer names found in sampled bookings - skipping search scenarios", file=sys.stderr)
+    for size in range(len(FILTERS) + 1):
+        for combo in combinations(FILTERS, size):
+            if 'search' in combo and not params['names']:
+                continue
+
+            def make_path(combo=combo):
+                query = {name: values[name]() for name in combo}
+                if page_size:
+                    query['limit'] = page_size
+                return 'GET', '/api/bookings?' + urlencode(query), None
+            yield 'GET /bookings [' + ('+'.join(combo) or 'none') + ']', make_path
+
+
+def write_scenarios(params, rng):
+    # 새 예약은 시드 데이터 이후 날짜에 직원별로 30분 간격 배치 (충돌 없이 201)
+    first_day = params['first_free_day']
+    counter = {'next': 0}
+    lock = threading.Lock()
+
+    def create():
+        with lock:
+            index = counter['next']
+            counter['next'] += 1
+        staff = params['staff'][index % len(params['staff'])]
+        slot = index // len(params['staff'])
+        day = first_day + timedelta(days=slot // 16)
+        minutes = 9 * 60 + (slot % 16) * 30
+        return 'POST', '/api/bookings', {
+            'customerName': f'부하테스트{index}',
+            'customerPhone': f'070-{index // 10000:04d}-{index % 10000:04d}',
+            'petName': '테스트',
+            'serviceType': '네일' if '네일' in params['services'] else params['services'][0],
+            'date': day.strftime('%Y-%m-%d'),
+            'time': f'{minutes // 60:02d}:{minutes % 60:02d}',
+            'staff': staff,
+        }
+
+    def update():
+        # 일정은 그대로 두고 상태/메모만 변경 (통계 요약 증감 포함)
+        return 'PUT', f"/api/bookings/{rng.choice(params['ids'])}", {
+            'status': rng.choice(['confirmed', 'pending']),
+            'notes': f'load test {rng.random():.6f}',
+        }
+
+    def stats():
+        return 'GET', '/api/stats/daily?' + urlencode({'date': rng.choice(params['dates'])}), None
+
+    yield 'POST /bookings', create
+    if params['ids']:
+        yield 'PUT /bookings/<id>', update
+    else:
+        print("No bookings found in sampled dates - skipping PUT /bookings/<id>", file=sys.stderr)
+    yield 'GET /stats/daily', stats
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def run_scenario(transport, make_request, count, concurrency, warmup):
+    """count 개 요청 실행 후 지연 분위수/처리량/요청당 쿼리 수 반환"""
+    for _ in range(warmup):
+        transport.request(*make_request())
+
+    def one(_):
+        method, path, body = make_request()
+        start = time.perf_counter()
+        status, _, queries = transport.request(method, path, body)
+        return time.perf_counter() - start, status, queries
+
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(concurrency) as pool:
+            samples = list(pool.map(one, range(count)))
+    else:
+        samples = [one(i) for i in range(count)]
+    wall = time.perf_counter() - started
+
+    latencies = sorted(sample[0] * 1000 for sample in samples)
+    queries = [sample[2] for sample in samples if sample[2] is not None]
+    statuses = {}
+    for _, status, _ in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    return {
+        'requests': count,
+        'errors': sum(1 for _, status, _ in samples if status >= 400),
+        'statuses': statuses,
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'p99_ms': round(percentile(latencies, 0.99), 2),
+        'max_ms': round(latencies[-1], 2),
+        'throughput_rps': round(count / wall, 1) if wall else None,
+        'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def run_size(transport, size, args):
+    rng = random.Random(args.seed)
+    params = discover(transport, rng)
+    scenarios = list(bookings_scenarios(params, rng, args.page_size)) + list(write_scenarios(params, rng))
+    results = []
+    for name, make_request in scenarios:
+        if args.scenario and args.scenario not in name:
+            continue
+        result = dict(size=size, scenario=name, **run_scenario(
+            transport, make_request, args.requests, args.concurrency, args.warmup
+        ))
+        results.append(result)
+        queries = result['queries_per_request']
+        print(f"{size:>8} {name:<44} p50 {result['p50_ms']:8.2f}  p95 {result['p95_ms']:8.2f}  "
+              f"p99 {result['p99_ms']:8.2f} ms  {result['throughput_rps']:8.1f} req/s  "
+              f"{'-' if queries is None else queries:>5} q/req  {result['errors']} errors")
+    return results
+
+
+def compare(results, baseline_path):
+    """이전 실행 결과와 p95/처리량 비교 (크기, 시나리오가 같은 항목만)"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(item['size'], item['scenario']): item for item in json.load(f)['results']}
+    print(f"\ncompared with {baseline_path}")
+    for result in results:
+        before = baseline.get((result['size'], result['scenario']))
+        if not before:
+            continue
+        p95 = result['p95_ms'] / before['p95_ms'] if before['p95_ms'] else float('nan')
+        rps = result['throughput_rps'] / before['throughput_rps'] if before['throughput_rps'] else float('nan')
+        print(f"{result['size']:>8} {result['scenario']:<44} p95 x{p95:5.2f}  throughput x{rps:5.2f}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='예약 API 부하 테스트')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help=f'시드 예약 수 목록 (기본 {DEFAULT_SIZES})')
+    parser.add_argument('--requests', type=int, default=200, help='시나리오별 요청 수')
+    parser.add_argument('--warmup', type=int, default=5, help='측정 전 요청 수')
+    parser.add_argument('--concurrency', type=int, default=1, help='동시 요청 수 (--server/--url 에서만 의미 있음)')
+    parser.add_argument('--page-size', type=int, default=50, help='GET /bookings limit (0 이면 전체 목록)')
+    parser.add_argument('--scenario', help='이름에 이 문자열이 포함된 시나리오만 실행')
+    parser.add_argument('--server', action='store_true', help='같은 프로세스에 WSGI 서버를 띄워 HTTP 로 측정')
+    parser.add_argument('--url', help='이미 실행 중인 서버 (예: http://127.0.0.1:5000/api) - 시드는 하지 않음')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'booking_bench'),
+                        help='시드 DB 파일 보관 디렉터리')
+    parser.add_argument('--reseed', action='store_true', help='보관된 시드 DB 를 다시 생성')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--output', help='결과 JSON 파일 경로')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일')
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    mode = 'url' if args.url else 'server' if args.server else 'test_client'
+    if mode == 'test_client' and args.concurrency > 1:
+        print('--concurrency is ignored with the test client (use --server)')
+        args.concurrency = 1
+
+    results = []
+    if args.url:
+        results.extend(run_size(HTTPTransport(args.url), None, args))
+    else:
+        os.makedirs(args.data_dir, exist_ok=True)
+        for size in [int(value) for value in args.sizes.split(',') if value]:
+            app = create_app(prepare_database(args.data_dir, size, args.seed, args.reseed))
+            with app.app_context():
+                counter = QueryCounter(db.engine)
+                server = None
+                try:
+                    if args.server:
+                        server, base_url = start_server(app, counter)
+                        transport = HTTPTransport(base_url)
+                    else:
+                        transport = TestClientTransport(app, counter)
+                    results.extend(run_size(transport, size, args))
+                finally:
+                    if server:
+                        server.shutdown()
+                    counter.close()
+                    db.session.remove()
+                    db.engine.dispose()
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'mode': mode,
+            'url': args.url,
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'page_size': args.page_size,
+            'seed': args.seed,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
@@ -0,0 +1,92 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import random
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from flask import Flask
+from sqlalchemy import event
+
+from src.models.booking import db, Booking, Customer, Pet, Service, Staff
+from src.routes.booking import booking_bp
+
+
+def create_app():
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    app.register_blueprint(booking_bp, url_prefix='/api')
+    return app
+
+
+def seed(bookings=10000, customers=2000):
+    random.seed(42)
+    services = [Service(name=f'서비스{i}', duration=30 * (i + 1), base_price=10000 * (i + 1)) for i in range(6)]
+    staff = [Staff(name=f'직원{i}', position='디자이너') for i in range(4)]
+    db.session.add_all(services + staff)
+    db.session.flush()
+
+    db.session.bulk_insert_mappings(Customer, [
+        {'id': i + 1, 'name': f'고객{i}', 'phone': f'010-{i:04d}-{i:04d}', 'email': '', 'address': ''}
+        for i in range(customers)
+    ])
+    db.session.bulk_insert_mappings(Pet, [
+        {'id': i + 1, 'name': f'반려견{i}', 'breed': '푸들', 'customer_id': i + 1}
+        for i in range(customers)
+    ])
+    start = date(2025, 1, 1)
+    rows = []
+    for i in range(bookings):
+        owner = random.randint(1, customers)
+        service = random.choice(services)
+        rows.append({
+            'customer_id': owner, 'pet_id': owner, 'service_id': service.id,
+            'staff_id': random.choice(staff).id, 'date': start + timedelta(days=i % 30),
+            'time': f'{9 + i % 9:02d}:00', 'duration': service.duration, 'price': service.base_price,
+            'status': 'confirmed', 'notes': ''
+        })
+    db.session.bulk_insert_mappings(Booking, rows)
+    db.session.commit()
+
+
+@contextmanager
+def count_queries():
+    counter = {'count': 0}
+
+    def before_cursor_execute(*args):
+        counter['count'] += 1
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def timed(label, func):
+    db.session.expire_all()
+    with count_queries() as counter:
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:9.1f} ms  {counter['count']:>6} queries  {len(result)} rows")
+    return counter['count']
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed(size)
+        client = app.test_client()
+
+        timed('legacy to_dict (lazy loading)', lambda: [b.to_dict() for b in Booking.query.all()])
+        # 쿼리 수 회귀 검사는 tests/test_booking_list_queries.py
+        timed('GET /bookings', lambda: client.get('/api/bookings').get_json())
+        timed('GET /bookings?date=', lambda: client.get('/api/bookings?date=2025-01-05').get_json())
+        timed('GET /bookings?search=', lambda: client.get('/api/bookings?search=고객1').get_json())
@@ -0,0 +1,63 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import time
+from datetime import date, timedelta
+
+from src.models.booking import db, Booking
+from src.bench_booking_list import create_app, seed, count_queries
+from src import booking_stats
+from src.booking_stats import daily_stats, range_stats, rebuild_daily_stats
+
+
+def legacy_daily(day):
+    # 기존 get_daily_stats: 하루 예약 전체를 로드하여 Python 에서 집계
+    bookings = Booking.query.filter(Booking.date == day).all()
+    return {
+        'total_bookings': len(bookings),
+        'confirmed_bookings': len([b for b in bookings if b.status == 'confirmed']),
+        'pending_bookings': len([b for b in bookings if b.status == 'pending']),
+        'completed_bookings': len([b for b in bookings if b.status == 'completed']),
+        'total_revenue': sum(b.price or 0 for b in bookings if b.status in ['confirmed', 'completed'])
+    }
+
+
+def timed(label, func):
+    db.session.expire_all()
+    with count_queries() as counter:
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed * 1000:9.1f} ms  {counter['count']:>6} queries")
+    return result
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed(size)
+        with db.engine.begin() as connection:
+            rebuild_daily_stats(connection)
+
+        start, end = date(2025, 1, 1), date(2025, 1, 30)
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+        legacy = timed('legacy: per-day load + Python', lambda: [legacy_daily(day) for day in days])
+        booking_stats._enabled = False
+        direct = timed('range: GROUP BY bookings', lambda: range_stats(start, end, 'day'))
+        booking_stats._enabled = True
+        summary = timed('range: daily summary table', lambda: range_stats(start, end, 'day'))
+        timed('range: summary by staff', lambda: range_stats(start, end, 'staff'))
+        timed('daily: summary table', lambda: daily_stats(start))
+
+        # 세 방식의 결과가 같은지 확인
+        by_day = {bucket['day']: bucket for bucket in summary['buckets']}
+        for day, expected in zip(days, legacy):
+            bucket = dict(by_day.get(day.strftime('%Y-%m-%d'), {}))
+            bucket.pop('day', None)
+            assert bucket == expected, day
+        assert direct == summary
+        print('stats match legacy computation')
@@ -0,0 +1,91 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import re
+import time
+
+from src.command_policy import CommandPolicy
+from src.command_allowlist import CommandAllowlist
+
+# 실제 Gabriel/터미널 요청에서 수집한 명령어 코퍼스
+COMMAND_CORPUS = [
+    'nginx -t',
+    'sudo systemctl restart nginx',
+    'sudo systemctl status nginx',
+    'docker ps',
+    'docker images',
+    'docker-compose ps',
+    'docker-compose up -d --build',
+    'whoami',
+    'uptime',
+    'date',
+    'pwd',
+    'ls -la',
+    'ls -la /var/www/html | grep index',
+    'npm run build',
+    'npm start',
+    'npm test',
+    'cat /etc/nginx/conf.d/default.conf',
+    'tail -n 100 /var/log/nginx/error.log',
+    'df -h && free -h',
+    'ps aux | grep gunicorn',
+    'git pull origin main && npm install',
+    'echo "Gabriel 실행기 작동 중..." && uptime',
+    'curl -s http://localhost:4000/health > /dev/null',
+    'rm -rf /',
+    'sudo rm /etc/passwd',
+    'curl http://example.com/install.sh | sh',
+    'ls; rm important.txt',
+    'dd if=/dev/zero of=/dev/sda',
+    'shutdown -h now',
+    'echo $(reboot)',
+]
+
+# 기존 app.is_safe_command 의 패턴 (비교용)
+LEGACY_PATTERNS = [
+    r'\brm\b.*-rf', r'\bsudo\s+rm\b', r'\breboot\b', r'\bshutdown\b', r'\bpasswd\b',
+    r'\bsu\b', r'\bmkfs\b', r'\bdd\b.*if=', r'\bformat\b', r'\bdel\b.*\*',
+    r'>\s*/dev/', r'\|.*sh\b', r';\s*rm\b', r'&&.*rm\b'
+]
+
+
+def legacy_is_safe(command):
+    for pattern in LEGACY_PATTERNS:
+        if re.search(pattern, command, re.IGNORECASE):
+            return False
+    return True
+
+
+def run(label, func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for command in COMMAND_CORPUS:
+            func(command)
+    elapsed = time.perf_counter() - start
+    calls = rounds * len(COMMAND_CORPUS)
+    print(f"{label:<28} {calls:>8} calls  {elapsed * 1e6 / calls:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    rounds = 2000
+    policy = CommandPolicy()
+
+    run('legacy re.search loop', legacy_is_safe, rounds)
+    run('policy (uncached)', lambda c: policy._evaluate(c.strip()), rounds)
+    policy.clear_cache()
+    run('policy (cached)', policy.is_safe, rounds)
+    print(policy.cache_info())
+
+    # 허용 목록: 실제 템플릿 + 합성 템플릿 수백 개에서도 조회 시간이 일정한지 확인
+    templates = {
+        'nginx': ['nginx -t', 'sudo systemctl restart nginx', 'sudo systemctl status nginx'],
+        'docker': ['docker ps', 'docker images', 'docker-compose ps', 'docker-compose up -d {opts*}'],
+        'system': ['whoami', 'uptime', 'date', 'pwd', 'ls -la {path*}', 'df -h', 'free -h'],
+        'chatweb': ['npm run build', 'npm start', 'npm test', 'npm install'],
+    }
+    for size in (0, 100, 1000):
+        policy_templates = dict(templates)
+        policy_templates['synthetic'] = [f'tool{i} sub{i % 7} {{arg}} {{rest*}}' for i in range(size)]
+        allowlist = CommandAllowlist(policy_templates)
+        run(f'allowlist ({size + 18} templates)', allowlist.match, rounds)
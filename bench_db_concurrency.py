@@ -0,0 +1,148 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import json
+import time
+import random
+import argparse
+import tempfile
+import threading
+from urllib.parse import urlencode
+
+from flask import Flask
+
+from src.models.booking import db
+from src.routes.booking import booking_bp
+from src.migrations import upgrade
+from src.booking_stats import init_daily_stats
+from src.booking_changes import init_change_feed
+from src.booking_search import init_search_index
+from src.reference_cache import reference_cache
+from src.availability import availability_index
+from src.response_cache import response_cache
+from src.sample_data import seed_bulk
+from src.db_config import SqliteSettings, install_sqlite_settings
+from src.bench_booking_api import QueryCounter, TestClientTransport, discover, write_scenarios, percentile
+
+# 동시 읽기/쓰기 스트레스 테스트
+#
+#   python bench_db_concurrency.py --readers 8 --writers 4 --seconds 10
+#
+# legacy: 기존 main.py 설정 (rollback journal, 드라이버 기본 트랜잭션)
+# tuned : db_config 설정 (WAL, synchronous=NORMAL, busy_timeout, 쓰기 요청 BEGIN IMMEDIATE)
+# 두 모드에서 같은 부하를 걸어 읽기 지연과 "database is locked" 오류 수를 비교한다.
+
+MODES = ('legacy', 'tuned')
+
+
+def create_app(path, mode):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    app.register_blueprint(booking_bp, url_prefix='/api')
+    with app.app_context():
+        if mode == 'tuned':
+            install_sqlite_settings(db.engine, SqliteSettings.from_env())
+        upgrade()
+        init_daily_stats()
+        init_change_feed()
+        init_search_index()
+    reference_cache.invalidate()
+    availability_index.invalidate()
+    response_cache.clear()
+    return app
+
+
+def worker(app, counter, make_request, stop, samples):
+    transport = TestClientTransport(app, counter)
+    while not stop.is_set():
+        method, path, body = make_request()
+        start = time.perf_counter()
+        status, result, _ = transport.request(method, path, body)
+        error = (result or {}).get('error', '') if isinstance(result, dict) and status >= 500 else ''
+        samples.append(((time.perf_counter() - start) * 1000, status, 'locked' in error))
+
+
+def summarize(samples, seconds):
+    latencies = sorted(sample[0] for sample in samples)
+    return {
+        'requests': len(samples),
+        'throughput_rps': round(len(samples) / seconds, 1),
+        'p50_ms': round(percentile(latencies, 0.50) or 0, 2),
+        'p95_ms': round(percentile(latencies, 0.95) or 0, 2),
+        'p99_ms': round(percentile(latencies, 0.99) or 0, 2),
+        'max_ms': round(latencies[-1], 2) if latencies else 0,
+        'errors': sum(1 for _, status, _ in samples if status >= 500),
+        'locked_errors': sum(1 for _, _, locked in samples if locked),
+    }
+
+
+def run_mode(mode, args):
+    path = os.path.join(tempfile.mkdtemp(prefix='booking_concurrency_'), f'{mode}.db')
+    app = create_app(path, mode)
+    with app.app_context():
+        seed_bulk(customers=max(args.bookings // 5, 1), bookings=args.bookings, seed=args.seed)
+        counter = QueryCounter(db.engine)
+        params = discover(TestClientTransport(app, counter), random.Random(args.seed))
+        journal = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+        db.session.remove()
+
+    rng = random.Random(args.seed)
+    create, update, _ = [make for _, make in write_scenarios(params, rng)]
+
+    def read():
+        if rng.random() < 0.5:
+            return 'GET', '/api/stats/daily?' + urlencode({'date': rng.choice(params['dates'])}), None
+        return 'GET', '/api/bookings?' + urlencode({'date': rng.choice(params['dates']), 'limit': 50}), None
+
+    def write():
+        return create() if rng.random() < 0.5 else update()
+
+    stop = threading.Event()
+    reads, writes = [], []
+    threads = [threading.Thread(target=worker, args=(app, counter, read, stop, reads)) for _ in range(args.readers)]
+    threads += [threading.Thread(target=worker, args=(app, counter, write, stop, writes)) for _ in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    counter.close()
+    with app.app_context():
+        db.engine.dispose()
+
+    result = {'mode': mode, 'journal_mode': journal, 'reads': summarize(reads, args.seconds),
+              'writes': summarize(writes, args.seconds)}
+    for kind in ('reads', 'writes'):
+        item = result[kind]
+        print(f"{mode:<7} {journal:<7} {kind:<6} {item['throughput_rps']:8.1f} req/s  p50 {item['p50_ms']:8.2f}  "
+              f"p95 {item['p95_ms']:8.2f}  p99 {item['p99_ms']:8.2f}  max {item['max_ms']:9.2f} ms  "
+              f"{item['errors']} errors ({item['locked_errors']} locked)")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='SQLite 동시 읽기/쓰기 스트레스 테스트')
+    parser.add_argument('--mode', choices=MODES + ('both',), default='both')
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--bookings', type=int, default=20000, help='시드 예약 수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='결과 JSON 파일 경로')
+    args = parser.parse_args()
+
+    results = [run_mode(mode, args) for mode in (MODES if args.mode == 'both' else (args.mode,))]
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    # WAL 모드에서는 쓰기 중에도 읽기가 잠금 오류 없이 처리되어야 함
+    tuned = next((result for result in results if result['mode'] == 'tuned'), None)
+    if tuned:
+        assert tuned['reads']['locked_errors'] == 0, '읽기 요청이 쓰기 잠금에 막혔습니다'
+        assert tuned['writes']['locked_errors'] == 0, '쓰기 요청이 database is locked 로 실패했습니다'
+        print('concurrency check passed')
@@ -0,0 +1,71 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import re
+import time
+
+from src import korean_command
+
+# 프론트 데스크/운영자가 실제로 입력하는 형태의 문장 코퍼스
+PHRASE_CORPUS = [
+    'AIIN, nginx 재시작해줘',
+    'aiin nginx 상태 확인해주세요',
+    '엔진엑스 다시 시작해 주세요',
+    '웹 서버 설정 검사해줘',
+    '도커 컨테이너 목록 보여줘',
+    '도커 이미지 좀 보여줘',
+    '컴포즈 상태 확인',
+    '챗웹 빌드해줘',
+    '프론트엔드 테스트 실행해줘',
+    '프로젝트 시작해',
+    '디스크 용량 확인해 주세요',
+    '메모리 확인해줘',
+    '현재 위치 알려줘',
+    '파일 목록 보여줘',
+    '가동시간 알려줘',
+    '시스템 상태 확인 부탁드립니다',
+    '사용자 확인',
+    '프로세스 목록 조회',
+    'AIIN, echo hello 해줘',
+    'ls -la',
+]
+
+# 기존 app.parse_korean_command 구현 (비교용)
+LEGACY_MAPPINGS = {
+    '재시작': 'restart', '상태': 'status', '확인': 'check', '빌드': 'build', '실행': 'run',
+    '중지': 'stop', '시작': 'start', '목록': 'list', '정보': 'info'
+}
+
+
+def legacy_parse(command):
+    if 'aiin' in command.lower():
+        command = re.sub(r'aiin,?\s*', '', command, flags=re.IGNORECASE)
+        command = re.sub(r'해줘|하세요|해주세요', '', command)
+        for korean, english in LEGACY_MAPPINGS.items():
+            command = command.replace(korean, english)
+    return command.strip()
+
+
+def run(label, func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for phrase in PHRASE_CORPUS:
+            func(phrase)
+    elapsed = time.perf_counter() - start
+    calls = rounds * len(PHRASE_CORPUS)
+    print(f"{label:<24} {calls / elapsed:>12,.0f} phrases/s  {elapsed * 1e6 / calls:8.2f} us/phrase")
+
+
+if __name__ == "__main__":
+    rounds = 2000
+
+    for phrase in PHRASE_CORPUS:
+        print(f"{phrase:<32} -> {korean_command.translate(phrase).command}")
+    print()
+
+    run('legacy str.replace', legacy_parse, rounds)
+    run('translator (uncached)', korean_command.translate.__wrapped__, rounds)
+    korean_command.translate.cache_clear()
+    run('translator (cached)', korean_command.parse_korean_command, rounds)
+    print(korean_command.cache_info())
@@ -1,11 +1,74 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, make_response, stream_with_context
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, date
-from src.models.booking import db, Booking, Customer, Pet, Service, Staff
-import json
+from src.models.booking import db, Booking, Customer, Pet
+from src.booking_queries import (
+    BOOKING_FIELDS, BOOKING_ORDER, CUSTOMER_FIELDS, CUSTOMER_ORDER,
+    booking_list_query, customer_list_query, parse_fields, with_order_keys,
+    parse_limit, paginate, count_rows, serialize_rows
+)
+from src.booking_search import search_enabled, search_filter
+from src.reference_cache import reference_cache
+from src.availability import availability_index, INACTIVE_STATUSES
+from src.booking_stats import daily_stats, range_stats
+from src.booking_import import DEFAULT_CHUNK_SIZE, detect_format, read_rows, read_text, import_bookings
+from src.response_cache import cached_response
+from src.booking_changes import change_feed_enabled, changes_since, stream_events, DEFAULT_LIMIT as CHANGES_LIMIT
+from src.booking_guard import VersionConflict, requested_version, claim_version, is_overlap_error
+from src.customer_keys import normalize_phone, upsert_customer, upsert_pet, duplicate_key_field
+from src.booking_series import BookingSeries, series_id_column, series_enabled, create_series, cancel_series
+import io
+import os
 
 booking_bp = Blueprint('booking', __name__)
 
+def paginated_response(query, order, fields):
+    """키셋 페이지 응답 생성 (include_total=true 이면 전체 건수를 별도 쿼리로 계산)"""
+    limit = parse_limit(request.args.get('limit'))
+    rows, next_cursor = paginate(query, order, limit, request.args.get('cursor'))
+    result = {
+        'items': serialize_rows(rows, fields),
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None,
+        'limit': limit
+    }
+    if request.args.get('include_total', '').lower() in ('1', 'true', 'yes'):
+        result['total'] = count_rows(query)
+    return result
+
+def cached_reference_response(body, etag):
+    """캐시된 목록 응답 (If-None-Match 가 ETag 와 같으면 304)"""
+    response = make_response(body)
+    response.mimetype = 'application/json'
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def booking_response(booking, status=200):
+    """예약 응답 (본문 version 과 ETag 로 다음 수정 요청의 If-Match 값 전달)"""
+    result = booking.to_dict()
+    result['version'] = booking.version
+    response = make_response(jsonify(result), status)
+    response.set_etag(str(booking.version))
+    return response
+
+def overlap_error(service, staff, booking_date, booking_time, duration, exclude_id=None):
+    """DB 중복 방지 트리거가 거부한 예약의 409 응답 (롤백 후 충돌 예약을 다시 조회)"""
+    conflict_id = availability_index.find_conflict(staff.id, booking_date, booking_time, duration, exclude_id)
+    return conflict_error(service, staff, booking_date, booking_time, conflict_id)
+
+def conflict_error(service, staff, booking_date, booking_time, conflict_id):
+    """예약 충돌 응답 (같은 직원의 가장 빠른 빈 시간 3개를 함께 제안)"""
+    start = datetime.combine(booking_date, datetime.strptime(booking_time, '%H:%M').time())
+    suggestions = availability_index.free_slots(service, start, count=3, staff=staff) if service and staff else []
+    return {
+        'error': 'Time slot not available',
+        'conflict_booking_id': conflict_id,
+        'suggestions': [slot.to_dict() for slot in suggestions]
+    }
+
 @booking_bp.route('/bookings', methods=['GET'])
+@cached_response('bookings')
 def get_bookings():
     """예약 목록 조회"""
     try:
@@ -15,7 +78,10 @@ def get_bookings():
         service_param = request.args.get('service')
         search_param = request.args.get('search')
         
-        query = Booking.query
+        fields = parse_fields(request.args.get('fields'), BOOKING_FIELDS)
+        
+        # 관계 테이블을 함께 조인한 단일 SELECT (N+1 지연 로딩 방지)
+        query = booking_list_query(with_order_keys(fields, BOOKING_ORDER))
         
         # 날짜 필터
         if date_param:
@@ -27,27 +93,35 @@ def get_bookings():
         
         # 직원 필터
         if staff_param and staff_param != 'all':
-            staff = Staff.query.filter_by(name=staff_param).first()
+            staff = reference_cache.staff(staff_param)
             if staff:
                 query = query.filter(Booking.staff_id == staff.id)
         
         # 서비스 필터
         if service_param and service_param != 'all':
-            service = Service.query.filter_by(name=service_param).first()
+            service = reference_cache.service(service_param)
             if service:
                 query = query.filter(Booking.service_id == service.id)
         
-        # 검색 필터 (고객명 또는 반려동물명)
+        # 검색 필터 (고객명/전화번호 또는 반려동물명/품종) - FTS5 인덱스가 없으면 LIKE 검색
         if search_param:
-            query = query.join(Customer).join(Pet, Booking.pet_id == Pet.id, isouter=True).filter(
-                db.or_(
+            condition = search_filter(search_param) if search_enabled() else None
+            if condition is None:
+                condition = db.or_(
                     Customer.name.contains(search_param),
                     Pet.name.contains(search_param)
                 )
-            )
+            query = query.filter(condition)
+        
+        # limit/cursor 가 있으면 (date, time, id) 키셋 페이지네이션
+        if 'limit' in request.args or 'cursor' in request.args:
+            return jsonify(paginated_response(query, BOOKING_ORDER, fields))
         
-        bookings = query.order_by(Booking.date, Booking.time).all()
-        return jsonify([booking.to_dict() for booking in bookings])
+        rows = query.order_by(Booking.date, Booking.time, Booking.id).all()
+        return jsonify(serialize_rows(rows, fields))
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -64,42 +138,39 @@ def create_booking():
             if field not in data or not data[field]:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
         
-        # 고객 찾기 또는 생성
-        customer = Customer.query.filter_by(phone=data['customerPhone']).first()
-        if not customer:
-            customer = Customer(
-                name=data['customerName'],
-                phone=data['customerPhone'],
-                email=data.get('customerEmail', ''),
-                address=data.get('customerAddress', '')
-            )
-            db.session.add(customer)
-            db.session.flush()  # ID 생성을 위해
-        
-        # 반려동물 찾기 또는 생성
-        pet = Pet.query.filter_by(name=data['petName'], customer_id=customer.id).first()
-        if not pet:
-            pet = Pet(
-                name=data['petName'],
-                breed=data.get('petBreed', ''),
-                customer_id=customer.id,
-                notes=data.get('petNotes', '')
-            )
-            db.session.add(pet)
-            db.session.flush()
-        
-        # 서비스 찾기
-        service = Service.query.filter_by(name=data['serviceType']).first()
+        # 서비스 찾기 (기준 데이터 캐시)
+        service = reference_cache.service(data['serviceType'])
         if not service:
             return jsonify({'error': f'Service not found: {data["serviceType"]}'}), 400
         
-        # 직원 찾기
-        staff = Staff.query.filter_by(name=data['staff']).first()
+        # 직원 찾기 (기준 데이터 캐시)
+        staff = reference_cache.staff(data['staff'])
         if not staff:
             return jsonify({'error': f'Staff not found: {data["staff"]}'}), 400
         
-        # 예약 생성
+        # 같은 직원의 겹치는 예약 확인
         booking_date = datetime.strptime(data['date'], '%Y-%m-%d').date()
+        conflict_id = availability_index.find_conflict(staff.id, booking_date, data['time'], service.duration)
+        if conflict_id:
+            return jsonify(conflict_error(service, staff, booking_date, data['time'], conflict_id)), 409
+        
+        # 고객 찾기 또는 생성 (정규화한 전화번호 키로 INSERT ... ON CONFLICT 한 번)
+        customer = upsert_customer(
+            data['customerName'],
+            data['customerPhone'],
+            email=data.get('customerEmail', ''),
+            address=data.get('customerAddress', '')
+        )
+        
+        # 반려동물 찾기 또는 생성 (고객별 이름으로 INSERT ... ON CONFLICT 한 번)
+        pet = upsert_pet(
+            customer.id,
+            data['petName'],
+            breed=data.get('petBreed', ''),
+            notes=data.get('petNotes', '')
+        )
+        
+        # 예약 생성
         booking = Booking(
             customer_id=customer.id,
             pet_id=pet.id,
@@ -116,23 +187,218 @@ def create_booking():
         db.session.add(booking)
         db.session.commit()
         
-        return jsonify(booking.to_dict()), 201
+        return booking_response(booking, 201)
+        
+    except IntegrityError as e:
+        db.session.rollback()
+        # 검사 이후 다른 요청이 같은 시간을 먼저 예약한 경우 (DB 트리거가 거부)
+        if is_overlap_error(e):
+            return jsonify(overlap_error(service, staff, booking_date, data['time'], service.duration)), 409
+        return jsonify({'error': str(e)}), 500
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@booking_bp.route('/bookings/bulk', methods=['POST'])
+def bulk_import_bookings():
+    """예약 일괄 가져오기 (CSV/JSONL 파일 업로드 또는 본문, JSON 배열)"""
+    try:
+        chunk_size = int(request.args.get('chunk_size', DEFAULT_CHUNK_SIZE))
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive')
+        allow_conflicts = request.args.get('allow_conflicts', '').lower() in ('1', 'true', 'yes')
+        
+        upload = request.files.get('file')
+        if upload:
+            fmt = request.args.get('format') or detect_format(upload.filename, upload.mimetype)
+            rows = read_rows(io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline=''), fmt)
+        elif request.is_json:
+            records = request.get_json()
+            if not isinstance(records, list):
+                raise ValueError('JSON body must be an array of bookings')
+            rows = ((index, record if isinstance(record, dict) else {'_error': 'row must be a JSON object'})
+                    for index, record in enumerate(records, 1))
+        else:
+            fmt = request.args.get('format') or detect_format(content_type=request.mimetype)
+            rows = read_text(request.get_data(as_text=True).lstrip('\ufeff'), fmt)
+        
+        return jsonify(import_bookings(rows, chunk_size, allow_conflicts))
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def series_response(series, status=200, materialized=None):
+    """반복 예약 응답 (생성된 회차 예약 목록 포함)"""
+    result = series.to_dict()
+    rows = booking_list_query().filter(series_id_column == series.id) \
+        .order_by(Booking.date, Booking.time, Booking.id).all()
+    result['bookings'] = serialize_rows(rows)
+    if materialized is not None:
+        result['materialized'] = materialized
+    return jsonify(result), status
+
+@booking_bp.route('/bookings/series', methods=['POST'])
+def create_booking_series():
+    """반복 예약 생성 (intervalWeeks 주마다, occurrences 회 또는 endDate 까지)
+
+    규칙은 한 번만 저장하고 horizon 안의 회차만 한 번의 일정 조회 + 일괄 INSERT 로 만든다.
+    겹치는 회차는 건너뛰고 skipped 에 날짜와 사유를 기록한다.
+    """
+    try:
+        if not series_enabled():
+            return jsonify({'error': 'Recurring bookings are not available (run migrations)'}), 503
+        data = request.get_json()
+        
+        # intervalWeeks/occurrences/endDate 는 create_series 에서 검증
+        required_fields = ['customerName', 'customerPhone', 'petName', 'serviceType', 'date', 'time', 'staff']
+        for field in required_fields:
+            if field not in data or not data[field]:
+                return jsonify({'error': f'Missing required field: {field}'}), 400
+        
+        service = reference_cache.service(data['serviceType'])
+        if not service:
+            return jsonify({'error': f'Service not found: {data["serviceType"]}'}), 400
+        staff = reference_cache.staff(data['staff'])
+        if not staff:
+            return jsonify({'error': f'Staff not found: {data["staff"]}'}), 400
+        
+        customer = upsert_customer(
+            data['customerName'],
+            data['customerPhone'],
+            email=data.get('customerEmail', ''),
+            address=data.get('customerAddress', '')
+        )
+        pet = upsert_pet(
+            customer.id,
+            data['petName'],
+            breed=data.get('petBreed', ''),
+            notes=data.get('petNotes', '')
+        )
+        
+        series, materialized = create_series(customer.id, pet.id, service, staff, data)
+        return series_response(series, 201, materialized)
+        
+    except IntegrityError as e:
+        db.session.rollback()
+        # 일정 확인 이후 다른 요청이 같은 시간을 먼저 예약한 경우 (DB 트리거가 거부)
+        if is_overlap_error(e):
+            return jsonify({'error': 'Time slot not available, please retry'}), 409
+        return jsonify({'error': str(e)}), 500
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@booking_bp.route('/bookings/series/<int:series_id>', methods=['GET'])
+def get_booking_series(series_id):
+    """반복 예약 규칙과 생성된 회차 예약 조회"""
+    series = BookingSeries.query.get_or_404(series_id)
+    try:
+        return series_response(series)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@booking_bp.route('/bookings/series/<int:series_id>', methods=['DELETE'])
+def cancel_booking_series(series_id):
+    """반복 예약 종료 - from(기본 오늘) 이후 회차 예약 취소"""
+    series = BookingSeries.query.get_or_404(series_id)
+    try:
+        from_param = request.args.get('from')
+        from_date = datetime.strptime(from_param, '%Y-%m-%d').date() if from_param else date.today()
+        cancelled = cancel_series(series, from_date)
+        return jsonify({'message': 'Booking series cancelled', 'cancelled_bookings': cancelled,
+                        'series': series.to_dict()})
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+def parse_change_cursor(value):
+    if value in (None, ''):
+        return None
+    try:
+        cursor = int(value)
+    except ValueError:
+        raise ValueError('since must be an integer cursor')
+    if cursor < 0:
+        raise ValueError('since must not be negative')
+    return cursor
+
+@booking_bp.route('/bookings/changes', methods=['GET'])
+def get_booking_changes():
+    """예약 변경 피드 (since 커서 이후 생성/수정/삭제 이벤트)"""
+    try:
+        if not change_feed_enabled():
+            return jsonify({'error': 'Booking change feed is not available'}), 503
+        since = parse_change_cursor(request.args.get('since'))
+        limit = int(request.args.get('limit', CHANGES_LIMIT))
+        return jsonify(changes_since(since, limit))
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@booking_bp.route('/bookings/changes/stream', methods=['GET'])
+def stream_booking_changes():
+    """예약 변경 스트림 (Server-Sent Events, 재연결 시 Last-Event-ID 부터 이어서 전송)"""
+    try:
+        if not change_feed_enabled():
+            return jsonify({'error': 'Booking change feed is not available'}), 503
+        since = parse_change_cursor(request.args.get('since') or request.headers.get('Last-Event-ID'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    events = stream_events(
+        since,
+        poll_interval=float(os.environ.get('BOOKING_CHANGES_POLL_SECONDS', 2)),
+        heartbeat=float(os.environ.get('BOOKING_CHANGES_HEARTBEAT_SECONDS', 15)),
+        max_seconds=float(os.environ.get('BOOKING_CHANGES_STREAM_SECONDS', 300))
+    )
+    return Response(stream_with_context(events), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @booking_bp.route('/bookings/<int:booking_id>', methods=['PUT'])
 def update_booking(booking_id):
     """예약 수정"""
+    attempted = None
     try:
         booking = Booking.query.get_or_404(booking_id)
         data = request.get_json()
         
+        # 클라이언트가 읽은 버전과 다르면 수정하지 않음 (If-Match 헤더 또는 version 필드)
+        expected = requested_version(data, request.headers)
+        if expected is not None and expected != booking.version:
+            raise VersionConflict(booking.id, expected, booking.version)
+        # 읽은 이후 다른 요청이 커밋했으면 409 (version compare-and-swap)
+        # 변경 내용보다 먼저 실행하여 flush 되는 행/변경 이벤트에 새 버전이 함께 기록되도록 함
+        claim_version(booking, expected)
+        
         # 고객 정보 업데이트
         if 'customerName' in data:
             booking.customer.name = data['customerName']
         if 'customerPhone' in data:
+            normalize_phone(data['customerPhone'])  # 잘못된 번호는 400
             booking.customer.phone = data['customerPhone']
         
         # 반려동물 정보 업데이트
@@ -147,13 +413,13 @@ def update_booking(booking_id):
         if 'time' in data:
             booking.time = data['time']
         if 'serviceType' in data:
-            service = Service.query.filter_by(name=data['serviceType']).first()
+            service = reference_cache.service(data['serviceType'])
             if service:
                 booking.service_id = service.id
                 booking.duration = service.duration
                 booking.price = service.base_price
         if 'staff' in data:
-            staff = Staff.query.filter_by(name=data['staff']).first()
+            staff = reference_cache.staff(data['staff'])
             if staff:
                 booking.staff_id = staff.id
         if 'notes' in data:
@@ -161,10 +427,50 @@ def update_booking(booking_id):
         if 'status' in data:
             booking.status = data['status']
         
+        # 트리거가 거부하면 롤백으로 값이 되돌아가므로 409 응답용으로 요청한 일정을 보관
+        attempted = (booking.staff_id, booking.service_id, booking.date, booking.time, booking.duration)
+        
+        # 일정이 바뀌면 같은 직원의 겹치는 예약 확인 (자기 자신 제외)
+        schedule_fields = ('date', 'time', 'serviceType', 'staff', 'status')
+        if any(field in data for field in schedule_fields) and booking.status not in INACTIVE_STATUSES:
+            service = reference_cache.service_by_id(booking.service_id)
+            duration = booking.duration or (service.duration if service else None)
+            conflict_id = availability_index.find_conflict(
+                booking.staff_id, booking.date, booking.time, duration, exclude_id=booking.id
+            )
+            if conflict_id:
+                # 롤백 후에는 booking 이 이전 일정으로 되돌아가므로 요청한 일정(attempted)으로 응답
+                staff_id, _, booking_date, booking_time, _ = attempted
+                db.session.rollback()
+                staff = reference_cache.staff_by_id(staff_id)
+                return jsonify(conflict_error(service, staff, booking_date, booking_time, conflict_id)), 409
+        
         booking.updated_at = datetime.utcnow()
         db.session.commit()
         
-        return jsonify(booking.to_dict())
+        return booking_response(booking)
+        
+    except VersionConflict as e:
+        db.session.rollback()
+        return jsonify({'error': str(e), 'current_version': e.current}), 409
+        
+    except IntegrityError as e:
+        db.session.rollback()
+        if is_overlap_error(e) and attempted:
+            staff_id, service_id, booking_date, booking_time, duration = attempted
+            staff = reference_cache.staff_by_id(staff_id)
+            service = reference_cache.service_by_id(service_id)
+            duration = duration or (service.duration if service else None)
+            return jsonify(overlap_error(service, staff, booking_date, booking_time, duration, booking_id)), 409
+        # 바꾼 전화번호/반려동물 이름이 다른 고객/반려동물과 같음
+        field = duplicate_key_field(e)
+        if field:
+            return jsonify({'error': f'{field} already belongs to another record', 'field': field}), 409
+        return jsonify({'error': str(e)}), 500
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         db.session.rollback()
@@ -185,11 +491,26 @@ def delete_booking(booking_id):
         return jsonify({'error': str(e)}), 500
 
 @booking_bp.route('/customers', methods=['GET'])
+@cached_response('customers')
 def get_customers():
     """고객 목록 조회"""
     try:
-        customers = Customer.query.order_by(Customer.name).all()
-        return jsonify([customer.to_dict() for customer in customers])
+        fields = parse_fields(request.args.get('fields'), CUSTOMER_FIELDS)
+        paged = 'limit' in request.args or 'cursor' in request.args
+        
+        if not fields and not paged:
+            customers = Customer.query.order_by(Customer.name).all()
+            return jsonify([customer.to_dict() for customer in customers])
+        
+        # projection 조회 + (name, id) 키셋 페이지네이션
+        query = customer_list_query(with_order_keys(fields, CUSTOMER_ORDER))
+        if paged:
+            return jsonify(paginated_response(query, CUSTOMER_ORDER, fields))
+        
+        rows = query.order_by(Customer.name, Customer.id).all()
+        return jsonify(serialize_rows(rows, fields))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -197,8 +518,8 @@ def get_customers():
 def get_services():
     """서비스 목록 조회"""
     try:
-        services = Service.query.filter_by(is_active=True).order_by(Service.name).all()
-        return jsonify([service.to_dict() for service in services])
+        snapshot = reference_cache.snapshot()
+        return cached_reference_response(snapshot.services_body, snapshot.services_etag)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -206,35 +527,90 @@ def get_services():
 def get_staff():
     """직원 목록 조회"""
     try:
-        staff_list = Staff.query.filter_by(is_active=True).order_by(Staff.name).all()
-        return jsonify([staff.to_dict() for staff in staff_list])
+        snapshot = reference_cache.snapshot()
+        return cached_reference_response(snapshot.staff_body, snapshot.staff_etag)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@booking_bp.route('/availability', methods=['GET'])
+def get_availability():
+    """서비스 가능한 빈 시간 조회 (time + staff 를 지정하면 해당 시간 예약 가능 여부도 확인)"""
+    try:
+        service_param = request.args.get('service')
+        if not service_param:
+            return jsonify({'error': 'Missing required parameter: service'}), 400
+        service = reference_cache.service(service_param)
+        if not service:
+            return jsonify({'error': f'Service not found: {service_param}'}), 400
+        
+        staff = None
+        staff_param = request.args.get('staff')
+        if staff_param and staff_param != 'all':
+            staff = reference_cache.staff(staff_param)
+            if not staff:
+                return jsonify({'error': f'Staff not found: {staff_param}'}), 400
+        
+        # 시작 시점: 지정한 날짜/시간, 오늘이면 현재 시각 이후
+        now = datetime.now()
+        date_param = request.args.get('date')
+        time_param = request.args.get('time')
+        start_date = datetime.strptime(date_param, '%Y-%m-%d').date() if date_param else now.date()
+        start = datetime.combine(start_date, datetime.strptime(time_param or '00:00', '%H:%M').time())
+        start = max(start, now.replace(second=0, microsecond=0))
+        
+        count = min(int(request.args.get('count', 5)), 50)
+        days = int(request.args.get('days', 14))
+        if count < 1 or days < 1:
+            raise ValueError('count and days must be positive')
+        
+        result = {
+            'service': service.name,
+            'duration': service.duration,
+            'slots': [slot.to_dict() for slot in availability_index.free_slots(service, start, count, staff, days)]
+        }
+        if time_param and staff and date_param:
+            conflict_id = availability_index.find_conflict(staff.id, start_date, time_param, service.duration)
+            result['available'] = conflict_id is None
+            result['conflict_booking_id'] = conflict_id
+        return jsonify(result)
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+        
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @booking_bp.route('/stats/daily', methods=['GET'])
+@cached_response('stats')
 def get_daily_stats():
     """일일 통계 조회"""
     try:
         date_param = request.args.get('date', datetime.now().strftime('%Y-%m-%d'))
         filter_date = datetime.strptime(date_param, '%Y-%m-%d').date()
         
-        bookings = Booking.query.filter(Booking.date == filter_date).all()
+        # 예약 통계 요약 테이블에서 상태별 건수/매출 집계
+        result = {'date': date_param}
+        result.update(daily_stats(filter_date))
+        return jsonify(result)
         
-        total_bookings = len(bookings)
-        confirmed_bookings = len([b for b in bookings if b.status == 'confirmed'])
-        pending_bookings = len([b for b in bookings if b.status == 'pending'])
-        completed_bookings = len([b for b in bookings if b.status == 'completed'])
-        total_revenue = sum(booking.price or 0 for booking in bookings if booking.status in ['confirmed', 'completed'])
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@booking_bp.route('/stats/range', methods=['GET'])
+@cached_response('stats')
+def get_range_stats():
+    """기간 통계 조회 (group_by=day|week|month|staff|service)"""
+    try:
+        today = datetime.now().date()
+        end_param = request.args.get('end')
+        start_param = request.args.get('start')
+        end = datetime.strptime(end_param, '%Y-%m-%d').date() if end_param else today
+        start = datetime.strptime(start_param, '%Y-%m-%d').date() if start_param else end.replace(day=1)
+        
+        return jsonify(range_stats(start, end, request.args.get('group_by', 'day')))
         
-        return jsonify({
-            'date': date_param,
-            'total_bookings': total_bookings,
-            'confirmed_bookings': confirmed_bookings,
-            'pending_bookings': pending_bookings,
-            'completed_bookings': completed_bookings,
-            'total_revenue': total_revenue
-        })
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-
@@ -0,0 +1,222 @@
+import os
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from src.models.booking import db, Booking
+from src.booking_queries import booking_list_query, serialize_rows
+from src.lifecycle import shutting_down
+
+logger = logging.getLogger(__name__)
+
+# 세션에 모아 두는 변경 예약 [(op, booking_id), ...] 과 커밋 알림 플래그
+PENDING_KEY = 'booking_changes_pending'
+WRITTEN_KEY = 'booking_changes_written'
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+RETENTION_DAYS = int(os.environ.get('BOOKING_CHANGES_RETENTION_DAYS', 7))
+
+_enabled = False
+# 같은 프로세스에서 커밋된 변경을 SSE 스트림에 바로 알림 (다른 워커의 변경은 주기적 조회로 반영)
+_committed = threading.Condition()
+
+
+class BookingChange(db.Model):
+    """예약 변경 이벤트 로그 (추가만 함, id 가 변경 피드 커서)
+
+    op 는 created/updated/deleted, 또는 bulk 적재 후의 reload (목록 전체 재조회).
+    data 는 GET /bookings 목록 항목과 같은 형식의 변경 후 예약 (삭제/reload 는 없음).
+    """
+    __tablename__ = 'booking_changes'
+    # 행을 지워도 id 를 재사용하지 않음 (클라이언트 커서가 다른 이벤트를 가리키지 않도록)
+    __table_args__ = {'sqlite_autoincrement': True}
+
+    id = db.Column(db.Integer, primary_key=True)
+    booking_id = db.Column(db.Integer)
+    op = db.Column(db.String(10), nullable=False)
+    version = db.Column(db.Integer)
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    data = db.Column(db.Text)
+
+    def to_dict(self) -> Dict:
+        return {
+            'cursor': self.id,
+            'op': self.op,
+            'booking_id': self.booking_id,
+            'version': self.version,
+            'changed_at': self.changed_at.isoformat() if self.changed_at else None,
+            'booking': json.loads(self.data) if self.data else None,
+        }
+
+
+changes_table = BookingChange.__table__
+
+
+def init_change_feed() -> bool:
+    """변경 로그 테이블이 있으면 예약 변경 시 이벤트 기록"""
+    global _enabled
+    _enabled = inspect(db.engine).has_table(BookingChange.__tablename__)
+    if not _enabled:
+        logger.warning("booking_changes table missing, booking change feed is disabled")
+    return _enabled
+
+
+@event.listens_for(Booking, 'after_insert')
+def _booking_inserted(mapper, connection, booking):
+    _remember(booking, 'created')
+
+
+@event.listens_for(Booking, 'after_update')
+def _booking_updated(mapper, connection, booking):
+    _remember(booking, 'updated')
+
+
+@event.listens_for(Booking, 'after_delete')
+def _booking_deleted(mapper, connection, booking):
+    _remember(booking, 'deleted')
+
+
+def _remember(booking, op: str):
+    session = object_session(booking)
+    if _enabled and session is not None:
+        session.info.setdefault(PENDING_KEY, []).append((op, booking.id, getattr(booking, 'version', None)))
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _write_changes(session, flush_context):
+    """flush 직후 같은 트랜잭션에서 변경 이벤트 INSERT (예약 행은 목록 API 와 같은 한 번의 SELECT 로 직렬화)"""
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    ids = {booking_id for op, booking_id, _ in pending if op != 'deleted'}
+    rows = {}
+    if ids:
+        with session.no_autoflush:
+            rows_found = booking_list_query().filter(Booking.id.in_(ids)).all()
+        for row in serialize_rows(rows_found):
+            rows[row['id']] = json.dumps(row, ensure_ascii=False)
+    now = datetime.utcnow()
+    session.execute(changes_table.insert(), [
+        {'booking_id': booking_id, 'op': op, 'version': version, 'changed_at': now,
+         'data': rows.get(booking_id) if op != 'deleted' else None}
+        for op, booking_id, version in pending
+    ])
+    session.info[WRITTEN_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _notify_on_commit(session):
+    if session.info.pop(WRITTEN_KEY, False):
+        with _committed:
+            _committed.notify_all()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session):
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(WRITTEN_KEY, None)
+
+
+def record_reload(connection, force: bool = False):
+    """core bulk INSERT/DELETE 처럼 행 단위 이벤트가 없는 변경 - 클라이언트는 목록을 다시 받아야 함
+
+    force: 피드 초기화 전(마이그레이션)이라도 테이블이 있으면 기록
+    """
+    if _enabled or force:
+        connection.execute(changes_table.insert().values(op='reload', changed_at=datetime.utcnow()))
+
+
+def change_feed_enabled() -> bool:
+    return _enabled
+
+
+def latest_cursor() -> int:
+    return db.session.query(db.func.max(BookingChange.id)).scalar() or 0
+
+
+def changes_since(since: Optional[int], limit: int = DEFAULT_LIMIT) -> Dict:
+    """since 커서 이후 변경 목록
+
+    since 가 없으면 현재 커서만 돌려준다 (목록을 받은 직후 구독 시작용).
+    since 이후 기록이 보존 기간 정리로 지워졌거나 로그가 초기화되었으면 reset=True
+    (클라이언트는 전체 목록을 다시 받고 새 커서부터 이어 받는다).
+    """
+    limit = max(1, min(limit, MAX_LIMIT))
+    latest = latest_cursor()
+    if since is None:
+        return {'changes': [], 'cursor': latest, 'has_more': False, 'reset': False}
+    oldest = db.session.query(db.func.min(BookingChange.id)).scalar()
+    if since > latest or (oldest is not None and since < oldest - 1):
+        return {'changes': [], 'cursor': latest, 'has_more': False, 'reset': True}
+
+    changes = (
+        BookingChange.query
+        .filter(BookingChange.id > since)
+        .order_by(BookingChange.id)
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    return {
+        'changes': [change.to_dict() for change in changes],
+        'cursor': changes[-1].id if changes else since,
+        'has_more': has_more,
+        'reset': False,
+    }
+
+
+def wait_for_changes(timeout: float):
+    """같은 프로세스에서 변경이 커밋되거나 timeout 이 지날 때까지 대기"""
+    with _committed:
+        _committed.wait(timeout)
+
+
+def prune_changes(retention_days: int = RETENTION_DAYS) -> int:
+    """보존 기간이 지난 이벤트 삭제 (가장 최근 이벤트는 커서 기준으로 남김)"""
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    latest = latest_cursor()
+    deleted = BookingChange.query.filter(
+        BookingChange.changed_at < cutoff, BookingChange.id < latest
+    ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
+
+
+def stream_events(since: Optional[int], poll_interval: float, heartbeat: float, max_seconds: float):
+    """SSE 이벤트 생성기 (id: 커서, event: booking|reset, data: 변경 JSON)
+
+    max_seconds 가 지나거나 워커가 종료 중이면 끝내고, 브라우저 EventSource 는 Last-Event-ID 로 이어서 재연결한다.
+    """
+    started = datetime.utcnow()
+    cursor = since
+    idle = 0.0
+    yield f"retry: {int(poll_interval * 1000)}\n\n"
+    if cursor is None:
+        cursor = latest_cursor()
+        yield f"id: {cursor}\nevent: ready\ndata: {json.dumps({'cursor': cursor})}\n\n"
+    while (datetime.utcnow() - started).total_seconds() < max_seconds and not shutting_down.is_set():
+        result = changes_since(cursor)
+        # 스트림이 연결을 오래 붙잡지 않도록 조회마다 세션 반환
+        db.session.remove()
+        if result['reset']:
+            cursor = result['cursor']
+            yield f"id: {cursor}\nevent: reset\ndata: {json.dumps({'cursor': cursor})}\n\n"
+        for change in result['changes']:
+            yield f"id: {change['cursor']}\nevent: booking\ndata: {json.dumps(change, ensure_ascii=False)}\n\n"
+        cursor = result['cursor']
+        if result['has_more']:
+            continue
+        if result['changes'] or result['reset']:
+            idle = 0.0
+        elif idle >= heartbeat:
+            idle = 0.0
+            yield ": keep-alive\n\n"
+        wait_for_changes(poll_interval)
+        idle += poll_interval
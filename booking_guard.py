@@ -0,0 +1,232 @@
+import logging
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.models.booking import db, Booking
+
+logger = logging.getLogger(__name__)
+
+# 겹치는 예약을 거부할 때 DB 트리거가 내는 오류 메시지
+OVERLAP_ERROR = 'booking_overlap'
+# 이번 트랜잭션에서 claim_version 으로 이미 버전을 올린 예약 ID (session.info)
+CLAIMED_KEY = 'booking_versions_claimed'
+
+# 예약 행 버전 - 수정될 때마다 1 증가 (compare-and-swap 으로 동시 수정 감지)
+# 모델 파일을 바꾸지 않고 매핑에 추가하며, 기존 DB 에는 마이그레이션 5 가 컬럼을 추가한다.
+version_column = db.Column('version', db.Integer, nullable=False, default=1, server_default='1')
+if 'version' not in Booking.__table__.c:
+    Booking.__table__.append_column(version_column)
+    Booking.__mapper__.add_property('version', version_column)
+
+
+class VersionConflict(Exception):
+    """요청한 버전과 DB 의 현재 버전이 다름 (다른 요청이 먼저 수정함)"""
+
+    def __init__(self, booking_id: int, expected: int, current: Optional[int]):
+        super().__init__(f'Booking {booking_id} was modified by another request '
+                         f'(expected version {expected}, current {current})')
+        self.booking_id = booking_id
+        self.expected = expected
+        self.current = current
+
+
+def requested_version(data, headers) -> Optional[int]:
+    """클라이언트가 알고 있는 버전 - If-Match: "3" 헤더 또는 본문 version 필드"""
+    value = headers.get('If-Match')
+    if value:
+        value = value.strip()
+        if value == '*':
+            # 어떤 버전이든 수정 (버전 확인 안 함)
+            return None
+        if value.startswith('W/'):
+            value = value[2:]
+        value = value.strip('"')
+    elif data and data.get('version') is not None:
+        value = data['version']
+    else:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid version: {value}')
+
+
+def claim_version(booking: Booking, expected: Optional[int] = None) -> int:
+    """UPDATE ... SET version = version + 1 WHERE id = :id AND version = :expected
+
+    expected 를 주지 않으면 이 요청에서 읽은 버전을 기준으로 한다. 영향받은 행이 없으면
+    그 사이에 다른 요청이 커밋한 것이므로 VersionConflict. 같은 트랜잭션에서 실행되므로
+    이후 flush 되는 변경과 함께 커밋되거나 함께 롤백된다.
+    """
+    table = Booking.__table__
+    current = booking.version if expected is None else expected
+    updated = db.session.execute(
+        table.update()
+        .where(table.c.id == booking.id, table.c.version == current)
+        .values(version=table.c.version + 1)
+    ).rowcount
+    if not updated:
+        latest = db.session.execute(db.select(table.c.version).where(table.c.id == booking.id)).scalar()
+        raise VersionConflict(booking.id, current, latest)
+    set_committed_value(booking, 'version', current + 1)
+    db.session.info.setdefault(CLAIMED_KEY, set()).add(booking.id)
+    return current + 1
+
+
+@event.listens_for(Booking, 'before_update')
+def _bump_version(mapper, connection, booking):
+    """ORM 으로 수정되는 모든 예약의 버전 증가 (반복 예약 취소 등 claim_version 을 거치지 않는 수정)
+
+    UPDATE 문 안에서 version = version + 1 로 계산하므로 그 사이 다른 트랜잭션이 올린 버전도 잃지 않는다.
+    """
+    session = object_session(booking)
+    if session is None or booking.id in session.info.get(CLAIMED_KEY, ()):
+        return
+    state = inspect(booking)
+    if state.attrs.version.history.has_changes() or not session.is_modified(booking, include_collections=False):
+        return
+    booking.version = Booking.__table__.c.version + 1
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _forget_claims(session):
+    session.info.pop(CLAIMED_KEY, None)
+
+
+def is_overlap_error(error: Exception) -> bool:
+    return isinstance(error, IntegrityError) and OVERLAP_ERROR in str(error.orig)
+
+
+# ---------------------------------------------------------------------------
+# 직원별 예약 시간 중복 방지 (DB 트리거)
+# ---------------------------------------------------------------------------
+# 같은 직원, 같은 날짜에 취소되지 않은 예약의 [time, time + duration) 구간이 겹치면 거부한다.
+# duration 이 없으면 서비스 소요 시간, 그것도 없으면 60분 (availability.DEFAULT_DURATION).
+# 예약 시간 인덱스 (staff_id, date, time) 로 그날 그 직원의 예약만 확인한다.
+# 수정은 활성 예약의 시간대(직원/날짜/시간/소요 시간/서비스)가 바뀌거나 취소된 예약을 되살릴 때만
+# 검사한다 - 이미 겹쳐 있던 기존 예약도 상태 변경(취소 등)과 메모 수정은 할 수 있어야 한다.
+
+_SQLITE_MINUTES = ("(CAST(substr({t}, 1, instr({t}, ':') - 1) AS INTEGER) * 60"
+                   " + CAST(substr({t}, instr({t}, ':') + 1, 2) AS INTEGER))")
+_SQLITE_DURATION = "COALESCE({p}.duration, (SELECT duration FROM services WHERE id = {p}.service_id), 60)"
+
+_SQLITE_CONDITION = """
+    COALESCE(NEW.status, '') != 'cancelled'
+    AND EXISTS (
+        SELECT 1 FROM bookings AS other
+        WHERE other.staff_id = NEW.staff_id
+          AND other.date = NEW.date
+          AND other.id != NEW.id
+          AND COALESCE(other.status, '') != 'cancelled'
+          AND {other_start} < {new_start} + {new_duration}
+          AND {other_start} + {other_duration} > {new_start}
+    )
+""".format(
+    other_start=_SQLITE_MINUTES.format(t='other.time'),
+    new_start=_SQLITE_MINUTES.format(t='NEW.time'),
+    other_duration=_SQLITE_DURATION.format(p='other'),
+    new_duration=_SQLITE_DURATION.format(p='NEW'),
+)
+
+_SQLITE_SLOT_CHANGED = """
+    (OLD.staff_id IS NOT NEW.staff_id OR OLD.date IS NOT NEW.date OR OLD.time IS NOT NEW.time
+     OR OLD.duration IS NOT NEW.duration OR OLD.service_id IS NOT NEW.service_id
+     OR COALESCE(OLD.status, '') = 'cancelled')
+"""
+
+SQLITE_TRIGGERS = [
+    'DROP TRIGGER IF EXISTS bookings_no_overlap_insert',
+    'DROP TRIGGER IF EXISTS bookings_no_overlap_update',
+    f"""CREATE TRIGGER bookings_no_overlap_insert BEFORE INSERT ON bookings
+    WHEN {_SQLITE_CONDITION}
+    BEGIN SELECT RAISE(ABORT, '{OVERLAP_ERROR}'); END""",
+    f"""CREATE TRIGGER bookings_no_overlap_update
+    BEFORE UPDATE OF staff_id, date, time, duration, service_id, status ON bookings
+    WHEN {_SQLITE_SLOT_CHANGED} AND {_SQLITE_CONDITION}
+    BEGIN SELECT RAISE(ABORT, '{OVERLAP_ERROR}'); END""",
+]
+
+# PostgreSQL: (직원, 날짜)별 advisory lock 으로 같은 슬롯의 동시 쓰기만 직렬화한 뒤 검사
+_PG_MINUTES = "(split_part({t}, ':', 1)::int * 60 + split_part({t}, ':', 2)::int)"
+_PG_DURATION = "COALESCE({p}.duration, (SELECT duration FROM services WHERE id = {p}.service_id), 60)"
+
+POSTGRES_TRIGGERS = [
+    f"""CREATE OR REPLACE FUNCTION bookings_no_overlap() RETURNS trigger AS $$
+    BEGIN
+        IF COALESCE(NEW.status, '') = 'cancelled' THEN
+            RETURN NEW;
+        END IF;
+        IF TG_OP = 'UPDATE'
+           AND OLD.staff_id IS NOT DISTINCT FROM NEW.staff_id AND OLD.date IS NOT DISTINCT FROM NEW.date
+           AND OLD.time IS NOT DISTINCT FROM NEW.time AND OLD.duration IS NOT DISTINCT FROM NEW.duration
+           AND OLD.service_id IS NOT DISTINCT FROM NEW.service_id
+           AND COALESCE(OLD.status, '') != 'cancelled' THEN
+            RETURN NEW;
+        END IF;
+        PERFORM pg_advisory_xact_lock(NEW.staff_id, NEW.date - DATE '2000-01-01');
+        IF EXISTS (
+            SELECT 1 FROM bookings AS other
+            WHERE other.staff_id = NEW.staff_id
+              AND other.date = NEW.date
+              AND other.id != NEW.id
+              AND COALESCE(other.status, '') != 'cancelled'
+              AND {_PG_MINUTES.format(t='other.time')} < {_PG_MINUTES.format(t='NEW.time')} + {_PG_DURATION.format(p='NEW')}
+              AND {_PG_MINUTES.format(t='other.time')} + {_PG_DURATION.format(p='other')} > {_PG_MINUTES.format(t='NEW.time')}
+        ) THEN
+            RAISE EXCEPTION '{OVERLAP_ERROR}' USING ERRCODE = 'exclusion_violation';
+        END IF;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql""",
+    'DROP TRIGGER IF EXISTS bookings_no_overlap ON bookings',
+    """CREATE TRIGGER bookings_no_overlap
+    BEFORE INSERT OR UPDATE OF staff_id, date, time, duration, service_id, status ON bookings
+    FOR EACH ROW EXECUTE FUNCTION bookings_no_overlap()""",
+]
+
+
+def overlap_guard_installed(connection) -> bool:
+    dialect = connection.dialect.name
+    if dialect == 'sqlite':
+        query = "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'bookings_no_overlap_insert'"
+    elif dialect == 'postgresql':
+        query = "SELECT 1 FROM pg_trigger WHERE tgname = 'bookings_no_overlap'"
+    else:
+        return False
+    return connection.exec_driver_sql(query).first() is not None
+
+
+def remove_overlap_guard(connection):
+    """트리거 제거 - 겹치지 않는 것이 보장된 대량 적재를 같은 트랜잭션 안에서 빠르게 하기 위함"""
+    dialect = connection.dialect.name
+    if dialect == 'sqlite':
+        statements = SQLITE_TRIGGERS[:2]
+    elif dialect == 'postgresql':
+        statements = ['DROP TRIGGER IF EXISTS bookings_no_overlap ON bookings']
+    else:
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+def install_overlap_guard(connection) -> bool:
+    """예약 시간 중복 방지 트리거 생성 (지원하지 않는 DB 는 애플리케이션 검사만 사용)"""
+    statements = {'sqlite': SQLITE_TRIGGERS, 'postgresql': POSTGRES_TRIGGERS}.get(connection.dialect.name)
+    if statements is None:
+        logger.warning(f"Booking overlap guard is not available for {connection.dialect.name}")
+        return False
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+    return True
+
+
+def add_version_column(connection):
+    """기존 bookings 테이블에 version 컬럼 추가 (create_all 로 만든 새 DB 에는 이미 있음)"""
+    columns = {column['name'] for column in inspect(connection).get_columns(Booking.__tablename__)}
+    if 'version' not in columns:
+        connection.exec_driver_sql('ALTER TABLE bookings ADD COLUMN version INTEGER NOT NULL DEFAULT 1')
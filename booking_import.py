@@ -0,0 +1,308 @@
+import io
+import csv
+import json
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from src.models.booking import db, Booking, Customer, Pet
+from src.reference_cache import reference_cache
+from src.availability import availability_index, parse_minutes, format_minutes, DEFAULT_DURATION, INACTIVE_STATUSES
+from src.booking_stats import apply_inserted
+from src.booking_changes import record_reload
+from src.response_cache import response_cache
+from src.customer_keys import normalize_phone
+from src.booking_guard import overlap_guard_installed, remove_overlap_guard, install_overlap_guard
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+FORMATS = ('csv', 'jsonl')
+
+REQUIRED_FIELDS = ['customerName', 'customerPhone', 'petName', 'serviceType', 'date', 'time', 'staff']
+
+# GET /bookings 응답 키(snake_case)로 내보낸 파일도 그대로 가져올 수 있도록 별칭 지원
+FIELD_ALIASES = {
+    'customer_name': 'customerName',
+    'customer_phone': 'customerPhone',
+    'customer_email': 'customerEmail',
+    'customer_address': 'customerAddress',
+    'pet_name': 'petName',
+    'pet_breed': 'petBreed',
+    'pet_notes': 'petNotes',
+    'service_type': 'serviceType',
+}
+
+
+class ImportRow:
+    """검증을 통과한 가져오기 행"""
+
+    __slots__ = ('line', 'data', 'date', 'start', 'price', 'service', 'staff', 'phone_key')
+
+    def __init__(self, line: int, data: Dict, booking_date, start: int, price: int, service, staff, phone_key: str):
+        self.line = line
+        self.data = data
+        self.date = booking_date
+        self.start = start
+        self.price = price
+        self.service = service
+        self.staff = staff
+        # 정규화한 전화번호 (customer_keys.normalize_phone) - 형식이 달라도 같은 고객
+        self.phone_key = phone_key
+
+
+def detect_format(filename: Optional[str] = None, content_type: Optional[str] = None) -> str:
+    """파일 확장자 또는 Content-Type 으로 형식 결정 (기본 csv)"""
+    name = (filename or '').lower()
+    content_type = (content_type or '').lower()
+    if name.endswith(('.jsonl', '.ndjson')) or 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'jsonl'
+    return 'csv'
+
+
+def _normalize(record: Dict) -> Dict:
+    data = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        key = FIELD_ALIASES.get(key.strip(), key.strip())
+        data[key] = value.strip() if isinstance(value, str) else value
+    return data
+
+
+def read_rows(stream: Iterable[str], fmt: str) -> Iterator[Tuple[int, Dict]]:
+    """(행 번호, 필드) 순회 - CSV 는 헤더 다음 줄이 2행, JSONL 은 1행부터
+
+    JSON 으로 읽을 수 없는 줄은 필드 대신 '_error' 를 담아 돌려준다.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, _normalize(record)
+        return
+    if fmt != 'jsonl':
+        raise ValueError(f"Unsupported format: {fmt} (use {' or '.join(FORMATS)})")
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError('row must be a JSON object')
+        except ValueError as e:
+            yield line_number, {'_error': f'Invalid JSON: {str(e)}'}
+            continue
+        yield line_number, _normalize(record)
+
+
+def read_text(text: str, fmt: str) -> Iterator[Tuple[int, Dict]]:
+    return read_rows(io.StringIO(text, newline=''), fmt)
+
+
+def _validate(line: int, data: Dict) -> ImportRow:
+    if '_error' in data:
+        raise ValueError(data['_error'])
+    for field in REQUIRED_FIELDS:
+        if not data.get(field):
+            raise ValueError(f'Missing required field: {field}')
+    service = reference_cache.service(str(data['serviceType']))
+    if not service:
+        raise ValueError(f'Service not found: {data["serviceType"]}')
+    staff = reference_cache.staff(str(data['staff']))
+    if not staff:
+        raise ValueError(f'Staff not found: {data["staff"]}')
+    booking_date = datetime.strptime(str(data['date']), '%Y-%m-%d').date()
+    start = parse_minutes(str(data['time']))
+    price = int(data['price']) if data.get('price') not in (None, '') else service.base_price
+    phone_key = normalize_phone(data['customerPhone'])
+    return ImportRow(line, data, booking_date, start, price, service, staff, phone_key)
+
+
+class BookingImporter:
+    """CSV/JSONL 예약 일괄 가져오기
+
+    청크마다 고객/반려동물을 IN 조회로 한 번에 찾고(없으면 함께 생성),
+    예약은 executemany INSERT 로 넣은 뒤 청크 단위로 커밋한다.
+    실패한 행은 행 번호와 사유를 보고하고 나머지 행은 계속 가져온다.
+    allow_conflicts 이면 겹침 검사를 건너뛰고, 청크 트랜잭션 안에서만 DB 의 중복 방지 트리거를
+    빼 두었다가 커밋 전에 다시 설치한다 (그동안 다른 쓰기는 잠금을 기다림).
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, allow_conflicts: bool = False):
+        self.chunk_size = chunk_size
+        self.allow_conflicts = allow_conflicts
+        self.total = 0
+        self.imported = 0
+        self.failed = 0
+        self.created_customers = 0
+        self.created_pets = 0
+        self.errors: List[Dict] = []
+        # 이번 가져오기에서 이미 넣은 (직원, 날짜)별 구간 - 파일 내부 중복 예약 검사
+        self._accepted: Dict = {}
+
+    def _error(self, line: int, message: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': line, 'error': message})
+
+    def _resolve_customers(self, rows: List[ImportRow]) -> Dict[str, int]:
+        keys = {row.phone_key for row in rows}
+        customers = dict(
+            db.session.query(Customer.phone_key, Customer.id).filter(Customer.phone_key.in_(keys)).all()
+        )
+        new_customers = {}
+        for row in rows:
+            if row.phone_key not in customers and row.phone_key not in new_customers:
+                new_customers[row.phone_key] = Customer(
+                    name=row.data['customerName'],
+                    phone=str(row.data['customerPhone']),
+                    phone_key=row.phone_key,
+                    email=row.data.get('customerEmail', ''),
+                    address=row.data.get('customerAddress', '')
+                )
+        if new_customers:
+            db.session.add_all(new_customers.values())
+            db.session.flush()
+            customers.update({key: customer.id for key, customer in new_customers.items()})
+            self.created_customers += len(new_customers)
+        return customers
+
+    def _resolve_pets(self, rows: List[ImportRow], customers: Dict[str, int]) -> Dict[Tuple[int, str], int]:
+        # (customer_id, name) 인덱스의 앞 컬럼으로만 조회하고 이름은 메모리에서 비교
+        customer_ids = {customers[row.phone_key] for row in rows}
+        pets = {
+            (customer_id, name): pet_id
+            for pet_id, customer_id, name in db.session.query(Pet.id, Pet.customer_id, Pet.name)
+            .filter(Pet.customer_id.in_(customer_ids))
+            .order_by(Pet.id.desc())
+        }
+        new_pets = {}
+        for row in rows:
+            key = (customers[row.phone_key], str(row.data['petName']))
+            if key not in pets and key not in new_pets:
+                new_pets[key] = Pet(
+                    name=key[1],
+                    breed=row.data.get('petBreed', ''),
+                    customer_id=key[0],
+                    notes=row.data.get('petNotes', '')
+                )
+        if new_pets:
+            db.session.add_all(new_pets.values())
+            db.session.flush()
+            pets.update({key: pet.id for key, pet in new_pets.items()})
+            self.created_pets += len(new_pets)
+        return pets
+
+    def _without_conflicts(self, rows: List[ImportRow]) -> List[ImportRow]:
+        """기존 예약 및 앞서 가져온 행과 겹치는 행 제외 (직원/날짜 일정은 한 번의 쿼리로 조회)"""
+        active = [row for row in rows if row.data.get('status') not in INACTIVE_STATUSES]
+        if not active:
+            return rows
+        schedules = availability_index.schedules(
+            sorted({row.staff.id for row in active}), sorted({row.date for row in active}), fresh=True
+        )
+        accepted = []
+        for row in rows:
+            if row.data.get('status') in INACTIVE_STATUSES:
+                accepted.append(row)
+                continue
+            key = (row.staff.id, row.date)
+            end = row.start + (row.service.duration or DEFAULT_DURATION)
+            conflict_id = schedules[key].conflict(row.start, end)
+            if conflict_id:
+                self._error(row.line, f'Time slot not available (conflicts with booking {conflict_id})')
+                continue
+            previous = next((line for start, stop, line in self._accepted.get(key, ())
+                             if start < end and row.start < stop), None)
+            if previous:
+                self._error(row.line, f'Time slot not available (conflicts with row {previous})')
+                continue
+            self._accepted.setdefault(key, []).append((row.start, end, row.line))
+            accepted.append(row)
+        return accepted
+
+    def _import_chunk(self, rows: List[ImportRow]):
+        if not self.allow_conflicts:
+            rows = self._without_conflicts(rows)
+        if not rows:
+            return
+        try:
+            customers = self._resolve_customers(rows)
+            pets = self._resolve_pets(rows, customers)
+            mappings = []
+            for row in rows:
+                customer_id = customers[row.phone_key]
+                mappings.append({
+                    'customer_id': customer_id,
+                    'pet_id': pets[(customer_id, str(row.data['petName']))],
+                    'service_id': row.service.id,
+                    'staff_id': row.staff.id,
+                    'date': row.date,
+                    'time': format_minutes(row.start),
+                    'duration': row.service.duration,
+                    'price': row.price,
+                    'status': row.data.get('status') or 'confirmed',
+                    'notes': row.data.get('notes', ''),
+                })
+            # 겹치는 예약도 가져오는 경우 트리거가 청크 전체를 롤백하지 않도록 같은 트랜잭션에서 잠시 제거
+            guarded = self.allow_conflicts and overlap_guard_installed(db.session.connection())
+            if guarded:
+                remove_overlap_guard(db.session.connection())
+            # mapper 이벤트를 거치지 않는 executemany INSERT - 통계 요약은 같은 트랜잭션에서 직접 반영
+            db.session.execute(insert(Booking), mappings)
+            if guarded:
+                install_overlap_guard(db.session.connection())
+            apply_inserted(db.session.connection(), mappings)
+            # 행 단위 변경 이벤트 대신 목록 재조회 이벤트 하나
+            record_reload(db.session.connection())
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Bulk import chunk failed (rows {rows[0].line}-{rows[-1].line}): {str(e)}")
+            failed_lines = {row.line for row in rows}
+            for row in rows:
+                self._error(row.line, str(e))
+            for key in {(row.staff.id, row.date) for row in rows}:
+                self._accepted[key] = [item for item in self._accepted.get(key, ()) if item[2] not in failed_lines]
+            return
+        self.imported += len(rows)
+        availability_index.invalidate({(row.staff.id, row.date) for row in rows})
+        response_cache.bump('bookings', 'stats', 'customers')
+
+    def run(self, rows: Iterable[Tuple[int, Dict]]) -> Dict:
+        started = time.perf_counter()
+        chunk: List[ImportRow] = []
+        for line, data in rows:
+            self.total += 1
+            try:
+                chunk.append(_validate(line, data))
+            except (ValueError, TypeError) as e:
+                self._error(line, str(e))
+                continue
+            if len(chunk) >= self.chunk_size:
+                self._import_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Bulk import: {self.imported}/{self.total} rows in {elapsed:.2f}s")
+        return {
+            'total': self.total,
+            'imported': self.imported,
+            'failed': self.failed,
+            'created_customers': self.created_customers,
+            'created_pets': self.created_pets,
+            'elapsed_ms': round(elapsed * 1000, 1),
+            'errors': sorted(self.errors, key=lambda error: error['row']),
+            'errors_truncated': self.failed > len(self.errors),
+        }
+
+
+def import_bookings(rows: Iterable[Tuple[int, Dict]], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    allow_conflicts: bool = False) -> Dict:
+    return BookingImporter(chunk_size, allow_conflicts).run(rows)
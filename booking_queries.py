@@ -0,0 +1,175 @@
+import json
+import base64
+from datetime import date, datetime
+from typing import Dict, Any, List, Iterable, Optional, Tuple
+
+from src.models.booking import db, Booking, Customer, Pet, Service, Staff
+from src.booking_guard import version_column
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def _format(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+# 예약 목록 응답 필드 -> 컬럼 (Booking.to_dict 와 같은 키)
+BOOKING_FIELDS = {
+    'id': Booking.id,
+    'customer_id': Booking.customer_id,
+    'customer_name': Customer.name,
+    'customer_phone': Customer.phone,
+    'customer_email': Customer.email,
+    'customer_address': Customer.address,
+    'pet_id': Booking.pet_id,
+    'pet_name': Pet.name,
+    'pet_breed': Pet.breed,
+    'service_id': Booking.service_id,
+    'service_type': Service.name,
+    'staff_id': Booking.staff_id,
+    'staff': Staff.name,
+    'date': Booking.date,
+    'time': Booking.time,
+    'duration': Booking.duration,
+    'price': Booking.price,
+    'status': Booking.status,
+    'notes': Booking.notes,
+    'created_at': Booking.created_at,
+    'updated_at': Booking.updated_at,
+    # 수정 요청의 If-Match / version 값 (동시 수정 감지)
+    'version': version_column,
+}
+
+
+# 고객 목록 응답 필드 -> 컬럼
+CUSTOMER_FIELDS = {
+    'id': Customer.id,
+    'name': Customer.name,
+    'phone': Customer.phone,
+    'email': Customer.email,
+    'address': Customer.address,
+}
+
+
+def _parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+# 키셋 페이지네이션 정렬 키: (응답 키, 컬럼, 커서 값 변환 함수)
+BOOKING_ORDER = [('date', Booking.date, _parse_date), ('time', Booking.time, str), ('id', Booking.id, int)]
+CUSTOMER_ORDER = [('name', Customer.name, str), ('id', Customer.id, int)]
+
+
+def booking_list_query(fields: Optional[Iterable[str]] = None):
+    """예약 + 고객/반려동물/서비스/직원을 한 번의 SELECT 로 조회하는 쿼리
+
+    관계를 지연 로딩하지 않으므로 예약 수와 관계없이 쿼리는 1회만 실행된다.
+    """
+    keys = list(fields) if fields else list(BOOKING_FIELDS)
+    columns = [BOOKING_FIELDS[key].label(key) for key in keys]
+    return (
+        db.session.query(*columns)
+        .select_from(Booking)
+        .outerjoin(Customer, Booking.customer_id == Customer.id)
+        .outerjoin(Pet, Booking.pet_id == Pet.id)
+        .outerjoin(Service, Booking.service_id == Service.id)
+        .outerjoin(Staff, Booking.staff_id == Staff.id)
+    )
+
+
+def customer_list_query(fields: Optional[Iterable[str]] = None):
+    """고객 목록 projection 쿼리"""
+    keys = list(fields) if fields else list(CUSTOMER_FIELDS)
+    return db.session.query(*[CUSTOMER_FIELDS[key].label(key) for key in keys]).select_from(Customer)
+
+
+def parse_fields(param: Optional[str], available: Dict[str, Any]) -> Optional[List[str]]:
+    """fields= 파라미터 검증 ('id,date,time' -> ['id', 'date', 'time'])"""
+    if not param:
+        return None
+    fields = [field.strip() for field in param.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def with_order_keys(fields: Optional[List[str]], order) -> Optional[List[str]]:
+    """커서 생성을 위해 정렬 키 컬럼을 조회 대상에 포함"""
+    if fields is None:
+        return None
+    return fields + [key for key, _, _ in order if key not in fields]
+
+
+def encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps([_format(value) for value in values], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, order) -> List[Any]:
+    """커서 문자열을 정렬 키 값 목록으로 복원 (잘못된 커서는 ValueError)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        if not isinstance(values, list) or len(values) != len(order):
+            raise ValueError
+        return [convert(value) for value, (_, _, convert) in zip(values, order)]
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+
+def keyset_after(order, values: List[Any]):
+    """(c1, c2, c3) > (v1, v2, v3) 조건 (row value 비교를 OR/AND 로 전개)"""
+    columns = [column for _, column, _ in order]
+    clauses = []
+    for index, column in enumerate(columns):
+        equals = [columns[i] == values[i] for i in range(index)]
+        clauses.append(db.and_(*equals, column > values[index]))
+    return db.or_(*clauses)
+
+
+def parse_limit(param: Optional[str]) -> int:
+    limit = int(param) if param else DEFAULT_PAGE_SIZE
+    if limit < 1:
+        raise ValueError('limit must be positive')
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def paginate(query, order, limit: int, cursor: Optional[str] = None) -> Tuple[list, Optional[str]]:
+    """키셋(커서) 페이지네이션 - OFFSET 없이 정렬 키 다음 행부터 limit 개 조회"""
+    if cursor:
+        query = query.filter(keyset_after(order, decode_cursor(cursor, order)))
+    rows = query.order_by(*[column for _, column, _ in order]).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, key) for key, _, _ in order])
+    return rows, next_cursor
+
+
+def count_rows(query) -> int:
+    """필터가 적용된 쿼리의 전체 건수 (정렬/페이지와 별도로 계산)"""
+    return query.order_by(None).count()
+
+
+def serialize_rows(rows, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """조회 결과 row 튜플을 바로 dict 로 변환 (ORM 객체 생성 없음)"""
+    if not rows:
+        return []
+    keys = list(rows[0]._fields)
+    if fields is not None:
+        indexes = [keys.index(field) for field in fields]
+        return [
+            {field: _format(row[index]) for field, index in zip(fields, indexes)}
+            for row in rows
+        ]
+    return [
+        {key: _format(value) for key, value in zip(keys, row)}
+        for row in rows
+    ]
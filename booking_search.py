@@ -0,0 +1,279 @@
+import re
+import logging
+from typing import List, Optional
+
+from sqlalchemy import event, text
+
+from src.models.booking import db, Booking, Customer, Pet
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = 'booking_search'
+
+# 고객/반려동물 문서는 같은 FTS 테이블에 rowid 로 구분하여 저장
+CUSTOMER_DOC, PET_DOC = 'customer', 'pet'
+
+NON_DIGIT = re.compile(r'\D')
+WORD_SPLIT = re.compile(r'\s+')
+
+_enabled = False
+
+
+def _rowid(kind: str, owner_id: int) -> int:
+    return owner_id * 2 + (1 if kind == PET_DOC else 0)
+
+
+def ngrams(value: Optional[str]) -> List[str]:
+    """단어별 1-gram + 2-gram (한글 이름 부분 검색용: '김철수' -> 김 철 수 김철 철수)"""
+    grams = []
+    for word in WORD_SPLIT.split((value or '').lower()):
+        if not word:
+            continue
+        grams.extend(word)
+        grams.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def phone_tokens(phone: Optional[str]) -> List[str]:
+    """전화번호 숫자 전체 + 구간별 숫자 + 뒤 4자리 ('010-1234-5678' -> 01012345678 010 1234 5678)"""
+    digits = NON_DIGIT.sub('', phone or '')
+    if not digits:
+        return []
+    tokens = [digits] + [group for group in NON_DIGIT.split(phone) if group and group != digits]
+    if len(digits) > 4 and digits[-4:] not in tokens:
+        tokens.append(digits[-4:])
+    return tokens
+
+
+def _quote(token: str) -> str:
+    return '"' + token.replace('"', '""') + '"'
+
+
+def build_match_query(search: str) -> Optional[str]:
+    """검색어를 FTS5 MATCH 식으로 변환 (후보 선별용 - 결과는 search_filter 가 원래 검색어로 다시 확인)
+
+    grams 컬럼의 2-gram AND 검색. 숫자(전화번호)만 있으면 phone 컬럼 접두사 검색도 함께 한다
+    (이름/품종에 숫자가 들어간 경우).
+    """
+    search = search.strip()
+    digits = NON_DIGIT.sub('', search)
+    phone = None
+    if digits and not re.search(r'[^\d\s\-+()]', search):
+        phone = f'phone : {_quote(digits)}*'
+
+    terms = []
+    for word in WORD_SPLIT.split(search.lower()):
+        if not word:
+            continue
+        if len(word) == 1:
+            terms.append(_quote(word))
+        else:
+            terms.extend(_quote(word[i:i + 2]) for i in range(len(word) - 1))
+    if not terms:
+        return phone
+    grams = 'grams : (' + ' AND '.join(terms) + ')'
+    return f'({phone}) OR ({grams})' if phone else grams
+
+
+def _digits_only(column):
+    return db.func.replace(db.func.replace(column, '-', ''), ' ', '')
+
+
+def term_condition(search: str):
+    """원래 검색어 확인 조건 - 공백으로 나눈 단어가 모두 고객 이름/전화번호, 반려동물 이름/품종 중 하나에 포함
+
+    2-gram AND 검색은 단어 안의 순서/인접을 보지 않으므로 ('철수' 와 '수철' 모두 '철','수' 포함)
+    FTS 후보를 이 조건으로 다시 거른다.
+    """
+    conditions = []
+    for word in WORD_SPLIT.split(search.strip()):
+        if not word:
+            continue
+        fields = [
+            Customer.name.contains(word, autoescape=True),
+            Pet.name.contains(word, autoescape=True),
+            Pet.breed.contains(word, autoescape=True),
+        ]
+        digits = NON_DIGIT.sub('', word)
+        if digits and not re.search(r'[^\d\-+()]', word):
+            fields.append(_digits_only(Customer.phone).contains(digits, autoescape=True))
+        conditions.append(db.or_(*fields))
+    return db.and_(*conditions) if conditions else None
+
+
+INSERT_DOC = text(
+    f'INSERT INTO {SEARCH_TABLE} (rowid, grams, phone, kind, owner_id, customer_id) '
+    'VALUES (:rowid, :grams, :phone, :kind, :owner_id, :customer_id)'
+)
+
+
+def _doc(kind: str, owner_id: int, customer_id: int, grams: List[str], phones: List[str]) -> dict:
+    return {'rowid': _rowid(kind, owner_id), 'grams': ' '.join(grams), 'phone': ' '.join(phones),
+            'kind': kind, 'owner_id': owner_id, 'customer_id': customer_id}
+
+
+def _customer_doc(customer) -> dict:
+    return _doc(CUSTOMER_DOC, customer.id, customer.id, ngrams(customer.name), phone_tokens(customer.phone))
+
+
+def _pet_doc(pet) -> dict:
+    return _doc(PET_DOC, pet.id, pet.customer_id, ngrams(pet.name) + ngrams(pet.breed), [])
+
+
+# 이미 있으면 그대로 둠 (upsert 로 기존 고객/반려동물을 찾은 경우)
+INSERT_MISSING_DOC = text(
+    f'INSERT INTO {SEARCH_TABLE} (rowid, grams, phone, kind, owner_id, customer_id) '
+    'SELECT :rowid, :grams, :phone, :kind, :owner_id, :customer_id '
+    f'WHERE NOT EXISTS (SELECT 1 FROM {SEARCH_TABLE} WHERE rowid = :rowid)'
+)
+
+
+def _write_doc(connection, doc: dict):
+    connection.execute(text(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid'), {'rowid': doc['rowid']})
+    connection.execute(INSERT_DOC, doc)
+
+
+def _index_customer(connection, customer):
+    _write_doc(connection, _customer_doc(customer))
+
+
+def _index_pet(connection, pet):
+    _write_doc(connection, _pet_doc(pet))
+
+
+def _delete_doc(connection, kind: str, owner_id: int):
+    connection.execute(text(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = :rowid'),
+                       {'rowid': _rowid(kind, owner_id)})
+
+
+# 고객/반려동물 INSERT/UPDATE/DELETE 와 같은 트랜잭션에서 검색 인덱스 갱신
+@event.listens_for(Customer, 'after_insert')
+@event.listens_for(Customer, 'after_update')
+def _customer_saved(mapper, connection, customer):
+    if _enabled:
+        _index_customer(connection, customer)
+
+
+@event.listens_for(Customer, 'after_delete')
+def _customer_deleted(mapper, connection, customer):
+    if _enabled:
+        _delete_doc(connection, CUSTOMER_DOC, customer.id)
+
+
+@event.listens_for(Pet, 'after_insert')
+@event.listens_for(Pet, 'after_update')
+def _pet_saved(mapper, connection, pet):
+    if _enabled:
+        _index_pet(connection, pet)
+
+
+@event.listens_for(Pet, 'after_delete')
+def _pet_deleted(mapper, connection, pet):
+    if _enabled:
+        _delete_doc(connection, PET_DOC, pet.id)
+
+
+def index_upserted(connection, customer=None, pet=None):
+    """core INSERT ... ON CONFLICT 로 찾거나 만든 고객/반려동물 행을 (없으면) 색인 - mapper 이벤트 대신"""
+    if not _enabled:
+        return
+    if customer is not None:
+        connection.execute(INSERT_MISSING_DOC, _customer_doc(customer))
+    if pet is not None:
+        connection.execute(INSERT_MISSING_DOC, _pet_doc(pet))
+
+
+def search_enabled() -> bool:
+    return _enabled
+
+
+def init_search_index(rebuild: bool = False, create: bool = True) -> bool:
+    """FTS5 검색 인덱스 생성 (SQLite 전용, 비어 있으면 기존 데이터로 채움)
+
+    FTS5 를 사용할 수 없는 DB 에서는 False 를 반환하고 LIKE 검색을 그대로 사용한다.
+    create=False 이면 인덱스가 이미 있는지만 확인한다 (앱 시작 시 - 생성은 init-db 명령).
+    """
+    global _enabled
+    if db.engine.dialect.name != 'sqlite':
+        _enabled = False
+        return False
+    if not create:
+        with db.engine.connect() as connection:
+            _enabled = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {'name': SEARCH_TABLE}
+            ).first() is not None
+        if not _enabled:
+            logger.warning(f"{SEARCH_TABLE} table missing, customer/pet search uses LIKE")
+        return _enabled
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(text(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5('
+                'grams, phone, kind UNINDEXED, owner_id UNINDEXED, customer_id UNINDEXED, '
+                "tokenize = 'unicode61 remove_diacritics 0')"
+            ))
+            empty = connection.execute(text(f'SELECT count(*) FROM {SEARCH_TABLE}')).scalar() == 0
+        _enabled = True
+    except Exception as e:
+        logger.warning(f"FTS5 search index unavailable, falling back to LIKE search: {str(e)}")
+        _enabled = False
+        return False
+
+    if rebuild or empty:
+        rebuild_search_index()
+    return True
+
+
+def rebuild_search_index(batch_size: int = 10000, connection=None):
+    """고객/반려동물 전체로 검색 인덱스 재구성 (bulk insert 이후 등) - batch_size 행씩 executemany
+
+    connection 을 주면 그 트랜잭션 안에서 재구성한다 (마이그레이션).
+    """
+    if connection is None:
+        with db.engine.begin() as connection:
+            return rebuild_search_index(batch_size, connection)
+    counts = {CUSTOMER_DOC: 0, PET_DOC: 0}
+    connection.execute(text(f'DELETE FROM {SEARCH_TABLE}'))
+    sources = [
+        (CUSTOMER_DOC, _customer_doc, db.select(Customer.id, Customer.name, Customer.phone)),
+        (PET_DOC, _pet_doc, db.select(Pet.id, Pet.name, Pet.breed, Pet.customer_id)),
+    ]
+    for kind, make_doc, query in sources:
+        result = connection.execute(query)
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            connection.execute(INSERT_DOC, [make_doc(row) for row in rows])
+            counts[kind] += len(rows)
+    logger.info(f"Search index rebuilt: {counts[CUSTOMER_DOC]} customers, {counts[PET_DOC]} pets")
+
+
+def _matching_ids(kind: str, match: str, index: int = 0):
+    name = f'{kind}_{index}'
+    return text(
+        f"SELECT owner_id FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match_{name} AND kind = :kind_{name}"
+    ).bindparams(**{f'match_{name}': match, f'kind_{name}': kind}).columns(owner_id=db.Integer).subquery()
+
+
+def search_filter(search: str):
+    """예약 목록 검색 조건 (고객 이름/전화번호 또는 해당 예약 반려동물의 이름/품종)
+
+    단어마다 FTS 인덱스로 후보(고객 또는 반려동물)를 좁힌 뒤 원래 검색어로 확인한다
+    (예약 목록 쿼리가 고객/반려동물을 조인함). '김 푸들' 처럼 단어가 고객과 반려동물에
+    나뉘어 있어도 같은 예약이면 찾는다.
+    """
+    candidates = []
+    for index, word in enumerate(WORD_SPLIT.split(search.strip())):
+        match = build_match_query(word) if word else None
+        if match is None:
+            continue
+        customers = _matching_ids(CUSTOMER_DOC, match, index)
+        pets = _matching_ids(PET_DOC, match, index)
+        candidates.append(db.or_(
+            Booking.customer_id.in_(db.select(customers.c.owner_id)),
+            Booking.pet_id.in_(db.select(pets.c.owner_id))
+        ))
+    if not candidates:
+        return None
+    return db.and_(*candidates, term_condition(search))
@@ -0,0 +1,445 @@
+import os
+import json
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Index, inspect, insert
+from sqlalchemy.exc import IntegrityError
+
+from src.models.booking import db, Booking
+from src.reference_cache import reference_cache
+from src.availability import (
+    availability_index, parse_minutes, format_minutes, works_on, DEFAULT_DURATION, INACTIVE_STATUSES
+)
+from src.booking_stats import apply_inserted
+from src.booking_changes import record_reload
+from src.booking_guard import is_overlap_error
+from src.response_cache import mark_changed
+
+logger = logging.getLogger(__name__)
+
+# 오늘부터 이 기간(일) 안의 회차만 예약으로 만들어 둔다 - 나머지는 기간이 지나가며 생성
+HORIZON_DAYS = int(os.environ.get('SERIES_HORIZON_DAYS', 90))
+MAX_INTERVAL_WEEKS = 52
+MAX_OCCURRENCES = 520
+# 한 번에 회차를 생성할 반복 예약 수 (직원/날짜 일정 조회 한 번 + executemany INSERT 한 번)
+BATCH_SIZE = 200
+# 건너뛴 회차 기록은 최근 것만 보관
+MAX_SKIPPED = 100
+# 백그라운드 horizon 확인 주기(초) - 채워져 있으면 DB 를 조회하지 않으므로 가벼움
+CHECK_INTERVAL = float(os.environ.get('SERIES_CHECK_INTERVAL', 600))
+
+STATUSES = ('active', 'cancelled')
+
+_enabled = False
+
+
+class BookingSeries(db.Model):
+    """반복 예약 규칙 (start_date 부터 interval_weeks 주마다 같은 시간)
+
+    회차 예약은 오늘 + HORIZON_DAYS 까지만 bookings 에 만들어 두고, generated 는
+    지금까지 처리한(예약 생성 또는 건너뜀) 회차 수 = 다음 회차 번호이다.
+    occurrences(총 회차 수) 와 end_date 가 모두 없으면 취소할 때까지 계속된다.
+    """
+    __tablename__ = 'booking_series'
+
+    id = db.Column(db.Integer, primary_key=True)
+    customer_id = db.Column(db.Integer, db.ForeignKey('customers.id'), nullable=False)
+    pet_id = db.Column(db.Integer, db.ForeignKey('pets.id'), nullable=False)
+    service_id = db.Column(db.Integer, db.ForeignKey('services.id'), nullable=False)
+    staff_id = db.Column(db.Integer, db.ForeignKey('staff.id'), nullable=False)
+    start_date = db.Column(db.Date, nullable=False)
+    time = db.Column(db.String(5), nullable=False)
+    interval_weeks = db.Column(db.Integer, nullable=False)
+    occurrences = db.Column(db.Integer)
+    end_date = db.Column(db.Date)
+    price = db.Column(db.Integer)
+    notes = db.Column(db.Text)
+    status = db.Column(db.String(20), nullable=False, default='active')
+    generated = db.Column(db.Integer, nullable=False, default=0)
+    # 건너뛴 회차 [{date, reason, conflict_booking_id}, ...] (JSON)
+    skipped = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def occurrence_date(self, index: int) -> date:
+        return self.start_date + timedelta(weeks=self.interval_weeks * index)
+
+    def finished(self, index: int) -> bool:
+        """index 번째 회차가 규칙 범위를 벗어났는지"""
+        if self.occurrences is not None and index >= self.occurrences:
+            return True
+        return self.end_date is not None and self.occurrence_date(index) > self.end_date
+
+    def skipped_list(self) -> List[Dict]:
+        return json.loads(self.skipped) if self.skipped else []
+
+    def to_dict(self) -> Dict:
+        service = reference_cache.service_by_id(self.service_id)
+        staff = reference_cache.staff_by_id(self.staff_id)
+        next_date = None if self.status != 'active' or self.finished(self.generated) \
+            else self.occurrence_date(self.generated)
+        return {
+            'id': self.id,
+            'customer_id': self.customer_id,
+            'pet_id': self.pet_id,
+            'service_id': self.service_id,
+            'service_type': service.name if service else None,
+            'staff_id': self.staff_id,
+            'staff': staff.name if staff else None,
+            'start_date': self.start_date.strftime('%Y-%m-%d'),
+            'time': self.time,
+            'interval_weeks': self.interval_weeks,
+            'occurrences': self.occurrences,
+            'end_date': self.end_date.strftime('%Y-%m-%d') if self.end_date else None,
+            'price': self.price,
+            'notes': self.notes,
+            'status': self.status,
+            'generated': self.generated,
+            # 아직 예약으로 만들지 않은 다음 회차 (기간이 지나가며 생성)
+            'next_unmaterialized_date': next_date.strftime('%Y-%m-%d') if next_date else None,
+            'skipped': self.skipped_list(),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+series_table = BookingSeries.__table__
+
+# 회차 예약 -> 반복 예약 (모델 파일을 바꾸지 않고 매핑에 추가, 기존 DB 는 마이그레이션 9 가 추가)
+series_id_column = db.Column('series_id', db.Integer, db.ForeignKey('booking_series.id'))
+if 'series_id' not in Booking.__table__.c:
+    Booking.__table__.append_column(series_id_column)
+    Booking.__mapper__.add_property('series_id', series_id_column)
+
+# 반복 예약별 회차 조회/취소
+SERIES_BOOKING_INDEX = Index('ix_bookings_series_date', series_id_column, Booking.date)
+
+
+def horizon_end(today: Optional[date] = None) -> date:
+    return (today or date.today()) + timedelta(days=HORIZON_DAYS)
+
+
+def _skip(date_value: date, reason: str, conflict_id: Optional[int] = None) -> Dict:
+    return {'date': date_value.strftime('%Y-%m-%d'), 'reason': reason, 'conflict_booking_id': conflict_id}
+
+
+class _Plan:
+    """반복 예약 하나의 이번 생성 범위 [first, last) 회차"""
+
+    __slots__ = ('series', 'first', 'last', 'dates', 'rows', 'skipped')
+
+    def __init__(self, series: BookingSeries, first: int, last: int, dates: List[Tuple[int, date]]):
+        self.series = series
+        self.first = first
+        self.last = last
+        self.dates = dates
+        self.rows: List[Dict] = []
+        self.skipped: List[Dict] = []
+
+
+def _plan(series: BookingSeries, until: date, today: date) -> Optional[_Plan]:
+    index = series.generated
+    dates = []
+    while not series.finished(index) and series.occurrence_date(index) <= until:
+        day = series.occurrence_date(index)
+        # 오랫동안 생성되지 않아 지나간 회차는 만들지 않음
+        if day >= today:
+            dates.append((index, day))
+        index += 1
+    if index == series.generated:
+        return None
+    return _Plan(series, series.generated, index, dates)
+
+
+def _check_conflicts(plans: List[_Plan]):
+    """모든 회차를 직원 일정과 한 번에 비교 - (직원, 날짜) 일정은 한 번의 쿼리로 조회
+
+    같은 배치의 다른 반복 예약 회차와 겹치는 것도 건너뛴다.
+    """
+    staff_ids = sorted({plan.series.staff_id for plan in plans if plan.dates})
+    days = sorted({day for plan in plans for _, day in plan.dates})
+    if not days:
+        return
+    schedules = availability_index.schedules(staff_ids, days, fresh=True)
+    accepted: Dict[Tuple[int, date], List[Tuple[int, int]]] = {}
+    for plan in plans:
+        series = plan.series
+        staff = reference_cache.staff_by_id(series.staff_id)
+        service = reference_cache.service_by_id(series.service_id)
+        duration = (service.duration if service else None) or DEFAULT_DURATION
+        start = parse_minutes(series.time)
+        end = start + duration
+        for _, day in plan.dates:
+            key = (series.staff_id, day)
+            if staff and not works_on(staff, day):
+                plan.skipped.append(_skip(day, 'Staff not working'))
+                continue
+            conflict_id = schedules[key].conflict(start, end)
+            if conflict_id:
+                plan.skipped.append(_skip(day, 'Time slot not available', conflict_id))
+                continue
+            if any(other_start < end and start < other_end for other_start, other_end in accepted.get(key, ())):
+                plan.skipped.append(_skip(day, 'Time slot not available'))
+                continue
+            accepted.setdefault(key, []).append((start, end))
+            plan.rows.append({
+                'customer_id': series.customer_id,
+                'pet_id': series.pet_id,
+                'service_id': series.service_id,
+                'staff_id': series.staff_id,
+                'date': day,
+                'time': format_minutes(start),
+                'duration': duration,
+                'price': series.price,
+                'status': 'confirmed',
+                'notes': series.notes or '',
+                'series_id': series.id,
+            })
+
+
+def _claim(plan: _Plan) -> bool:
+    """UPDATE ... SET generated = :last WHERE id = :id AND generated = :first
+
+    다른 워커가 같은 회차를 먼저 생성했으면 영향받은 행이 없으므로 건너뛴다.
+    """
+    skipped = (plan.series.skipped_list() + plan.skipped)[-MAX_SKIPPED:]
+    result = db.session.execute(
+        series_table.update()
+        .where(series_table.c.id == plan.series.id, series_table.c.generated == plan.first,
+               series_table.c.status == 'active')
+        .values(generated=plan.last, skipped=json.dumps(skipped, ensure_ascii=False) if skipped else None)
+    )
+    return result.rowcount == 1
+
+
+def _materialize_batch(series_list: List[BookingSeries], until: date, today: date) -> Dict:
+    plans = [plan for plan in (_plan(series, until, today) for series in series_list) if plan]
+    if not plans:
+        return {'series': 0, 'created': 0, 'skipped': 0}
+    _check_conflicts(plans)
+    plans = [plan for plan in plans if _claim(plan)]
+    mappings = [row for plan in plans for row in plan.rows]
+    if mappings:
+        # mapper 이벤트를 거치지 않는 executemany INSERT - 통계/변경 피드/캐시는 직접 반영
+        db.session.execute(insert(Booking), mappings)
+        apply_inserted(db.session.connection(), mappings)
+        record_reload(db.session.connection())
+    mark_changed(db.session, 'bookings', 'stats')
+    keys = {(row['staff_id'], row['date']) for row in mappings}
+    db.session.commit()
+    availability_index.invalidate(keys)
+    return {
+        'series': len(plans),
+        'created': len(mappings),
+        'skipped': sum(len(plan.skipped) for plan in plans),
+        'skipped_dates': [item for plan in plans for item in plan.skipped],
+    }
+
+
+def materialize_series(series_ids: Optional[Iterable[int]] = None, until: Optional[date] = None) -> Dict:
+    """활성 반복 예약의 회차를 until(기본 오늘 + HORIZON_DAYS)까지 예약으로 생성
+
+    BATCH_SIZE 개씩 한 트랜잭션으로 처리한다. 다른 요청이 먼저 만든 겹치는 예약이
+    DB 트리거에 걸리면 해당 배치는 롤백되고 다음 실행 때 다시 시도한다
+    (롤백된 배치 수는 'failed' 로 반환).
+    """
+    today = date.today()
+    until = until or horizon_end(today)
+    query = BookingSeries.query.filter(BookingSeries.status == 'active').order_by(BookingSeries.id)
+    if series_ids is not None:
+        query = query.filter(BookingSeries.id.in_(list(series_ids)))
+    # 다음 회차가 until 이후인 반복 예약도 포함되지만 _plan 에서 바로 제외된다
+    due = query.all()
+    totals = {'series': 0, 'created': 0, 'skipped': 0, 'failed': 0, 'skipped_dates': []}
+    for offset in range(0, len(due), BATCH_SIZE):
+        try:
+            result = _materialize_batch(due[offset:offset + BATCH_SIZE], until, today)
+        except IntegrityError as e:
+            db.session.rollback()
+            if not is_overlap_error(e):
+                raise
+            logger.warning(f"Series materialization batch rolled back by a concurrent booking: {str(e)}")
+            totals['failed'] += 1
+            continue
+        for key in ('series', 'created', 'skipped'):
+            totals[key] += result[key]
+        totals['skipped_dates'].extend(result.get('skipped_dates', ()))
+    if totals['created'] or totals['skipped']:
+        logger.info(f"Materialized {totals['created']} series bookings "
+                    f"({totals['skipped']} skipped) for {totals['series']} series through {until}")
+    return totals
+
+
+class SeriesHorizon:
+    """오늘 기준 horizon 까지 회차를 채우는 워커별 백그라운드 스레드
+
+    조회 요청의 세션/응답 시간과 분리하기 위해 요청 처리 중에는 생성하지 않는다.
+    horizon 이 이미 채워졌으면 DB 를 조회하지 않으며, 롤백된 배치가 있으면 채워진
+    것으로 보지 않고 다음 주기에 다시 시도한다. 새 반복 예약은 생성 요청에서 바로 채운다.
+    """
+
+    def __init__(self, interval: float = CHECK_INTERVAL):
+        self.interval = interval
+        self._through: Optional[date] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def reset(self):
+        with self._lock:
+            self._through = None
+
+    def ensure(self) -> bool:
+        """horizon 까지 채워졌으면 True (앱 컨텍스트 안에서 호출)"""
+        if not _enabled:
+            return True
+        target = horizon_end()
+        if self._through is not None and self._through >= target:
+            return True
+        with self._lock:
+            try:
+                result = materialize_series(until=target)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Series materialization failed: {str(e)}")
+                return False
+            if result['failed']:
+                return False
+            self._through = target
+            return True
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, app):
+        """워커별로 한 번 시작 (첫 요청에서 호출 - CLI/마이그레이션에서는 실행되지 않음)"""
+        if self.running or not _enabled:
+            return
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(app,), name='series-horizon', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, app):
+        while not self._stop.is_set():
+            # 요청과 섞이지 않도록 자체 앱 컨텍스트(= 별도 세션)에서 실행
+            with app.app_context():
+                try:
+                    self.ensure()
+                finally:
+                    db.session.remove()
+            self._stop.wait(self.interval)
+
+
+series_horizon = SeriesHorizon()
+
+
+def init_booking_series() -> bool:
+    """반복 예약 테이블이 있으면 요청 처리 중 회차 생성 사용"""
+    global _enabled
+    _enabled = inspect(db.engine).has_table(BookingSeries.__tablename__)
+    if not _enabled:
+        logger.warning("booking_series table missing, recurring bookings are disabled")
+    series_horizon.reset()
+    return _enabled
+
+
+def series_enabled() -> bool:
+    return _enabled
+
+
+def _parse_date(value, field: str) -> Optional[date]:
+    if value in (None, ''):
+        return None
+    try:
+        return datetime.strptime(str(value), '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f'Invalid {field}: {value} (use YYYY-MM-DD)')
+
+
+def _parse_int(value, field: str, low: int, high: int) -> Optional[int]:
+    if value in (None, ''):
+        return None
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid {field}: {value}')
+    if not low <= number <= high:
+        raise ValueError(f'{field} must be between {low} and {high}')
+    return number
+
+
+def create_series(customer_id: int, pet_id: int, service, staff, data: Dict) -> Tuple[BookingSeries, Dict]:
+    """반복 예약 규칙 저장 + horizon 안의 회차 생성 (한 트랜잭션)
+
+    data: date, time, intervalWeeks, occurrences 또는 endDate, price, notes
+    """
+    start_date = _parse_date(data.get('date'), 'date')
+    if start_date < date.today():
+        raise ValueError('Series start date is in the past')
+    start = parse_minutes(str(data['time']))
+    interval = _parse_int(data.get('intervalWeeks'), 'intervalWeeks', 1, MAX_INTERVAL_WEEKS)
+    if interval is None:
+        raise ValueError('Missing required field: intervalWeeks')
+    occurrences = _parse_int(data.get('occurrences'), 'occurrences', 1, MAX_OCCURRENCES)
+    end_date = _parse_date(data.get('endDate'), 'endDate')
+    if end_date and end_date < start_date:
+        raise ValueError('endDate must not be before date')
+    price = data.get('price')
+    series = BookingSeries(
+        customer_id=customer_id,
+        pet_id=pet_id,
+        service_id=service.id,
+        staff_id=staff.id,
+        start_date=start_date,
+        time=format_minutes(start),
+        interval_weeks=interval,
+        occurrences=occurrences,
+        end_date=end_date,
+        price=int(price) if price not in (None, '') else service.base_price,
+        notes=data.get('notes', ''),
+        status='active',
+        generated=0,
+    )
+    db.session.add(series)
+    db.session.flush()
+    today = date.today()
+    result = _materialize_batch([series], horizon_end(today), today)
+    db.session.refresh(series)
+    return series, result
+
+
+def cancel_series(series: BookingSeries, from_date: date) -> int:
+    """from_date 이후 회차 예약 취소 + 규칙 종료 (취소한 예약 수)
+
+    취소할 회차는 horizon 안의 것뿐이므로 ORM 으로 수정한다 (통계/변경 피드/캐시 이벤트 그대로).
+    """
+    bookings = Booking.query.filter(
+        series_id_column == series.id,
+        Booking.date >= from_date,
+        db.or_(Booking.status.is_(None), Booking.status.notin_(INACTIVE_STATUSES))
+    ).all()
+    for booking in bookings:
+        booking.status = 'cancelled'
+        booking.updated_at = datetime.utcnow()
+    series.status = 'cancelled'
+    if from_date > series.start_date and (series.end_date is None or series.end_date >= from_date):
+        series.end_date = from_date - timedelta(days=1)
+    db.session.commit()
+    return len(bookings)
+
+
+def install_booking_series(connection):
+    """반복 예약 테이블 + 기존 bookings 에 series_id 컬럼/인덱스 추가"""
+    series_table.create(connection, checkfirst=True)
+    columns = {column['name'] for column in inspect(connection).get_columns(Booking.__tablename__)}
+    if 'series_id' not in columns:
+        connection.exec_driver_sql('ALTER TABLE bookings ADD COLUMN series_id INTEGER REFERENCES booking_series(id)')
+    SERIES_BOOKING_INDEX.create(connection, checkfirst=True)
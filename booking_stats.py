@@ -0,0 +1,254 @@
+import logging
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, inspect
+
+from src.models.booking import db, Booking
+from src.reference_cache import reference_cache
+
+logger = logging.getLogger(__name__)
+
+# 매출에 포함되는 예약 상태 (기존 일일 통계와 동일)
+REVENUE_STATUSES = ('confirmed', 'completed')
+COUNTED_STATUSES = ('confirmed', 'pending', 'completed')
+GROUP_BY = ('day', 'week', 'month', 'staff', 'service')
+
+_enabled = False
+
+
+class BookingDailyStat(db.Model):
+    """(날짜, 직원, 서비스, 상태)별 예약 수/금액 요약 - 예약 변경과 같은 트랜잭션에서 증감"""
+    __tablename__ = 'booking_daily_stats'
+
+    date = db.Column(db.Date, primary_key=True)
+    staff_id = db.Column(db.Integer, primary_key=True)
+    service_id = db.Column(db.Integer, primary_key=True)
+    status = db.Column(db.String(20), primary_key=True)
+    booking_count = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Integer, nullable=False, default=0)
+
+
+stats_table = BookingDailyStat.__table__
+
+
+KEY_COLUMNS = ('date', 'staff_id', 'service_id', 'status')
+
+
+def _key_condition():
+    return db.and_(*[stats_table.c[name] == db.bindparam(f'k_{name}') for name in KEY_COLUMNS])
+
+
+def _apply_deltas(connection, deltas: List[Dict]):
+    """요약 행에 증감 적용 (없으면 생성, 0건이 되면 삭제) - 여러 키를 executemany 한 번으로 처리
+
+    deltas: [{'date', 'staff_id', 'service_id', 'status', 'booking_count', 'revenue'}, ...]
+    """
+    if not deltas:
+        return
+    dialect = connection.dialect.name
+    if dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        statement = insert(stats_table)
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=list(KEY_COLUMNS),
+            set_={
+                'booking_count': stats_table.c.booking_count + statement.excluded.booking_count,
+                'revenue': stats_table.c.revenue + statement.excluded.revenue,
+            }
+        ), deltas)
+    else:
+        for delta in deltas:
+            params = {f'k_{name}': delta[name] for name in KEY_COLUMNS}
+            updated = connection.execute(stats_table.update().where(_key_condition()).values(
+                booking_count=stats_table.c.booking_count + delta['booking_count'],
+                revenue=stats_table.c.revenue + delta['revenue']
+            ), params).rowcount
+            if not updated:
+                connection.execute(stats_table.insert(), delta)
+    removed = [{f'k_{name}': delta[name] for name in KEY_COLUMNS} for delta in deltas if delta['booking_count'] < 0]
+    if removed:
+        connection.execute(stats_table.delete().where(_key_condition(), stats_table.c.booking_count <= 0), removed)
+
+
+def _delta(key: Dict, count: int, revenue: int) -> Dict:
+    return dict(key, booking_count=count, revenue=revenue)
+
+
+def _key(day, staff_id, service_id, status) -> Dict:
+    return {'date': day, 'staff_id': staff_id, 'service_id': service_id, 'status': status or ''}
+
+
+def _previous(state, name: str):
+    history = state.attrs[name].history
+    return history.deleted[0] if history.deleted else getattr(state.object, name)
+
+
+@event.listens_for(Booking, 'after_insert')
+def _booking_inserted(mapper, connection, booking):
+    if _enabled:
+        key = _key(booking.date, booking.staff_id, booking.service_id, booking.status)
+        _apply_deltas(connection, [_delta(key, 1, booking.price or 0)])
+
+
+@event.listens_for(Booking, 'after_update')
+def _booking_updated(mapper, connection, booking):
+    if not _enabled:
+        return
+    state = inspect(booking)
+    old = _key(*[_previous(state, name) for name in ('date', 'staff_id', 'service_id', 'status')])
+    new = _key(booking.date, booking.staff_id, booking.service_id, booking.status)
+    old_price, new_price = _previous(state, 'price') or 0, booking.price or 0
+    if old == new and old_price == new_price:
+        return
+    _apply_deltas(connection, [_delta(old, -1, -old_price), _delta(new, 1, new_price)])
+
+
+@event.listens_for(Booking, 'after_delete')
+def _booking_deleted(mapper, connection, booking):
+    if _enabled:
+        state = inspect(booking)
+        old = _key(*[_previous(state, name) for name in ('date', 'staff_id', 'service_id', 'status')])
+        _apply_deltas(connection, [_delta(old, -1, -(_previous(state, 'price') or 0))])
+
+
+def apply_inserted(connection, rows: List[Dict]):
+    """core insert 로 추가한 예약 행을 요약 테이블에 반영 (mapper 이벤트를 거치지 않는 bulk insert 용)"""
+    if not _enabled:
+        return
+    deltas: Dict = {}
+    for row in rows:
+        key = (row['date'], row['staff_id'], row['service_id'], row.get('status') or '')
+        count, revenue = deltas.get(key, (0, 0))
+        deltas[key] = (count + 1, revenue + (row.get('price') or 0))
+    _apply_deltas(connection, [_delta(_key(*key), count, revenue) for key, (count, revenue) in deltas.items()])
+
+
+def init_daily_stats() -> bool:
+    """요약 테이블이 있으면 증분 갱신/요약 조회 사용 (없으면 bookings 를 직접 GROUP BY)"""
+    global _enabled
+    _enabled = inspect(db.engine).has_table(BookingDailyStat.__tablename__)
+    if not _enabled:
+        logger.warning("booking_daily_stats table missing, statistics are computed from bookings")
+    return _enabled
+
+
+def rebuild_daily_stats(connection, start: Optional[date] = None, end: Optional[date] = None):
+    """bookings 를 GROUP BY 하여 요약 테이블 재계산 (bulk insert 이후, 마이그레이션 백필)"""
+    stats_range = []
+    bookings_range = []
+    if start:
+        stats_range.append(stats_table.c.date >= start)
+        bookings_range.append(Booking.date >= start)
+    if end:
+        stats_range.append(stats_table.c.date <= end)
+        bookings_range.append(Booking.date <= end)
+
+    connection.execute(stats_table.delete().where(*stats_range))
+    status = db.func.coalesce(Booking.status, '')
+    summary = (
+        db.select(Booking.date, Booking.staff_id, Booking.service_id, status,
+                  db.func.count(Booking.id), db.func.sum(db.func.coalesce(Booking.price, 0)))
+        .where(*bookings_range)
+        .group_by(Booking.date, Booking.staff_id, Booking.service_id, status)
+    )
+    connection.execute(stats_table.insert().from_select(
+        ['date', 'staff_id', 'service_id', 'status', 'booking_count', 'revenue'], summary
+    ))
+
+
+def _aggregate(start: date, end: date, key: Optional[str]):
+    """기간 내 (key, status)별 건수/금액 - 요약 테이블 또는 bookings 에서 GROUP BY"""
+    if _enabled:
+        source = BookingDailyStat
+        count, revenue = db.func.sum(source.booking_count), db.func.sum(source.revenue)
+    else:
+        source = Booking
+        count, revenue = db.func.count(Booking.id), db.func.sum(db.func.coalesce(Booking.price, 0))
+    columns = [getattr(source, key)] if key else []
+    return (
+        db.session.query(*columns, source.status, count, revenue)
+        .filter(source.date >= start, source.date <= end)
+        .group_by(*columns, source.status)
+        .all()
+    )
+
+
+def _empty_bucket() -> Dict:
+    return {
+        'total_bookings': 0,
+        'confirmed_bookings': 0,
+        'pending_bookings': 0,
+        'completed_bookings': 0,
+        'total_revenue': 0,
+    }
+
+
+def _add(bucket: Dict, status: Optional[str], count: int, revenue: int):
+    bucket['total_bookings'] += count
+    if status in COUNTED_STATUSES:
+        bucket[f'{status}_bookings'] += count
+    if status in REVENUE_STATUSES:
+        bucket['total_revenue'] += revenue or 0
+
+
+def daily_stats(day: date) -> Dict:
+    """하루 통계 (기존 /stats/daily 응답 형식)"""
+    bucket = _empty_bucket()
+    for status, count, revenue in _aggregate(day, day, None):
+        _add(bucket, status, count, revenue)
+    return bucket
+
+
+def _bucket_key(group_by: str, value) -> str:
+    if group_by == 'week':
+        return (value - timedelta(days=value.weekday())).strftime('%Y-%m-%d')
+    if group_by == 'month':
+        return value.strftime('%Y-%m')
+    return value.strftime('%Y-%m-%d')
+
+
+def range_stats(start: date, end: date, group_by: str = 'day') -> Dict:
+    """기간 통계 - 전체 합계 + 일/주(월요일 시작)/월/직원/서비스별 구간"""
+    if group_by not in GROUP_BY:
+        raise ValueError(f"group_by must be one of: {', '.join(GROUP_BY)}")
+    if end < start:
+        raise ValueError('end must not be before start')
+
+    key = {'staff': 'staff_id', 'service': 'service_id'}.get(group_by, 'date')
+    totals = _empty_bucket()
+    buckets: Dict = {}
+    for value, status, count, revenue in sorted(_aggregate(start, end, key), key=lambda row: row[0]):
+        if group_by == 'staff':
+            staff = reference_cache.staff_by_id(value)
+            bucket_id = (value, staff.name if staff else None)
+        elif group_by == 'service':
+            service = reference_cache.service_by_id(value)
+            bucket_id = (value, service.name if service else None)
+        else:
+            bucket_id = _bucket_key(group_by, value)
+        bucket = buckets.setdefault(bucket_id, _empty_bucket())
+        _add(bucket, status, count, revenue)
+        _add(totals, status, count, revenue)
+
+    items: List[Dict] = []
+    for bucket_id, bucket in buckets.items():
+        if group_by == 'staff':
+            label = {'staff_id': bucket_id[0], 'staff': bucket_id[1]}
+        elif group_by == 'service':
+            label = {'service_id': bucket_id[0], 'service_type': bucket_id[1]}
+        else:
+            label = {group_by: bucket_id}
+        label.update(bucket)
+        items.append(label)
+
+    return {
+        'start': start.strftime('%Y-%m-%d'),
+        'end': end.strftime('%Y-%m-%d'),
+        'group_by': group_by,
+        'totals': totals,
+        'buckets': items,
+    }
@@ -0,0 +1,128 @@
+import os
+import time
+import bisect
+import logging
+import threading
+from typing import Dict, Optional
+
+from flask import g, request
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 시작 시각 (벽시계 / 단조 시계)
+STARTED_AT = time.time()
+_STARTED_MONOTONIC = time.monotonic()
+
+# 기존 `date` 명령어 출력과 같은 형식
+TIMESTAMP_FORMAT = '%a %b %d %H:%M:%S %Z %Y'
+
+# (초, 포맷된 문자열) - 튜플 하나로 교체하여 스레드 간 일관성 유지
+_cached = (None, '')
+
+
+def timestamp() -> str:
+    """응답용 타임스탬프 (프로세스 내에서 계산, 초 단위로 캐시)"""
+    global _cached
+    now = int(time.time())
+    second, formatted = _cached
+    if now != second:
+        formatted = time.strftime(TIMESTAMP_FORMAT, time.localtime(now))
+        _cached = (now, formatted)
+    return formatted
+
+
+def uptime() -> float:
+    """프로세스 가동 시간 (초)"""
+    return time.monotonic() - _STARTED_MONOTONIC
+
+
+def elapsed_ms() -> float:
+    """현재 요청 시작 후 경과 시간 (밀리초)"""
+    start = g.get('_request_started')
+    if start is None:
+        return 0.0
+    return (time.perf_counter() - start) * 1000
+
+
+# 이보다 오래 걸린 요청은 경고 로그 (0 이면 기록하지 않음)
+SLOW_REQUEST_MS = float(os.environ.get('SLOW_REQUEST_MS', 1000))
+
+# 백분위 추정용 지연 구간 상한 (밀리초)
+LATENCY_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class RequestStats:
+    """블루프린트별 요청 수/오류 수/처리 시간 집계 (프로세스 단위, 구간 히스토그램으로 p50/p95 추정)"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._stats: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, duration_ms: float, status: int):
+        bucket = bisect.bisect_left(self.buckets, duration_ms)
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                                             'histogram': [0] * (len(self.buckets) + 1)}
+            stats['count'] += 1
+            stats['errors'] += status >= 500
+            stats['total_ms'] += duration_ms
+            stats['max_ms'] = max(stats['max_ms'], duration_ms)
+            stats['histogram'][bucket] += 1
+
+    def _percentile(self, stats: Dict, fraction: float) -> float:
+        """해당 백분위가 속한 구간의 상한 (최대값을 넘지 않음)"""
+        target = stats['count'] * fraction
+        seen = 0
+        for index, value in enumerate(stats['histogram']):
+            seen += value
+            if seen >= target and index < len(self.buckets):
+                return round(min(float(self.buckets[index]), stats['max_ms']), 2)
+        return round(stats['max_ms'], 2)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            items = [(name, dict(stats, histogram=list(stats['histogram']))) for name, stats in self._stats.items()]
+        result = {}
+        for name, stats in sorted(items):
+            count = stats['count']
+            result[name] = {
+                'count': count,
+                'errors': stats['errors'],
+                'avg_ms': round(stats['total_ms'] / count, 2),
+                'max_ms': round(stats['max_ms'], 2),
+                'p50_ms': self._percentile(stats, 0.50),
+                'p95_ms': self._percentile(stats, 0.95),
+            }
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+request_stats = RequestStats()
+
+
+def init_request_timer(app, header: str = 'Server-Timing', stats: Optional[RequestStats] = None):
+    """요청별 서버 처리 시간을 응답 헤더로 보고하고 블루프린트별로 집계하는 타이머 등록"""
+    stats = stats or request_stats
+
+    @app.before_request
+    def _start_request_timer():
+        g._request_started = time.perf_counter()
+
+    @app.after_request
+    def _report_request_timer(response):
+        duration = elapsed_ms()
+        name = request.blueprint or 'app'
+        response.headers.add(header, f'app;dur={duration:.2f};desc="{name}"')
+        response.headers['X-Response-Time'] = f'{duration:.2f}ms'
+        stats.record(name, duration, response.status_code)
+        if SLOW_REQUEST_MS and duration > SLOW_REQUEST_MS:
+            logger.warning(f"Slow request {request.method} {request.path} [{name}] {duration:.0f}ms")
+        return response
+
+    return app
@@ -0,0 +1,189 @@
+import os
+import json
+import time
+import logging
+import threading
+from typing import Dict, Any, List, NamedTuple, Optional
+
+from src.command_policy import CommandPolicy
+
+logger = logging.getLogger(__name__)
+
+# 셸 연산자(구분자/리다이렉션) 토큰 문자 - 템플릿 인자({name}, {name*})로는 캡처하지 않음
+OPERATOR_CHARS = frozenset(';&|<>\n')
+
+
+def _is_operator(token: str) -> bool:
+    return bool(token) and all(char in OPERATOR_CHARS for char in token)
+
+
+class AllowlistMatch(NamedTuple):
+    """허용 목록 매칭 결과"""
+    category: str
+    template: str
+    params: Dict[str, Any]
+
+
+class _Node:
+    # 인자 자식 노드는 같은 위치의 모든 템플릿이 공유하므로 인자 이름은 노드가 아니라
+    # 종단 매칭 (카테고리, 템플릿, 인자 이름들[, 가변 인자 이름]) 에 저장한다
+    __slots__ = ('children', 'param', 'rest_match', 'match')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.param: Optional['_Node'] = None
+        self.rest_match: Optional[tuple] = None
+        self.match: Optional[tuple] = None
+
+
+def _compile_trie(policy: Dict[str, List[str]]) -> _Node:
+    """{카테고리: [템플릿]} 을 argv 토큰 트라이로 컴파일
+
+    템플릿 문법:
+      - 일반 토큰은 그대로 일치해야 함 ('systemctl', '-t')
+      - {name}   : 임의의 토큰 하나
+      - {name*}  : 남은 토큰 전부 (0개 이상, 템플릿 마지막에만 사용)
+    인자는 '>', '>>', '<', '|' 같은 셸 연산자 토큰과는 일치하지 않는다.
+    """
+    root = _Node()
+    for category, templates in policy.items():
+        for template in templates:
+            node = root
+            names = []
+            tokens = CommandPolicy._tokenize(template)
+            for position, token in enumerate(tokens):
+                if token.startswith('{') and token.endswith('}'):
+                    name = token[1:-1]
+                    if name.endswith('*'):
+                        if position != len(tokens) - 1:
+                            raise ValueError(f'가변 인자는 템플릿 마지막에만 올 수 있습니다: {template}')
+                        node.rest_match = (category, template, tuple(names), name[:-1] or 'args')
+                        break
+                    if node.param is None:
+                        node.param = _Node()
+                    names.append(name)
+                    node = node.param
+                else:
+                    node = node.children.setdefault(token, _Node())
+            else:
+                node.match = (category, template, tuple(names))
+    return root
+
+
+class CommandAllowlist:
+    """argv 트라이 기반 명령어 허용 목록
+
+    조회는 템플릿 수와 무관하게 argv 길이에 비례한다. policy_file 을 지정하면
+    파일이 바뀔 때 재시작 없이 다시 읽어들인다 (check_interval 초마다 mtime 확인).
+    """
+
+    def __init__(self, policy: Optional[Dict[str, List[str]]] = None,
+                 policy_file: Optional[str] = None, check_interval: float = 2.0):
+        self.policy_file = policy_file
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._next_check = 0.0
+        self._load(dict(policy or {}))
+        if policy_file:
+            self.reload_if_changed(force=True)
+
+    @property
+    def categories(self) -> List[str]:
+        return sorted(self._policy.keys())
+
+    def _load(self, policy: Dict[str, List[str]]):
+        root = _compile_trie(policy)
+        # 트라이 전체를 한 번에 교체하여 조회 중인 스레드에 영향이 없도록 함
+        self._root, self._policy = root, policy
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """정책 파일이 바뀌었으면 다시 로드"""
+        if not self.policy_file:
+            return False
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+        with self._lock:
+            self._next_check = now + self.check_interval
+            try:
+                mtime = os.stat(self.policy_file).st_mtime
+            except OSError:
+                return False
+            if not force and mtime == self._mtime:
+                return False
+            try:
+                with open(self.policy_file, 'r', encoding='utf-8') as f:
+                    policy = json.load(f)
+                self._load(policy)
+                self._mtime = mtime
+                logger.info(f"Command allowlist loaded: {self.policy_file} ({len(policy)} categories)")
+                return True
+            except (OSError, ValueError) as e:
+                # 잘못된 파일이면 기존 정책 유지
+                self._mtime = mtime
+                logger.error(f"Command allowlist reload failed: {str(e)}")
+                return False
+
+    def match(self, command: str) -> Optional[AllowlistMatch]:
+        """명령어의 모든 세그먼트가 허용 템플릿과 일치하면 첫 세그먼트의 결과 반환"""
+        self.reload_if_changed()
+        try:
+            tokens = CommandPolicy._tokenize(command)
+        except ValueError:
+            return None
+
+        first = None
+        for segment, _ in CommandPolicy._split_segments(tokens):
+            result = self.match_argv(segment)
+            if result is None:
+                return None
+            first = first or result
+        return first
+
+    def match_argv(self, argv: List[str]) -> Optional[AllowlistMatch]:
+        """argv 하나를 트라이에서 조회"""
+        if not argv:
+            return None
+        found = self._walk(self._root, argv, 0, ())
+        if found is None:
+            return None
+        match, values, rest = found
+        category, template, names = match[:3]
+        params = dict(zip(names, values))
+        if rest is not None:
+            params[match[3]] = rest
+        return AllowlistMatch(category, template, params)
+
+    def _walk(self, node: _Node, argv: List[str], position: int, values: tuple):
+        """(종단 매칭, 캡처한 단일 인자 값들, 가변 인자 값 또는 None) 또는 None
+
+        값은 위치 순서대로만 모으고 이름은 매칭된 템플릿에서 붙이므로, 같은 인자 노드를
+        공유하는 다른 템플릿의 이름이 섞이지 않는다. 실패한 분기의 값도 남지 않는다.
+        """
+        # 일반 토큰 > 단일 인자 > 가변 인자 순으로 우선 매칭
+        while True:
+            if position == len(argv):
+                if node.match:
+                    return node.match, values, None
+                if node.rest_match:
+                    return node.rest_match, values, []
+                return None
+            token = argv[position]
+            child = node.children.get(token)
+            if child is not None and node.param is None and node.rest_match is None:
+                node, position = child, position + 1
+                continue
+            break
+
+        if child is not None:
+            found = self._walk(child, argv, position + 1, values)
+            if found:
+                return found
+        if node.param is not None and not _is_operator(token):
+            found = self._walk(node.param, argv, position + 1, values + (token,))
+            if found:
+                return found
+        if node.rest_match and not any(_is_operator(arg) for arg in argv[position:]):
+            return node.rest_match, values, argv[position:]
+        return None
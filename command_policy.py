@@ -0,0 +1,263 @@
+import os
+import re
+import shlex
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional
+
+# 위험 명령어 규칙 (규칙 이름 -> 정규화된 argv 문자열에 대한 패턴)
+# 패턴은 세그먼트 시작에서만 매칭되므로 'echo format' 같은 인자는 차단되지 않는다.
+DANGEROUS_RULES = [
+    ('rm_recursive_force', r'rm\b(?=.*\s-(?:-recursive\b|[a-z]*r))(?=.*\s-(?:-force\b|[a-z]*f))'),
+    ('sudo_rm', r'sudo\s+rm\b'),
+    ('power_control', r'(?:reboot|shutdown|halt|poweroff)\b'),
+    ('runlevel_change', r'init\s+[06]\b'),
+    ('account_change', r'(?:passwd|su)(?:\s|$)'),
+    ('filesystem_format', r'(?:mkfs(?:\.\w+)?|fdisk|format)\b'),
+    ('raw_disk_copy', r'dd\b.*\bif='),
+    ('mass_delete', r'del\b.*\*'),
+    ('process_kill', r'(?:killall\b|pkill\b.*\s-(?:9|kill)\b)'),
+    ('root_permission', r'chmod\b(?:\s+-\S+)*\s+777\s+/'),
+    ('recursive_chown', r'chown\b.*\s-[a-z]*R'),
+    ('find_delete', r'find\b.*\s(?:-delete\b|-(?:exec|execdir|ok|okdir)\s+(?:\S*/)?(?:rm|shred|unlink)\b)'),
+]
+
+# 뒤따르는 명령을 실행하는 래퍼 -> 값을 인자로 받는 옵션
+# (sudo 는 별도 처리, timeout 은 옵션 뒤의 시간 인자 하나를 더 건너뜀)
+WRAPPER_ARG_OPTIONS = {
+    'nohup': frozenset(),
+    'exec': frozenset(['-a']),
+    'time': frozenset(['-f', '-o', '--format', '--output']),
+    'env': frozenset(['-u', '-C', '--unset', '--chdir']),
+    'xargs': frozenset(['-I', '-n', '-P', '-d', '-L', '-s', '-E', '-a', '--max-args', '--max-procs',
+                        '--delimiter', '--max-lines', '--max-chars', '--arg-file', '--replace']),
+    'nice': frozenset(['-n', '--adjustment']),
+    'timeout': frozenset(['-s', '-k', '--signal', '--kill-after']),
+    'stdbuf': frozenset(['-i', '-o', '-e', '--input', '--output', '--error']),
+}
+
+# 명령 없이 실행하면 root 셸을 여는 sudo 옵션
+SUDO_SHELL_OPTIONS = frozenset(['-i', '-s', '--login', '--shell'])
+
+# 파이프로 입력을 받으면 안 되는 셸 프로그램
+SHELL_PROGRAMS = frozenset(['sh', 'bash', 'zsh', 'dash', 'ksh'])
+# 파일 내용을 현재 셸에서 실행하는 내장 명령
+SOURCE_PROGRAMS = frozenset(['source', '.'])
+
+# 값을 인자로 받는 sudo 옵션
+SUDO_ARG_OPTIONS = frozenset(['-u', '-g', '-C', '-h', '-p', '-r', '-t', '-U'])
+
+# 쓰기 리다이렉션이 허용되는 장치 파일
+SAFE_DEVICES = frozenset(['/dev/null', '/dev/stdout', '/dev/stderr'])
+
+# 명령어 구분 연산자와 리다이렉션 연산자
+SEPARATORS = frozenset([';', '&&', '||', '|', '&', '\n'])
+REDIRECTIONS = frozenset(['>', '>>', '>|', '&>', '&>>'])
+
+SUBSTITUTION_PATTERN = re.compile(r'\$\(([^()]*)\)|`([^`]*)`')
+# 프로세스 치환 <(...) / >(...) - 셸은 이를 /dev/fd/N 경로 인자로 넘김
+PROCESS_SUBSTITUTION_PATTERN = re.compile(r'[<>]\(([^()]*)\)')
+PROCESS_SUBSTITUTION_PATH = '/dev/fd/63'
+ASSIGNMENT_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*=')
+
+
+class PolicyVerdict(NamedTuple):
+    """명령어 검사 결과"""
+    allowed: bool
+    reason: str
+    rule: Optional[str] = None
+
+
+class CommandPolicy:
+    """컴파일된 명령어 안전성 정책
+
+    규칙은 생성 시 한 번만 하나의 정규식으로 컴파일되고, 명령어는 shlex로
+    argv 단위로 분해된 뒤 세그먼트별로 검사된다. 같은 명령어의 판정은 캐시된다.
+    """
+
+    def __init__(self, rules: Optional[List] = None, cache_size: int = 4096):
+        self.rules = list(rules if rules is not None else DANGEROUS_RULES)
+        self._pattern = self._compile(self.rules)
+        self._cached_check = lru_cache(maxsize=cache_size)(self._evaluate)
+
+    @staticmethod
+    def _compile(rules: List) -> 're.Pattern':
+        """모든 규칙을 이름 있는 그룹으로 묶어 단일 정규식으로 컴파일"""
+        alternatives = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in rules)
+        return re.compile(rf'^(?:sudo\s+)?(?:{alternatives})', re.IGNORECASE)
+
+    def check(self, command: str) -> PolicyVerdict:
+        """명령어 판정 (캐시 사용)"""
+        return self._cached_check(command.strip())
+
+    def is_safe(self, command: str) -> bool:
+        """명령어가 안전한지 여부만 반환"""
+        return self.check(command).allowed
+
+    def cache_info(self) -> Dict[str, Any]:
+        """판정 캐시 통계"""
+        info = self._cached_check.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize}
+
+    def clear_cache(self):
+        """판정 캐시 초기화"""
+        self._cached_check.cache_clear()
+
+    def _evaluate(self, command: str, depth: int = 0) -> PolicyVerdict:
+        """명령어를 argv 세그먼트로 분해하여 검사"""
+        if not command:
+            return PolicyVerdict(False, 'empty command', 'empty')
+        if depth > 3:
+            return PolicyVerdict(False, 'command nesting too deep', 'nesting')
+
+        # 명령 치환($(...), `...`)과 프로세스 치환(<(...), >(...)) 내부도 별도의 명령어로 검사
+        for match in list(SUBSTITUTION_PATTERN.finditer(command)) + list(PROCESS_SUBSTITUTION_PATTERN.finditer(command)):
+            inner = next((group for group in match.groups() if group), '').strip()
+            if inner:
+                verdict = self._evaluate(inner, depth + 1)
+                if not verdict.allowed:
+                    return verdict
+        # 프로세스 치환은 셸이 넘기는 것과 같은 /dev/fd 경로로 바꿔 argv 로 검사 ('bash <(curl ...)')
+        command = PROCESS_SUBSTITUTION_PATTERN.sub(PROCESS_SUBSTITUTION_PATH, command)
+
+        try:
+            tokens = self._tokenize(command)
+        except ValueError as e:
+            return PolicyVerdict(False, f'unparseable command: {e}', 'parse_error')
+
+        previous_separator = None
+        for index, (segment, separator) in enumerate(self._split_segments(tokens)):
+            verdict = self._check_segment(segment, index, previous_separator, depth)
+            if not verdict.allowed:
+                return verdict
+            previous_separator = separator
+
+        return PolicyVerdict(True, 'ok')
+
+    @staticmethod
+    def _tokenize(command: str) -> List[str]:
+        # 줄바꿈도 ';' 와 같은 명령어 구분자로 취급
+        lexer = shlex.shlex(command, posix=True, punctuation_chars=';&|<>\n')
+        lexer.whitespace = ' \t\r'
+        lexer.whitespace_split = True
+        lexer.commenters = ''
+        return list(lexer)
+
+    @staticmethod
+    def _split_segments(tokens: List[str]):
+        """구분 연산자 기준으로 (세그먼트 토큰, 뒤따르는 연산자) 생성"""
+        segment = []
+        previous = None
+        for token in tokens:
+            # '&&\n' 처럼 연산자와 줄바꿈이 붙은 토큰은 연산자로 취급
+            if '\n' in token and not token.strip('\n;&|'):
+                token = token.replace('\n', '') or '\n'
+                # '|', '&&', '||' 바로 뒤의 줄바꿈은 명령이 다음 줄로 이어지는 것
+                if token == '\n' and not segment and previous in ('|', '&&', '||'):
+                    continue
+            if token in SEPARATORS:
+                yield segment, token
+                segment = []
+                previous = token
+            else:
+                segment.append(token)
+        yield segment, None
+
+    @staticmethod
+    def _unwrap(argv: List[str]):
+        """nohup/exec/time/env/xargs/nice/timeout/stdbuf/sudo 를 벗겨 실제 실행될 argv 반환
+
+        반환값: (argv, sudo 사용 여부, 명령 없는 sudo -i/-s 여부)
+        """
+        sudo = False
+        root_shell = False
+        while argv:
+            program = os.path.basename(argv[0])
+            if program == 'sudo':
+                options = SUDO_ARG_OPTIONS
+            elif program in WRAPPER_ARG_OPTIONS:
+                options = WRAPPER_ARG_OPTIONS[program]
+            else:
+                break
+            argv = argv[1:]
+            while argv and argv[0].startswith('-') and argv[0] != '-':
+                option = argv.pop(0)
+                if option == '--':
+                    break
+                if program == 'sudo' and option in SUDO_SHELL_OPTIONS:
+                    root_shell = True
+                if option in options and argv:
+                    argv.pop(0)
+            if program == 'sudo':
+                sudo = True
+            elif program == 'env':
+                while argv and ASSIGNMENT_PATTERN.match(argv[0]):
+                    argv.pop(0)
+            elif program == 'timeout' and argv:
+                argv.pop(0)
+        return argv, sudo, root_shell and not argv
+
+    def _check_segment(self, tokens: List[str], index: int,
+                       previous_separator: Optional[str], depth: int) -> PolicyVerdict:
+        argv = []
+        inputs = []
+        iterator = iter(tokens)
+        for token in iterator:
+            if token in REDIRECTIONS:
+                target = next(iterator, '')
+                if target.startswith('/dev/') and target not in SAFE_DEVICES:
+                    return PolicyVerdict(False, f'write to device blocked: {target}', 'device_redirect')
+                continue
+            if token in ('<', '<<', '<<<'):
+                inputs.append(next(iterator, ''))
+                continue
+            argv.append(token)
+
+        # 앞쪽 환경변수 할당 제거 (FOO=bar cmd)
+        while argv and ASSIGNMENT_PATTERN.match(argv[0]):
+            argv.pop(0)
+        if not argv:
+            return PolicyVerdict(True, 'ok')
+
+        argv, sudo, root_shell = self._unwrap(argv)
+        if not argv:
+            if root_shell:
+                return PolicyVerdict(False, 'dangerous command blocked: root_shell', 'root_shell')
+            return PolicyVerdict(True, 'ok')
+
+        program = os.path.basename(argv[0])
+        normalized = ' '.join([program] + argv[1:])
+        if sudo:
+            normalized = 'sudo ' + normalized
+
+        match = self._pattern.match(normalized)
+        if match:
+            return PolicyVerdict(False, f'dangerous command blocked: {match.lastgroup}', match.lastgroup)
+
+        if previous_separator == '|' and program in SHELL_PROGRAMS:
+            return PolicyVerdict(False, 'piping into a shell is blocked', 'pipe_to_shell')
+        # 'bash <(curl ...)', 'source <(...)', 'sh < <(...)' - 다른 명령의 출력을 스크립트로 실행
+        if program in SHELL_PROGRAMS | SOURCE_PROGRAMS and any(
+                arg.startswith('/dev/fd/') for arg in argv[1:] + inputs):
+            return PolicyVerdict(False, 'running process substitution in a shell is blocked',
+                                 'process_substitution_shell')
+        if index > 0 and program == 'rm':
+            return PolicyVerdict(False, 'chained rm is blocked', 'chained_rm')
+
+        # sh -c "..." 형태는 내부 명령어를 다시 검사
+        if program in SHELL_PROGRAMS and '-c' in argv[1:]:
+            position = argv.index('-c')
+            if position + 1 < len(argv):
+                verdict = self._evaluate(argv[position + 1], depth + 1)
+                if not verdict.allowed:
+                    return verdict
+
+        return PolicyVerdict(True, 'ok')
+
+
+# 기본 정책 (위험 명령어 차단만 수행)
+default_policy = CommandPolicy()
+
+
+def is_safe_command(command: str) -> bool:
+    """기본 정책으로 명령어 안전성 확인"""
+    return default_policy.is_safe(command)
@@ -0,0 +1,269 @@
+import os
+import re
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import Index, event, inspect, text
+
+from src.models.booking import db, Booking, Customer, Pet
+from src.booking_search import SEARCH_TABLE, index_upserted, rebuild_search_index
+from src.booking_changes import record_reload
+from src.response_cache import mark_changed
+
+logger = logging.getLogger(__name__)
+
+# 국가 번호 없이 입력된 번호에 붙이는 기본 국가 번호 (0 으로 시작하는 국내 번호)
+DEFAULT_COUNTRY_CODE = os.environ.get('PHONE_COUNTRY_CODE', '82')
+
+NON_DIGIT = re.compile(r'\D')
+
+
+def normalize_phone(phone, country_code: str = DEFAULT_COUNTRY_CODE) -> str:
+    """전화번호 -> 비교용 E.164 형식 키
+
+    '010-1234-5678', '01012345678', '+82 10 1234 5678', '0082-10-1234-5678' -> '+821012345678'
+    국내 번호에는 국가 번호가 없으므로 앞자리 0 대신 country_code 를 붙인다.
+    """
+    raw = str(phone or '').strip()
+    digits = NON_DIGIT.sub('', raw)
+    if raw.startswith('+'):
+        key = digits
+    elif digits.startswith('00'):
+        key = digits[2:]
+    elif digits.startswith('0'):
+        key = country_code + digits[1:]
+    elif digits.startswith(country_code) and len(digits) > 10:
+        # '821012345678' 처럼 + 없이 국가 번호부터 입력한 경우
+        key = digits
+    else:
+        key = country_code + digits
+    if not 8 <= len(key) <= 15:
+        raise ValueError(f'Invalid phone number: {phone}')
+    return '+' + key
+
+
+def _phone_key_or_none(phone) -> Optional[str]:
+    try:
+        return normalize_phone(phone)
+    except ValueError:
+        return None
+
+
+def _default_phone_key(context):
+    return _phone_key_or_none(context.get_current_parameters().get('phone'))
+
+
+# 고객 조회/중복 방지 키 - 모델 파일을 바꾸지 않고 매핑에 추가 (기존 DB 는 마이그레이션 8 이 추가/백필)
+# INSERT 시 phone 으로 계산되므로 executemany INSERT(대량 적재)에도 채워진다
+phone_key_column = db.Column('phone_key', db.String(20), default=_default_phone_key)
+if 'phone_key' not in Customer.__table__.c:
+    Customer.__table__.append_column(phone_key_column)
+    Customer.__mapper__.add_property('phone_key', phone_key_column)
+
+CUSTOMER_PHONE_KEY_INDEX = Index('ux_customers_phone_key', phone_key_column, unique=True)
+# 고객별 반려동물 이름 - create_booking 의 반려동물 upsert 충돌 대상
+PET_NAME_INDEX = Index('ux_pets_customer_name', Pet.customer_id, Pet.name, unique=True)
+
+# 마이그레이션 8 이후 위 인덱스로 대체되는 인덱스
+SUPERSEDED_INDEXES = ('ux_customers_phone', 'ix_pets_customer_name')
+
+
+@event.listens_for(Customer, 'before_update')
+def _update_phone_key(mapper, connection, customer):
+    if inspect(customer).attrs.phone.history.has_changes():
+        customer.phone_key = _phone_key_or_none(customer.phone)
+
+
+def duplicate_key_field(error: Exception) -> Optional[str]:
+    """고유 키 위반 IntegrityError 의 요청 필드 이름 (해당 없으면 None)"""
+    message = str(getattr(error, 'orig', error))
+    if 'phone_key' in message:
+        return 'customerPhone'
+    if 'ux_pets_customer_name' in message or 'pets.customer_id, pets.name' in message:
+        return 'petName'
+    return None
+
+
+# ---------------------------------------------------------------------------
+# upsert
+# ---------------------------------------------------------------------------
+
+def _dialect_insert(session):
+    dialect = session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert
+
+
+def upsert_customer(name: str, phone: str, email: str = '', address: str = ''):
+    """전화번호 키로 고객 찾기 또는 생성 - INSERT ... ON CONFLICT (phone_key) 한 번
+
+    기존 고객이면 이름/전화번호는 그대로 두고 비어 있는 이메일/주소만 채운다.
+    반환값: (id, name, phone) 행
+    """
+    key = normalize_phone(phone)
+    table = Customer.__table__
+    insert = _dialect_insert(db.session)
+    if insert is None:
+        return _get_or_create_customer(key, name, phone, email, address)
+    statement = insert(table).values(name=name, phone=phone, phone_key=key, email=email, address=address)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.phone_key],
+        set_={
+            'email': db.func.coalesce(db.func.nullif(table.c.email, ''), statement.excluded.email),
+            'address': db.func.coalesce(db.func.nullif(table.c.address, ''), statement.excluded.address),
+        },
+    ).returning(table.c.id, table.c.name, table.c.phone)
+    customer = db.session.execute(statement).one()
+    index_upserted(db.session.connection(), customer=customer)
+    # mapper 이벤트를 거치지 않으므로 고객 목록 응답 캐시는 커밋 시 직접 무효화
+    mark_changed(db.session, 'customers', 'bookings')
+    return customer
+
+
+def upsert_pet(customer_id: int, name: str, breed: str = '', notes: str = ''):
+    """(고객, 이름)으로 반려동물 찾기 또는 생성 - INSERT ... ON CONFLICT (customer_id, name) 한 번
+
+    반환값: (id, name, breed, customer_id) 행
+    """
+    table = Pet.__table__
+    insert = _dialect_insert(db.session)
+    if insert is None:
+        return _get_or_create_pet(customer_id, name, breed, notes)
+    statement = insert(table).values(name=name, breed=breed, customer_id=customer_id, notes=notes)
+    # 충돌 시 값은 바꾸지 않지만 RETURNING 으로 기존 id 를 받기 위해 DO UPDATE
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.customer_id, table.c.name],
+        set_={'name': statement.excluded.name},
+    ).returning(table.c.id, table.c.name, table.c.breed, table.c.customer_id)
+    pet = db.session.execute(statement).one()
+    index_upserted(db.session.connection(), pet=pet)
+    mark_changed(db.session, 'bookings')
+    return pet
+
+
+def _get_or_create_customer(key, name, phone, email, address):
+    # ON CONFLICT 를 지원하지 않는 DB - 조회 후 생성
+    customer = Customer.query.filter_by(phone_key=key).first()
+    if not customer:
+        customer = Customer(name=name, phone=phone, phone_key=key, email=email, address=address)
+        db.session.add(customer)
+        db.session.flush()
+    return customer
+
+
+def _get_or_create_pet(customer_id, name, breed, notes):
+    pet = Pet.query.filter_by(customer_id=customer_id, name=name).first()
+    if not pet:
+        pet = Pet(name=name, breed=breed, customer_id=customer_id, notes=notes)
+        db.session.add(pet)
+        db.session.flush()
+    return pet
+
+
+# ---------------------------------------------------------------------------
+# 마이그레이션 8 - 키 백필 + 중복 고객/반려동물 병합
+# ---------------------------------------------------------------------------
+
+def _merge_groups(connection, groups: Dict, table, reference_columns) -> List[int]:
+    """groups: {키: [id, ...]} - 가장 작은 id 로 참조를 옮기고 나머지 행 삭제"""
+    moves = []
+    for ids in groups.values():
+        keeper = min(ids)
+        moves.extend({'keeper': keeper, 'old': old} for old in ids if old != keeper)
+    if not moves:
+        return []
+    for referencing, column in reference_columns:
+        connection.execute(
+            referencing.update().where(column == db.bindparam('old')).values({column.name: db.bindparam('keeper')}),
+            moves
+        )
+    connection.execute(table.delete().where(table.c.id == db.bindparam('old')), moves)
+    return [move['old'] for move in moves]
+
+
+def _duplicate_groups(connection, select_keys, key_columns, id_column) -> Dict:
+    duplicates = connection.execute(
+        select_keys.group_by(*key_columns).having(db.func.count() > 1)
+    ).all()
+    if not duplicates:
+        return {}
+    wanted = {tuple(row) for row in duplicates}
+    groups: Dict = {}
+    # 중복 키가 있는 행만 다시 읽어 묶음 (키 컬럼 인덱스 없이도 한 번의 정렬 스캔)
+    for row in connection.execute(db.select(id_column, *key_columns).order_by(*key_columns, id_column)):
+        key = tuple(row[1:])
+        if key in wanted:
+            groups.setdefault(key, []).append(row[0])
+    return groups
+
+
+def merge_duplicate_customers(connection, batch_size: int = 10000):
+    """phone_key 컬럼 추가/백필 후 같은 번호의 고객과 같은 고객의 같은 이름 반려동물을 하나로 병합
+
+    가장 먼저 만든 행(id 최소)을 남기고, 예약/반려동물은 남는 행으로 옮긴다.
+    비어 있는 이메일/주소는 병합되는 고객의 값으로 채운다.
+    """
+    customers = Customer.__table__
+    pets = Pet.__table__
+    bookings = Booking.__table__
+    columns = {column['name'] for column in inspect(connection).get_columns(customers.name)}
+    if 'phone_key' not in columns:
+        connection.exec_driver_sql('ALTER TABLE customers ADD COLUMN phone_key VARCHAR(20)')
+
+    result = connection.execute(db.select(customers.c.id, customers.c.phone).where(customers.c.phone_key.is_(None)))
+    while True:
+        rows = result.fetchmany(batch_size)
+        if not rows:
+            break
+        keys = [{'customer_id': row.id, 'key': _phone_key_or_none(row.phone)} for row in rows]
+        connection.execute(
+            customers.update().where(customers.c.id == db.bindparam('customer_id'))
+            .values(phone_key=db.bindparam('key')),
+            keys
+        )
+
+    customer_groups = _duplicate_groups(
+        connection, db.select(customers.c.phone_key).where(customers.c.phone_key.isnot(None)),
+        [customers.c.phone_key], customers.c.id
+    )
+    for ids in customer_groups.values():
+        # 남길 고객의 빈 연락처를 최근 중복 고객의 값으로 채움
+        rows = connection.execute(
+            db.select(customers.c.id, customers.c.email, customers.c.address)
+            .where(customers.c.id.in_(ids)).order_by(customers.c.id.desc())
+        ).all()
+        email = next((row.email for row in rows if row.email), None)
+        address = next((row.address for row in rows if row.address), None)
+        keeper = min(ids)
+        connection.execute(customers.update().where(customers.c.id == keeper).values(
+            email=db.func.coalesce(db.func.nullif(customers.c.email, ''), email),
+            address=db.func.coalesce(db.func.nullif(customers.c.address, ''), address),
+        ))
+    merged_customers = _merge_groups(connection, customer_groups, customers,
+                                     [(bookings, bookings.c.customer_id), (pets, pets.c.customer_id)])
+
+    pet_groups = _duplicate_groups(
+        connection, db.select(pets.c.customer_id, pets.c.name),
+        [pets.c.customer_id, pets.c.name], pets.c.id
+    )
+    merged_pets = _merge_groups(connection, pet_groups, pets, [(bookings, bookings.c.pet_id)])
+
+    for name in SUPERSEDED_INDEXES:
+        connection.exec_driver_sql(f'DROP INDEX IF EXISTS {name}')
+    CUSTOMER_PHONE_KEY_INDEX.create(connection, checkfirst=True)
+    PET_NAME_INDEX.create(connection, checkfirst=True)
+
+    if merged_customers or merged_pets:
+        # 예약의 고객/반려동물이 바뀌었으므로 변경 피드 구독자는 목록을 다시 받음
+        if inspect(connection).has_table('booking_changes'):
+            record_reload(connection, force=True)
+        if connection.dialect.name == 'sqlite' and connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"), {'name': SEARCH_TABLE}
+        ).first():
+            rebuild_search_index(connection=connection)
+    logger.info(f"Merged {len(merged_customers)} duplicate customers and {len(merged_pets)} duplicate pets")
@@ -0,0 +1,128 @@
+import os
+import logging
+from typing import Dict, NamedTuple, Optional
+
+from flask import has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+# 쓰기 요청은 트랜잭션 시작 시 쓰기 잠금을 잡아 읽기 -> 쓰기 잠금 승격 중의 SQLITE_BUSY 방지
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+
+class SqliteSettings(NamedTuple):
+    """연결마다 적용할 SQLite PRAGMA"""
+    journal_mode: str = 'WAL'
+    synchronous: str = 'NORMAL'
+    busy_timeout_ms: int = 5000
+    # 음수는 KiB 단위 (SQLite cache_size 규칙)
+    cache_size: int = -16000
+    mmap_size: int = 0
+    foreign_keys: bool = False
+    immediate_writes: bool = True
+
+    @classmethod
+    def from_env(cls) -> 'SqliteSettings':
+        return cls(
+            journal_mode=os.environ.get('SQLITE_JOURNAL_MODE', cls._field_defaults['journal_mode']).upper(),
+            synchronous=os.environ.get('SQLITE_SYNCHRONOUS', cls._field_defaults['synchronous']).upper(),
+            busy_timeout_ms=int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', cls._field_defaults['busy_timeout_ms'])),
+            cache_size=int(os.environ.get('SQLITE_CACHE_SIZE', cls._field_defaults['cache_size'])),
+            mmap_size=int(os.environ.get('SQLITE_MMAP_SIZE', cls._field_defaults['mmap_size'])),
+            foreign_keys=_flag('SQLITE_FOREIGN_KEYS', cls._field_defaults['foreign_keys']),
+            immediate_writes=_flag('SQLITE_IMMEDIATE_WRITES', cls._field_defaults['immediate_writes']),
+        )
+
+
+def _flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    return default if value is None else value.lower() in ('1', 'true', 'yes', 'on')
+
+
+def database_uri(default_path: str) -> str:
+    """DATABASE_URL 이 있으면 사용 (postgres:// 는 postgresql:// 로), 없으면 SQLite 파일"""
+    uri = os.environ.get('DATABASE_URL')
+    if not uri:
+        return f"sqlite:///{default_path}"
+    if uri.startswith('postgres://'):
+        uri = 'postgresql://' + uri[len('postgres://'):]
+    return uri
+
+
+def engine_options(uri: str) -> Dict:
+    """SQLALCHEMY_ENGINE_OPTIONS - 커넥션 풀 크기/재활용 주기 (환경 변수로 조정)"""
+    url = make_url(uri)
+    if url.get_backend_name() == 'sqlite':
+        if not url.database or url.database == ':memory:':
+            return {}
+        # 파일 DB 는 QueuePool - 동시 요청 스레드 수만큼 연결을 재사용
+        return {
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+            'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        }
+    return {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        # 서버/프록시가 유휴 연결을 끊기 전에 교체하고, 꺼내기 전에 연결 상태 확인
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': _flag('DB_POOL_PRE_PING', True),
+    }
+
+
+def _write_request() -> bool:
+    return has_request_context() and request.method in WRITE_METHODS
+
+
+def install_sqlite_settings(engine, settings: SqliteSettings):
+    """SQLite 엔진에 연결별 PRAGMA 와 트랜잭션 시작 방식 적용"""
+
+    @event.listens_for(engine, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        # 드라이버의 암묵적 BEGIN 대신 아래 'begin' 이벤트에서 직접 시작 (SAVEPOINT 도 정상 동작)
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f'PRAGMA busy_timeout = {int(settings.busy_timeout_ms)}')
+            mode = cursor.execute(f'PRAGMA journal_mode = {settings.journal_mode}').fetchone()
+            if mode and mode[0].upper() != settings.journal_mode and connection_record.info.get('warned') is None:
+                connection_record.info['warned'] = True
+                logger.warning(f"SQLite journal_mode is {mode[0]} (requested {settings.journal_mode})")
+            cursor.execute(f'PRAGMA synchronous = {settings.synchronous}')
+            cursor.execute(f'PRAGMA cache_size = {int(settings.cache_size)}')
+            cursor.execute(f'PRAGMA foreign_keys = {"ON" if settings.foreign_keys else "OFF"}')
+            cursor.execute('PRAGMA temp_store = MEMORY')
+            if settings.mmap_size:
+                cursor.execute(f'PRAGMA mmap_size = {int(settings.mmap_size)}')
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, 'begin')
+    def _on_begin(connection):
+        if settings.immediate_writes and _write_request():
+            connection.exec_driver_sql('BEGIN IMMEDIATE')
+        else:
+            connection.exec_driver_sql('BEGIN')
+
+
+def init_database(app, db, uri: str, sqlite_settings: Optional[SqliteSettings] = None) -> str:
+    """DB URI/풀 설정 후 db.init_app, SQLite 파일이면 PRAGMA 이벤트 등록"""
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {}).update(engine_options(uri))
+    db.init_app(app)
+
+    url = make_url(uri)
+    with app.app_context():
+        if url.get_backend_name() == 'sqlite' and url.database and url.database != ':memory:':
+            settings = sqlite_settings or SqliteSettings.from_env()
+            install_sqlite_settings(db.engine, settings)
+            logger.info(f"SQLite {url.database}: journal_mode={settings.journal_mode}, "
+                        f"synchronous={settings.synchronous}, busy_timeout={settings.busy_timeout_ms}ms")
+        else:
+            logger.info(f"Database {url.render_as_string(hide_password=True)} "
+                        f"(pool_size={app.config['SQLALCHEMY_ENGINE_OPTIONS'].get('pool_size')})")
+    return uri
@@ -0,0 +1,31 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import json
+import logging
+import argparse
+
+from src.main import app
+from src.booking_import import DEFAULT_CHUNK_SIZE, FORMATS, detect_format, read_rows, import_bookings
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description='예약 CSV/JSONL 일괄 가져오기')
+    parser.add_argument('file', help='가져올 파일 (- 이면 표준 입력)')
+    parser.add_argument('--format', choices=FORMATS, help='파일 형식 (기본: 확장자로 판단)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='트랜잭션당 행 수')
+    parser.add_argument('--allow-conflicts', action='store_true', help='같은 직원의 겹치는 예약도 가져오기')
+    args = parser.parse_args()
+
+    fmt = args.format or detect_format(args.file)
+    with app.app_context():
+        if args.file == '-':
+            report = import_bookings(read_rows(sys.stdin, fmt), args.chunk_size, args.allow_conflicts)
+        else:
+            with open(args.file, encoding='utf-8-sig', newline='') as f:
+                report = import_bookings(read_rows(f, fmt), args.chunk_size, args.allow_conflicts)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    sys.exit(0 if report['failed'] == 0 else 1)
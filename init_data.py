@@ -2,17 +2,21 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+import argparse
 from datetime import datetime, date
 import json
 from src.models.booking import db, Customer, Pet, Service, Staff, Booking
 from src.main import app
+from src.app_factory import init_schema
+from src.sample_data import seed_bulk, truncate_all
 
 def init_sample_data():
     """샘플 데이터 초기화"""
     with app.app_context():
         # 기존 데이터 삭제 (개발용)
         db.drop_all()
-        db.create_all()
+        # 검색 인덱스(FTS 가상 테이블)는 drop_all 대상이 아니므로 함께 비움
+        init_schema(rebuild_search=True)
         
         # 서비스 데이터 생성
         services = [
@@ -152,7 +156,7 @@ def init_sample_data():
                 'service_name': '네일',
                 'staff_name': '원장님',
                 'date': '2025-07-14',
-                'time': '11:00',
+                'time': '12:00',
                 'status': 'pending',
                 'notes': '발톱 자르기를 싫어해요.'
             },
@@ -178,11 +182,17 @@ def init_sample_data():
             }
         ]
         
+        # 행마다 조회하지 않도록 이름/전화번호 -> 객체 매핑을 한 번에 구성
+        customers = {customer.phone: customer for customer in Customer.query.all()}
+        pets = {(pet.customer_id, pet.name): pet for pet in Pet.query.all()}
+        services = {service.name: service for service in Service.query.all()}
+        staff_by_name = {staff.name: staff for staff in Staff.query.all()}
+        
         for booking_data in bookings_data:
-            customer = Customer.query.filter_by(phone=booking_data['customer_phone']).first()
-            pet = Pet.query.filter_by(name=booking_data['pet_name'], customer_id=customer.id).first()
-            service = Service.query.filter_by(name=booking_data['service_name']).first()
-            staff = Staff.query.filter_by(name=booking_data['staff_name']).first()
+            customer = customers[booking_data['customer_phone']]
+            pet = pets[(customer.id, booking_data['pet_name'])]
+            service = services[booking_data['service_name']]
+            staff = staff_by_name[booking_data['staff_name']]
             
             booking = Booking(
                 customer_id=customer.id,
@@ -201,6 +211,32 @@ def init_sample_data():
         db.session.commit()
         print("샘플 데이터 초기화 완료!")
 
+def init_bulk_data(customers, bookings, days=365, seed=42, reset='drop'):
+    """합성 대용량 데이터 적재 (벤치마크용)
+
+    reset: drop(테이블 재생성) | truncate(데이터만 삭제) | none(기존 데이터에 추가)
+    """
+    with app.app_context():
+        if reset == 'drop':
+            db.drop_all()
+            init_schema(rebuild_search=True)
+        elif reset == 'truncate':
+            truncate_all()
+        result = seed_bulk(customers, bookings, days, seed)
+        print(f"대용량 샘플 데이터 적재 완료: {json.dumps(result, ensure_ascii=False)}")
+        return result
+
 if __name__ == '__main__':
-    init_sample_data()
+    parser = argparse.ArgumentParser(description='샘플 데이터 초기화')
+    parser.add_argument('--bookings', type=int, help='합성 예약 수 (지정하면 대용량 합성 데이터 적재)')
+    parser.add_argument('--customers', type=int, help='합성 고객 수 (기본: 예약 수의 1/5)')
+    parser.add_argument('--days', type=int, default=365, help='예약 기간(일)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 seed')
+    parser.add_argument('--reset', choices=['drop', 'truncate', 'none'], default='drop', help='기존 데이터 처리 방식')
+    args = parser.parse_args()
+    
+    if args.bookings:
+        init_bulk_data(args.customers or max(args.bookings // 5, 1), args.bookings, args.days, args.seed, args.reset)
+    else:
+        init_sample_data()
 
@@ -0,0 +1,312 @@
+import os
+import math
+import time
+import uuid
+import signal
+import logging
+import threading
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+CANCELLED = 'cancelled'
+FINISHED_STATES = frozenset([SUCCEEDED, FAILED, TIMEOUT, CANCELLED])
+
+
+class QueueFull(Exception):
+    """대기/실행 중인 작업이 max_pending 개에 도달하여 새 작업을 받을 수 없음"""
+
+
+def parse_timeout(value) -> Optional[float]:
+    """요청의 timeout(초) 값 - 비어 있으면 None (큐 기본값), 양의 숫자가 아니면 ValueError"""
+    if value in (None, ''):
+        return None
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid timeout: {value}')
+    if not math.isfinite(timeout) or timeout <= 0:
+        raise ValueError(f'Invalid timeout: {value}')
+    return timeout
+
+
+def _kill_process_group(process: subprocess.Popen):
+    """셸과 자식 프로세스(npm, docker-compose 등)를 함께 종료"""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def _truncate_bytes(text: str, limit: int) -> str:
+    """UTF-8 기준 limit 바이트 이내로 자름 (잘린 멀티바이트 문자는 버림)"""
+    return text.encode('utf-8')[:max(limit, 0)].decode('utf-8', errors='ignore')
+
+
+def _read_capped(stream, limit: int, chunks: List[str]):
+    """stream 을 끝까지 읽되 limit 바이트까지만 보관 (나머지는 파이프가 막히지 않도록 버림)"""
+    size = 0
+    for line in stream:
+        remaining = limit - size
+        if remaining <= 0:
+            continue
+        chunk = _truncate_bytes(line, remaining)
+        chunks.append(chunk)
+        size += len(chunk.encode('utf-8'))
+
+
+class Job:
+    """백그라운드에서 실행되는 명령어 작업"""
+
+    def __init__(self, command: str, timeout: float, max_output_bytes: int):
+        self.id = uuid.uuid4().hex
+        self.command = command
+        self.timeout = timeout
+        self.max_output_bytes = max_output_bytes
+        self.status = QUEUED
+        self.output_chunks: List[str] = []
+        self.output_size = 0
+        self.truncated = False
+        self.error = ''
+        self.return_code = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.process: Optional[subprocess.Popen] = None
+        self.cancel_requested = False
+        self.timed_out = False
+        self.cwd = None
+        self.changed = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def append_output(self, chunk: str):
+        """출력 추가 (UTF-8 바이트 기준 크기 제한 초과 시 잘라냄)"""
+        with self.changed:
+            remaining = self.max_output_bytes - self.output_size
+            size = len(chunk.encode('utf-8'))
+            if remaining <= 0:
+                self.truncated = True
+            else:
+                if size > remaining:
+                    chunk = _truncate_bytes(chunk, remaining)
+                    size = len(chunk.encode('utf-8'))
+                    self.truncated = True
+                self.output_chunks.append(chunk)
+                self.output_size += size
+            self.changed.notify_all()
+
+    def finish(self, status: str, return_code: Optional[int] = None, error: str = ''):
+        with self.changed:
+            self.status = status
+            self.return_code = return_code
+            if error:
+                self.error = error
+            self.finished_at = time.time()
+            self.process = None
+            self.changed.notify_all()
+
+    def read_output(self, offset: int = 0) -> str:
+        """offset(청크 인덱스) 이후의 출력 반환"""
+        with self.changed:
+            return ''.join(self.output_chunks[offset:])
+
+    def wait_for_output(self, offset: int, timeout: float):
+        """offset 이후 새 출력이 생기거나 작업이 끝날 때까지 대기
+
+        (새 청크 목록, 다음 offset, 종료 여부)를 반환한다.
+        """
+        with self.changed:
+            if len(self.output_chunks) <= offset and not self.finished:
+                self.changed.wait(timeout)
+            chunks = self.output_chunks[offset:]
+            return chunks, offset + len(chunks), self.finished
+
+    def to_dict(self, include_output: bool = True) -> Dict[str, Any]:
+        result = {
+            'id': self.id,
+            'command': self.command,
+            'status': self.status,
+            'success': self.status == SUCCEEDED,
+            'return_code': self.return_code,
+            'error': self.error,
+            'truncated': self.truncated,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'duration': round((self.finished_at or time.time()) - self.started_at, 3) if self.started_at else None
+        }
+        if include_output:
+            result['output'] = self.read_output()
+        return result
+
+
+class JobQueue:
+    """명령어 작업 큐 (워커 풀 + 완료 작업 보존)
+
+    완료된 작업은 result_ttl 초 동안, 최대 max_finished 개까지 보존된다.
+    끝나지 않은(대기/실행 중) 작업은 max_pending 개까지만 받는다.
+    """
+
+    def __init__(self, workers: int = 4, timeout: float = 1800, result_ttl: float = 3600,
+                 max_finished: int = 200, max_output_bytes: int = 1024 * 1024,
+                 cwd: Optional[str] = None, max_pending: int = 100):
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.max_finished = max_finished
+        self.max_output_bytes = max_output_bytes
+        self.cwd = cwd
+        self.jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job-worker')
+
+    def submit(self, command: str, timeout: Optional[float] = None, cwd: Optional[str] = None) -> Job:
+        """작업 등록 후 즉시 반환 (timeout 은 큐의 최대 실행 시간을 넘지 않음)
+
+        끝나지 않은 작업이 이미 max_pending 개이면 QueueFull.
+        """
+        timeout = min(timeout, self.timeout) if timeout and timeout > 0 else self.timeout
+        job = Job(command, timeout, self.max_output_bytes)
+        job.cwd = cwd or self.cwd
+        with self._lock:
+            pending = sum(1 for queued in self.jobs.values() if not queued.finished)
+            if pending >= self.max_pending:
+                raise QueueFull(f'Too many pending jobs ({pending}/{self.max_pending})')
+            self.jobs[job.id] = job
+        self._prune()
+        self._executor.submit(self._run, job)
+        logger.info(f"Job queued: {job.id} - {command}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        self._prune()
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        self._prune()
+        with self._lock:
+            return list(self.jobs.values())
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """대기 중이거나 실행 중인 작업 취소"""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return job
+        # _run 이 상태/프로세스를 바꾸는 구간과 겹치지 않도록 작업 잠금 안에서 판단
+        with job.changed:
+            job.cancel_requested = True
+            process = job.process
+            if process is not None:
+                _kill_process_group(process)
+            elif job.status == QUEUED:
+                job.finish(CANCELLED, error='작업이 취소되었습니다.')
+        return job
+
+    def shutdown(self, wait: bool = False, cancel_jobs: bool = False):
+        """워커 풀 종료 - cancel_jobs 이면 실행 중인 명령도 종료
+
+        명령은 별도 세션(프로세스 그룹)으로 실행되므로 취소하지 않으면 워커 프로세스가 끝나도 남는다.
+        """
+        if cancel_jobs:
+            for job in self.list():
+                if not job.finished:
+                    self.cancel(job.id)
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job: Job):
+        with job.changed:
+            if job.cancel_requested:
+                return
+            job.status = RUNNING
+            job.started_at = time.time()
+        try:
+            process = subprocess.Popen(
+                job.command,
+                shell=True,
+                cwd=job.cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                start_new_session=True
+            )
+            # Popen 도중 들어온 취소는 프로세스를 볼 수 없었으므로 여기서 처리
+            with job.changed:
+                job.process = process
+                if job.cancel_requested:
+                    _kill_process_group(process)
+
+            # stderr는 별도 스레드에서 stdout 과 같은 크기 제한으로 수집
+            stderr_chunks = []
+            stderr_reader = threading.Thread(
+                target=_read_capped, args=(process.stderr, job.max_output_bytes, stderr_chunks), daemon=True
+            )
+            stderr_reader.start()
+
+            # 실행 시간 초과 시 프로세스 종료
+            timer = threading.Timer(job.timeout, self._expire, args=(job, process))
+            timer.start()
+            try:
+                for line in process.stdout:
+                    job.append_output(line)
+                return_code = process.wait()
+            finally:
+                timer.cancel()
+            stderr_reader.join(timeout=5)
+            error = ''.join(stderr_chunks)
+
+            if job.cancel_requested:
+                job.finish(CANCELLED, return_code, error or '작업이 취소되었습니다.')
+            elif job.timed_out:
+                job.finish(TIMEOUT, return_code, f'명령어 실행 시간이 초과되었습니다 ({job.timeout:g}초).')
+            else:
+                job.finish(SUCCEEDED if return_code == 0 else FAILED, return_code, error)
+
+        except Exception as e:
+            logger.error(f"Job execution error: {job.id} - {str(e)}")
+            job.finish(FAILED, -1, str(e))
+        finally:
+            logger.info(f"Job finished: {job.id} - {job.status}")
+
+    @staticmethod
+    def _expire(job: Job, process: subprocess.Popen):
+        job.timed_out = True
+        _kill_process_group(process)
+
+    def _prune(self):
+        """TTL 만료 또는 개수 초과한 완료 작업 제거"""
+        now = time.time()
+        with self._lock:
+            finished = [job for job in self.jobs.values() if job.finished]
+            expired = [job.id for job in finished if now - job.finished_at > self.result_ttl]
+            overflow = len(finished) - len(expired) - self.max_finished
+            if overflow > 0:
+                expired_ids = set(expired)
+                remaining = [job for job in finished if job.id not in expired_ids]
+                remaining.sort(key=lambda job: job.finished_at)
+                expired.extend(job.id for job in remaining[:overflow])
+            for job_id in expired:
+                self.jobs.pop(job_id, None)
+
+
+# Gabriel 실행기 기본 작업 큐
+job_queue = JobQueue(
+    workers=int(os.environ.get('JOB_WORKERS', 4)),
+    timeout=float(os.environ.get('JOB_TIMEOUT', 1800)),
+    result_ttl=float(os.environ.get('JOB_RESULT_TTL', 3600)),
+    max_finished=int(os.environ.get('JOB_MAX_FINISHED', 200)),
+    max_pending=int(os.environ.get('JOB_MAX_PENDING', 100))
+)
@@ -0,0 +1,239 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# 대상(목적어) 어휘 - 한글/영문 표기 -> 정규화된 대상
+OBJECT_LEXICON = {
+    'nginx': 'nginx', '엔진엑스': 'nginx', '웹서버': 'nginx', '웹 서버': 'nginx',
+    'docker': 'docker', '도커': 'docker', '컨테이너': 'docker',
+    'docker-compose': 'compose', '컴포즈': 'compose', '도커컴포즈': 'compose',
+    '이미지': 'images', '도커 이미지': 'images',
+    'chatweb': 'chatweb', '챗웹': 'chatweb', '프론트': 'chatweb', '프론트엔드': 'chatweb', '프로젝트': 'chatweb',
+    '파일': 'file', '디렉토리': 'directory', '디렉터리': 'directory', '폴더': 'directory',
+    '현재 위치': 'location', '현재위치': 'location', '경로': 'location',
+    '시스템': 'system', '서버': 'system',
+    '사용자': 'user', '유저': 'user', '계정': 'user',
+    '날짜': 'date', '시간': 'date', '시각': 'date',
+    '가동시간': 'uptime', '가동 시간': 'uptime', '업타임': 'uptime',
+    '디스크': 'disk', '용량': 'disk',
+    '메모리': 'memory', '램': 'memory',
+    '프로세스': 'process',
+}
+
+# 동작(동사) 어휘 - 한글 표기 -> 정규화된 동작
+ACTION_LEXICON = {
+    '재시작': 'restart', '다시 시작': 'restart', '다시시작': 'restart', '리스타트': 'restart', '재가동': 'restart',
+    '상태': 'status',
+    '확인': 'check', '체크': 'check', '검사': 'check', '점검': 'check',
+    '빌드': 'build',
+    '실행': 'run', '돌려': 'run',
+    '중지': 'stop', '정지': 'stop', '멈춰': 'stop', '종료': 'stop',
+    '시작': 'start', '켜': 'start',
+    '목록': 'list', '리스트': 'list', '보여': 'list', '조회': 'list',
+    '정보': 'info', '알려': 'info',
+    '설정 검사': 'check', '설정 확인': 'check', '설정 점검': 'check',
+    '테스트': 'test',
+}
+
+# 대상의 기본 조회 명령으로 대신할 수 있는 조회성 동작
+QUERY_ACTIONS = frozenset({'status', 'check', 'list', 'info'})
+
+# 조사 및 존댓말/명령형 어미 - 번역 시 제거
+PARTICLES = ['을', '를', '이', '가', '은', '는', '의', '에', '에서', '으로', '로', '도', '만', '좀', '한번', '한 번']
+ENDINGS = [
+    '해줘', '해 줘', '해주세요', '해 주세요', '해줄래', '해줄래요', '해봐', '해 봐', '해라', '하세요', '하십시오',
+    '합시다', '할래', '해요', '해', '하기', '하고', '시켜줘', '시켜', '줘', '주세요', '줄래', '부탁해', '부탁해요',
+    '부탁드립니다', '요', '좀',
+]
+
+# (대상, 동작) -> 실행할 명령어 템플릿. 동작이 None 이면 대상만으로 결정
+COMMAND_TEMPLATES = {
+    ('nginx', 'restart'): 'sudo systemctl restart nginx',
+    ('nginx', 'status'): 'sudo systemctl status nginx',
+    ('nginx', 'check'): 'nginx -t',
+    ('nginx', None): 'sudo systemctl status nginx',
+    ('docker', 'list'): 'docker ps',
+    ('docker', 'status'): 'docker ps',
+    ('docker', 'check'): 'docker ps',
+    ('docker', None): 'docker ps',
+    ('images', 'list'): 'docker images',
+    ('images', None): 'docker images',
+    ('compose', 'status'): 'docker-compose ps',
+    ('compose', 'list'): 'docker-compose ps',
+    ('compose', None): 'docker-compose ps',
+    ('chatweb', 'build'): 'npm run build',
+    ('chatweb', 'start'): 'npm start',
+    ('chatweb', 'run'): 'npm start',
+    ('chatweb', 'test'): 'npm test',
+    (None, 'build'): 'npm run build',
+    (None, 'test'): 'npm test',
+    ('file', 'list'): 'ls -la',
+    ('file', None): 'ls -la',
+    ('directory', 'list'): 'ls -la',
+    ('directory', None): 'ls -la',
+    ('location', None): 'pwd',
+    ('system', 'status'): 'uptime',
+    ('system', 'info'): 'uptime',
+    ('user', None): 'whoami',
+    ('date', None): 'date',
+    ('uptime', None): 'uptime',
+    ('disk', None): 'df -h',
+    ('memory', None): 'free -h',
+    ('process', 'list'): 'ps aux',
+    ('process', None): 'ps aux',
+}
+
+AIIN_PREFIX = re.compile(r'^\s*aiin\b\s*[,:]?\s*', re.IGNORECASE)
+HANGUL = re.compile(r'[가-힣]')
+SEPARATOR = re.compile(r'[\s,.!?~]')
+
+OBJECT, ACTION, SKIP, LITERAL, UNKNOWN = 'object', 'action', 'skip', 'literal', 'unknown'
+
+
+class Translation(NamedTuple):
+    """자연어 명령어 번역 결과"""
+    command: str
+    argv: Tuple[str, ...]
+    matched: bool
+    target: Optional[str] = None
+    action: Optional[str] = None
+    error: Optional[str] = None
+
+
+class _Lexicon:
+    """문자 단위 트라이 - 가장 긴 어휘를 먼저 매칭"""
+
+    def __init__(self):
+        self.root: Dict = {}
+
+    def add(self, word: str, kind: str, value: Optional[str]):
+        node = self.root
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[''] = (kind, value)
+
+    def longest(self, text: str, start: int):
+        """text[start:] 에서 가장 긴 어휘 (끝 위치, (종류, 값)) 반환"""
+        node = self.root
+        found = None
+        for position in range(start, len(text)):
+            node = node.get(text[position])
+            if node is None:
+                break
+            if '' in node:
+                found = (position + 1, node[''])
+        return found
+
+
+def _build_lexicon() -> _Lexicon:
+    lexicon = _Lexicon()
+    for word, value in OBJECT_LEXICON.items():
+        lexicon.add(word, OBJECT, value)
+    for word, value in ACTION_LEXICON.items():
+        lexicon.add(word, ACTION, value)
+    for word in PARTICLES + ENDINGS:
+        lexicon.add(word, SKIP, None)
+    return lexicon
+
+
+LEXICON = _build_lexicon()
+
+
+def _scan(text: str) -> List[Tuple[str, Optional[str], str]]:
+    """어휘 트라이로 (종류, 값, 원문) 목록 생성
+
+    한글 구간은 가장 긴 어휘부터 매칭하며('다시 시작'처럼 공백을 포함한 표기 포함),
+    한글이 아닌 단어는 어휘에 없으면 원문 그대로 유지한다.
+    어휘에 없는 한글 구간은 버리지 않고 UNKNOWN 으로 남긴다.
+    """
+    items = []
+    lowered = text.lower()
+    position = 0
+    length = len(text)
+    while position < length:
+        char = text[position]
+        if SEPARATOR.match(char):
+            position += 1
+            continue
+        if not HANGUL.match(char):
+            end = position
+            while end < length and not SEPARATOR.match(text[end]) and not HANGUL.match(text[end]):
+                end += 1
+            word = text[position:end]
+            found = LEXICON.longest(lowered, position)
+            if found and found[0] == end:
+                items.append((found[1][0], found[1][1], word))
+            else:
+                items.append((LITERAL, None, word))
+            position = end
+            continue
+        found = LEXICON.longest(lowered, position)
+        if found is None:
+            end = position + 1
+            while (end < length and HANGUL.match(text[end])
+                   and LEXICON.longest(lowered, end) is None):
+                end += 1
+            items.append((UNKNOWN, None, text[position:end]))
+            position = end
+            continue
+        end, (kind, value) = found
+        items.append((kind, value, text[position:end]))
+        position = end
+    return items
+
+
+@lru_cache(maxsize=2048)
+def translate(text: str) -> Translation:
+    """한글 자연어 명령어를 실행 가능한 명령어로 번역 (결과 캐시)
+
+    "AIIN, nginx 재시작해줘" -> "sudo systemctl restart nginx"
+    한글이 없는 명령어는 'aiin' 접두사만 제거하고 그대로 반환한다.
+    어휘에 없는 한글 단어나 대상에 대응하는 명령이 없는 동작은 다른 명령으로
+    대체하지 않고 error 를 채워 반환한다.
+    """
+    stripped = AIIN_PREFIX.sub('', text).strip()
+    if not HANGUL.search(stripped):
+        return Translation(stripped, tuple(stripped.split()), False)
+
+    items = _scan(stripped)
+    target = next((value for kind, value, _ in items if kind == OBJECT), None)
+    action = next((value for kind, value, _ in items if kind == ACTION), None)
+    literals = [raw for kind, _, raw in items if kind == LITERAL]
+    unknown = [raw for kind, _, raw in items if kind == UNKNOWN]
+    if unknown:
+        return Translation('', (), False, target, action, f"인식할 수 없는 단어입니다: {', '.join(unknown)}")
+
+    template = COMMAND_TEMPLATES.get((target, action))
+    if template is None and (action is None or action in QUERY_ACTIONS):
+        template = COMMAND_TEMPLATES.get((target, None))
+    if action is not None and template is None:
+        raw = next(raw for kind, _, raw in items if kind == ACTION)
+        return Translation('', (), False, target, action, f"인식할 수 없는 동작입니다: {raw}")
+    if template and not literals:
+        return Translation(template, tuple(template.split()), True, target, action)
+
+    # 템플릿이 없으면 단어 단위 번역 결과를 이어 붙임 (기존 동작과 호환)
+    words = []
+    for kind, value, raw in items:
+        if kind == LITERAL:
+            words.append(raw)
+        elif kind in (OBJECT, ACTION):
+            words.append(value)
+    command = ' '.join(words)
+    return Translation(command, tuple(words), False, target, action)
+
+
+def parse_korean_command(command: str) -> str:
+    """한글 명령어를 영어 명령어로 변환
+
+    번역할 수 없는 명령어는 ValueError 를 발생시킨다.
+    """
+    translation = translate(command.strip())
+    if translation.error:
+        raise ValueError(translation.error)
+    return translation.command
+
+
+def cache_info() -> Dict[str, int]:
+    info = translate.cache_info()
+    return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize}
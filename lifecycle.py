@@ -0,0 +1,39 @@
+import logging
+import threading
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+# 워커 종료 시작 (SIGTERM) - 오래 열린 스트림(SSE)은 이를 보고 끝낸다 (예약 변경 피드 클라이언트는 커서로 다른 워커에 재연결)
+shutting_down = threading.Event()
+
+_callbacks: List[Callable[[], None]] = []
+_lock = threading.Lock()
+
+
+def on_shutdown(callback: Callable[[], None]) -> Callable[[], None]:
+    """워커 종료 시 실행할 정리 함수 등록 (등록 역순으로 실행)"""
+    with _lock:
+        if callback not in _callbacks:
+            _callbacks.append(callback)
+    return callback
+
+
+def begin_shutdown():
+    """새 요청은 받지 않고 진행 중인 요청만 마무리하는 단계 시작"""
+    if not shutting_down.is_set():
+        logger.info("Graceful shutdown started")
+        shutting_down.set()
+
+
+def run_shutdown_callbacks():
+    """진행 중인 요청이 끝난 뒤 (또는 graceful timeout 후) 정리 함수 실행"""
+    begin_shutdown()
+    with _lock:
+        callbacks = list(reversed(_callbacks))
+        _callbacks.clear()
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Shutdown callback {getattr(callback, '__name__', callback)} failed: {str(e)}")
@@ -3,44 +3,15 @@ import sys
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from flask import Flask, send_from_directory
-from flask_cors import CORS
-from src.models.booking import db
-from src.routes.user import user_bp
-from src.routes.booking import booking_bp
+from src.app_factory import create_app, init_schema
 
-app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
-app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
-
-# CORS 설정 - 프론트엔드와의 통신을 위해
-CORS(app)
-
-app.register_blueprint(user_bp, url_prefix='/api')
-app.register_blueprint(booking_bp, url_prefix='/api')
-
-# uncomment if you need to use database
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db.init_app(app)
-with app.app_context():
-    db.create_all()
-
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve(path):
-    static_folder_path = app.static_folder
-    if static_folder_path is None:
-            return "Static folder not configured", 404
-
-    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
-        return send_from_directory(static_folder_path, path)
-    else:
-        index_path = os.path.join(static_folder_path, 'index.html')
-        if os.path.exists(index_path):
-            return send_from_directory(static_folder_path, 'index.html')
-        else:
-            return "index.html not found", 404
+# 스키마 생성/마이그레이션은 시작 시 하지 않음 - python migrate.py upgrade (또는 flask init-db) 로 실행
+# 이 앱은 마이그레이션 명령과 개발 서버용이므로 스키마 확인을 생략한다 (운영은 server.py / wsgi.py)
+app = create_app({'SCHEMA_CHECK': False})
 
 
 if __name__ == '__main__':
+    # 개발 서버는 편의상 시작 전에 스키마를 맞춤
+    with app.app_context():
+        init_schema()
     app.run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,35 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import logging
+from src.main import app
+from src.app_factory import init_schema
+from src.models.booking import db
+from src.migrations import PLAN_DIALECTS, status, check_query_plans, plan_check_supported
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'upgrade'
+    with app.app_context():
+        if command == 'upgrade':
+            applied = init_schema(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+            print(f"{len(applied)} migration(s) applied")
+        elif command == 'status':
+            for item in status():
+                print(f"{item['version']:>4}  {item['name']:<28} {item['applied_at'] or 'pending'}")
+    if command == 'check-plans':
+        with app.app_context():
+            supported, dialect = plan_check_supported(), db.engine.dialect.name
+        if not supported:
+            print(f"check-plans: unsupported dialect '{dialect}' (supported: {', '.join(sorted(PLAN_DIALECTS))})")
+            sys.exit(2)
+        report = check_query_plans(app)
+        for route, scans in report.items():
+            print(f"{'FULL SCAN' if scans else 'ok':<10} {route}  {', '.join(scans)}")
+        sys.exit(1 if any(report.values()) else 0)
+    elif command not in ('upgrade', 'status'):
+        print("usage: python migrate.py [upgrade [version] | status | check-plans]")
+        sys.exit(2)
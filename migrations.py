@@ -0,0 +1,244 @@
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import Index, event, inspect
+
+from src.models.booking import db, Booking, Customer, Pet, Service, Staff
+from src.booking_stats import BookingDailyStat, rebuild_daily_stats
+from src.booking_guard import add_version_column, install_overlap_guard
+from src.booking_changes import BookingChange
+from src.customer_keys import merge_duplicate_customers
+from src.booking_series import install_booking_series
+
+logger = logging.getLogger(__name__)
+
+# 적용된 마이그레이션 기록 (db.metadata 에 포함되어 drop_all/create_all 과 함께 초기화)
+schema_migrations = db.Table(
+    'schema_migrations',
+    db.Column('version', db.Integer, primary_key=True),
+    db.Column('name', db.String(100), nullable=False),
+    db.Column('applied_at', db.DateTime, nullable=False)
+)
+
+# 예약 API 조회 경로별 인덱스 (모델 테이블에 등록되므로 새 DB 는 create_all 로 함께 생성)
+BOOKING_INDEXES = [
+    # 목록 정렬/키셋 페이지네이션 (date, time, id) 및 날짜 필터, 일일 통계
+    Index('ix_bookings_date_time', Booking.date, Booking.time, Booking.id),
+    # 직원/서비스 필터 + 날짜 정렬
+    Index('ix_bookings_staff_date_time', Booking.staff_id, Booking.date, Booking.time),
+    Index('ix_bookings_service_date', Booking.service_id, Booking.date),
+    # 고객/반려동물 검색 결과(IN 서브쿼리)로 예약 조회
+    Index('ix_bookings_customer_id', Booking.customer_id),
+    Index('ix_bookings_pet_id', Booking.pet_id),
+    # create_booking 의 반려동물 조회 (name, customer_id) - 마이그레이션 8 에서 고유 인덱스로 대체
+    Index('ix_pets_customer_name', Pet.customer_id, Pet.name),
+    # 고객 목록 정렬/키셋 페이지네이션 (name, id)
+    Index('ix_customers_name_id', Customer.name, Customer.id),
+    # 서비스/직원 이름 조회
+    Index('ix_services_name', Service.name),
+    Index('ix_staff_name', Staff.name),
+]
+
+# create_booking 의 전화번호 조회 + 같은 번호로 고객이 중복 생성되는 것 방지
+# (마이그레이션 8 에서 정규화된 번호의 customer_keys.CUSTOMER_PHONE_KEY_INDEX 로 대체)
+CUSTOMER_PHONE_INDEX = Index('ux_customers_phone', Customer.phone, unique=True)
+
+# 전체 스캔이 있어도 문제되지 않는 소규모 기준 테이블
+REFERENCE_TABLES = frozenset([Service.__tablename__, Staff.__tablename__, 'schema_migrations'])
+# 쿼리 플랜 검사를 지원하는 DB
+PLAN_DIALECTS = frozenset(['sqlite', 'postgresql'])
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable
+    # 코드가 매핑하는 테이블/컬럼을 만드는 마이그레이션 - 적용 전에는 모델 조회가 실패하므로 앱을 시작하지 않음
+    required: bool = False
+
+
+def _create_tables(connection):
+    db.metadata.create_all(bind=connection)
+
+
+def _create_booking_indexes(connection):
+    for index in BOOKING_INDEXES:
+        index.create(connection, checkfirst=True)
+
+
+def _create_customer_phone_index(connection):
+    duplicates = connection.execute(
+        db.select(Customer.phone, db.func.count())
+        .where(Customer.phone.isnot(None))
+        .group_by(Customer.phone)
+        .having(db.func.count() > 1)
+        .limit(10)
+    ).all()
+    if duplicates:
+        # 마이그레이션 8 이 정규화된 번호 기준으로 병합하고 phone_key 고유 인덱스로 대체
+        phones = ', '.join(f'{phone} ({count})' for phone, count in duplicates)
+        logger.warning(f"Duplicate customer phones, unique index deferred to migration 8: {phones}")
+        return
+    CUSTOMER_PHONE_INDEX.create(connection, checkfirst=True)
+
+
+def _create_booking_changes(connection):
+    BookingChange.__table__.create(connection, checkfirst=True)
+
+
+def _create_daily_stats(connection):
+    BookingDailyStat.__table__.create(connection, checkfirst=True)
+    rebuild_daily_stats(connection)
+
+
+# 버전 순서대로 한 번씩만 적용 (이미 적용된 DB 에 다시 실행해도 안전하도록 작성)
+MIGRATIONS = [
+    Migration(1, 'create tables', _create_tables, required=True),
+    Migration(2, 'booking query indexes', _create_booking_indexes),
+    Migration(3, 'unique customer phone', _create_customer_phone_index),
+    Migration(4, 'booking daily stats', _create_daily_stats),
+    Migration(5, 'booking version column', add_version_column, required=True),
+    Migration(6, 'booking overlap guard', install_overlap_guard),
+    Migration(7, 'booking change feed', _create_booking_changes),
+    Migration(8, 'normalized customer phone keys', merge_duplicate_customers, required=True),
+    Migration(9, 'recurring booking series', install_booking_series, required=True),
+    # 6 의 트리거를 시간대가 바뀌는 수정만 검사하도록 다시 생성
+    Migration(10, 'overlap guard on slot changes only', install_overlap_guard),
+]
+
+
+def applied_versions() -> Dict[int, datetime]:
+    schema_migrations.create(db.engine, checkfirst=True)
+    with db.engine.connect() as connection:
+        rows = connection.execute(db.select(schema_migrations.c.version, schema_migrations.c.applied_at)).all()
+    return {version: applied_at for version, applied_at in rows}
+
+
+def pending_migrations() -> List[Migration]:
+    """적용되지 않은 마이그레이션 (조회만 함 - 앱 시작 시 스키마 확인용)"""
+    if not inspect(db.engine).has_table(schema_migrations.name):
+        return list(MIGRATIONS)
+    with db.engine.connect() as connection:
+        applied = set(connection.execute(db.select(schema_migrations.c.version)).scalars())
+    return [migration for migration in MIGRATIONS if migration.version not in applied]
+
+
+def upgrade(target: Optional[int] = None) -> List[Migration]:
+    """적용되지 않은 마이그레이션을 버전 순서대로 적용 (마이그레이션마다 하나의 트랜잭션)
+
+    실패한 마이그레이션은 롤백되고 이후 버전은 적용하지 않는다.
+    """
+    applied = applied_versions()
+    done = []
+    for migration in MIGRATIONS:
+        if migration.version in applied or (target is not None and migration.version > target):
+            continue
+        with db.engine.begin() as connection:
+            migration.apply(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=migration.version, name=migration.name, applied_at=datetime.utcnow()
+            ))
+        logger.info(f"Applied migration {migration.version}: {migration.name}")
+        done.append(migration)
+    return done
+
+
+def status() -> List[Dict]:
+    applied = applied_versions()
+    return [
+        {
+            'version': migration.version,
+            'name': migration.name,
+            'applied_at': applied[migration.version].isoformat() if migration.version in applied else None
+        }
+        for migration in MIGRATIONS
+    ]
+
+
+# ---------------------------------------------------------------------------
+# 쿼리 플랜 검사
+# ---------------------------------------------------------------------------
+
+def _full_scans(connection, statement: str, parameters) -> List[str]:
+    """SELECT 문의 실행 계획에서 인덱스 없이 전체 스캔하는 테이블 목록"""
+    dialect = connection.dialect.name
+    if dialect == 'sqlite':
+        plan = connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters).all()
+        scans = []
+        for row in plan:
+            detail = row[-1]
+            # 'SCAN bookings' / 'SCAN TABLE bookings' 만 전체 스캔 (USING INDEX, VIRTUAL TABLE 제외)
+            if detail.startswith('SCAN ') and 'USING' not in detail and 'VIRTUAL TABLE' not in detail:
+                words = detail.split()
+                scans.append(words[2] if words[1] == 'TABLE' else words[1])
+        return scans
+    if dialect == 'postgresql':
+        plan = connection.exec_driver_sql('EXPLAIN ' + statement, parameters).all()
+        return [row[0].split('Seq Scan on ')[1].split()[0] for row in plan if 'Seq Scan on ' in row[0]]
+    raise NotImplementedError(f"Query plan check is not supported for {dialect}")
+
+
+def plan_check_supported() -> bool:
+    """현재 DB 에서 쿼리 플랜 검사를 할 수 있는지 (앱 컨텍스트 안에서 호출)"""
+    return db.engine.dialect.name in PLAN_DIALECTS
+
+
+@contextmanager
+def capture_selects():
+    """블록 안에서 실행된 SELECT 문과 파라미터 수집"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def plan_check_routes() -> List[str]:
+    """쿼리 플랜을 검사할 예약 API 경로 (필터 값은 현재 DB 데이터에서 선택)"""
+    staff = Staff.query.first()
+    service = Service.query.first()
+    today = datetime.now().strftime('%Y-%m-%d')
+    routes = [
+        '/api/bookings',
+        f'/api/bookings?date={today}',
+        '/api/bookings?limit=50',
+        '/api/bookings?search=1234',
+        '/api/customers?limit=50',
+        f'/api/stats/daily?date={today}',
+    ]
+    if staff:
+        routes.append(f'/api/bookings?date={today}&staff={staff.name}')
+    if service:
+        routes.append(f'/api/bookings?service={service.name}')
+    return routes
+
+
+def check_query_plans(app, routes: Optional[List[str]] = None, ignore=REFERENCE_TABLES) -> Dict[str, List[str]]:
+    """각 경로가 실행하는 SELECT 의 실행 계획을 확인하여 전체 스캔 테이블을 보고
+
+    반환값: {경로: [전체 스캔 테이블, ...]} (기준 테이블 스캔은 제외)
+    """
+    client = app.test_client()
+    report = {}
+    with app.app_context():
+        routes = routes or plan_check_routes()
+        for route in routes:
+            with capture_selects() as statements:
+                client.get(route)
+            scans = []
+            with db.engine.connect() as connection:
+                for statement, parameters in statements:
+                    for table in _full_scans(connection, statement, parameters):
+                        if table not in ignore and table not in scans:
+                            scans.append(table)
+            report[route] = scans
+    return report
+
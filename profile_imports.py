@@ -0,0 +1,145 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import json
+import argparse
+import tempfile
+import statistics
+import subprocess
+from collections import defaultdict
+
+# 앱 시작 비용 측정 (모듈별 import 시간 + create_app 시간)
+#
+#   python profile_imports.py                      # src.app_factory import + create_app
+#   python profile_imports.py --module src.routes.ai_chat --no-app
+#   python profile_imports.py --runs 5 --budget-ms 800
+#
+# 새 파이썬 프로세스를 -X importtime 으로 실행해 모듈별 self/누적 시간(µs)을 모으고,
+# 최상위 패키지(sqlalchemy, flask, openai ...)별로 합산하여 보고한다.
+# create_app 은 빈 임시 SQLite DB 로 실행한다 (스키마 생성/확인은 포함하지 않음).
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+app_ms = None
+if {create_app}:
+    from src.app_factory import create_app
+    created = time.perf_counter()
+    create_app({{'SCHEMA_CHECK': False}})
+    app_ms = (time.perf_counter() - created) * 1000
+print(json.dumps({{"import_ms": (imported - start) * 1000, "create_app_ms": app_ms,
+                  "modules": sorted(sys.modules)}}))
+'''
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 -> [(모듈, self_us, cumulative_us, 깊이), ...] (import 된 순서)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def profile_once(module, create_app):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get('PYTHONPATH')]))
+    env.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='profile_imports_'), 'app.db'))
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD.format(module=module, create_app=create_app)],
+        capture_output=True, text=True, env=env, cwd=PROJECT_ROOT,
+    )
+    if completed.returncode != 0:
+        sys.stderr.write('\n'.join(line for line in completed.stderr.splitlines() if not line.startswith('import time:')))
+        raise SystemExit(f'profiling {module} failed (exit {completed.returncode})')
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['rows'] = parse_importtime(completed.stderr)
+    return result
+
+
+def summarize(runs, top):
+    """여러 번 실행한 결과의 중앙값으로 모듈별/패키지별 비용 정리"""
+    self_times = defaultdict(list)
+    cumulative_times = defaultdict(list)
+    for run in runs:
+        for name, self_us, cumulative_us, depth in run['rows']:
+            self_times[name].append(self_us)
+            cumulative_times[name].append(cumulative_us)
+
+    packages = defaultdict(int)
+    for name, values in self_times.items():
+        packages[name.split('.')[0]] += statistics.median(values)
+
+    # 프로젝트 모듈(src.*)은 누적 시간 기준 - 어떤 모듈이 무거운 의존성을 끌어오는지 확인
+    project = sorted(
+        ((name, statistics.median(values)) for name, values in cumulative_times.items() if name.startswith('src.')),
+        key=lambda item: -item[1]
+    )
+    app_times = [run['create_app_ms'] for run in runs if run['create_app_ms'] is not None]
+    return {
+        'import_ms': round(statistics.median(run['import_ms'] for run in runs), 1),
+        'create_app_ms': round(statistics.median(app_times), 1) if app_times else None,
+        'modules_loaded': len(runs[-1]['modules']),
+        'packages': [{'package': name, 'self_ms': round(us / 1000, 2)}
+                     for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]],
+        'project_modules': [{'module': name, 'cumulative_ms': round(us / 1000, 2)} for name, us in project[:top]],
+        'slowest_modules': [
+            {'module': name, 'self_ms': round(statistics.median(values) / 1000, 2)}
+            for name, values in sorted(self_times.items(), key=lambda item: -statistics.median(item[1]))[:top]
+        ],
+    }
+
+
+def print_report(module, report, watch):
+    print(f"import {module}: {report['import_ms']:.1f} ms, {report['modules_loaded']} modules loaded")
+    if report['create_app_ms'] is not None:
+        print(f"create_app(): {report['create_app_ms']:.1f} ms")
+    print('\n패키지별 import 시간 (self 합계)')
+    for item in report['packages']:
+        print(f"  {item['self_ms']:9.2f} ms  {item['package']}")
+    print('\n프로젝트 모듈 (누적)')
+    for item in report['project_modules']:
+        print(f"  {item['cumulative_ms']:9.2f} ms  {item['module']}")
+    print('\n가장 느린 모듈 (self)')
+    for item in report['slowest_modules']:
+        print(f"  {item['self_ms']:9.2f} ms  {item['module']}")
+    loaded = [name for name in watch if name in report['loaded_watch']]
+    print(f"\n시작 시 로드된 무거운 의존성: {', '.join(loaded) if loaded else '없음'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='모듈별 import 시간 / 앱 시작 시간 측정')
+    parser.add_argument('--module', default='src.app_factory', help='import 할 모듈')
+    parser.add_argument('--no-app', action='store_true', help='create_app() 시간은 측정하지 않음')
+    parser.add_argument('--runs', type=int, default=3, help='실행 횟수 (중앙값 보고)')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--watch', default='openai,google.generativeai,pandas,numpy',
+                        help='시작 시 로드되면 안 되는 모듈 (쉼표 구분)')
+    parser.add_argument('--budget-ms', type=float, help='import + create_app 시간이 이를 넘으면 종료 코드 1')
+    parser.add_argument('--output', help='결과 JSON 파일 경로')
+    args = parser.parse_args()
+
+    runs = [profile_once(args.module, not args.no_app) for _ in range(max(args.runs, 1))]
+    report = summarize(runs, args.top)
+    watch = [name.strip() for name in args.watch.split(',') if name.strip()]
+    report['loaded_watch'] = [name for name in watch if name in runs[-1]['modules']]
+    print_report(args.module, report, watch)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    total = report['import_ms'] + (report['create_app_ms'] or 0)
+    failed = bool(report['loaded_watch'])
+    if args.budget_ms is not None and total > args.budget_ms:
+        print(f"startup {total:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
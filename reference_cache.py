@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from src.models.booking import Service, Staff
+
+logger = logging.getLogger(__name__)
+
+# 세션에 기록해 두었다가 커밋 시점에 캐시 무효화 (롤백되면 무시)
+CHANGED_KEY = 'reference_data_changed'
+
+
+class ServiceRef(NamedTuple):
+    id: int
+    name: str
+    duration: int
+    base_price: int
+    is_active: bool
+
+
+class StaffRef(NamedTuple):
+    id: int
+    name: str
+    is_active: bool
+    # 근무 일정 (JSON 문자열은 캐시 적재 시 한 번만 파싱)
+    working_hours_start: Optional[str] = None
+    working_hours_end: Optional[str] = None
+    working_days: Tuple[str, ...] = ()
+    specialties: Tuple[str, ...] = ()
+
+
+class _Snapshot(NamedTuple):
+    version: int
+    loaded_at: float
+    services_by_name: Dict[str, ServiceRef]
+    services_by_id: Dict[int, ServiceRef]
+    staff_by_name: Dict[str, StaffRef]
+    staff_by_id: Dict[int, StaffRef]
+    # /services, /staff 응답 본문과 ETag (활성 항목, 이름순)
+    services_body: str
+    services_etag: str
+    staff_body: str
+    staff_etag: str
+
+
+def _body_and_etag(items: List[Dict]) -> Tuple[str, str]:
+    body = current_app.json.dumps(items)
+    return body, hashlib.sha1(body.encode('utf-8')).hexdigest()
+
+
+def _json_list(value: Optional[str]) -> Tuple[str, ...]:
+    try:
+        return tuple(json.loads(value)) if value else ()
+    except (TypeError, ValueError):
+        return ()
+
+
+def _by_name(refs) -> Dict:
+    # 이름이 중복되면 filter_by(name=...).first() 와 같이 id 가 가장 작은 행 사용
+    result = {}
+    for ref in sorted(refs, key=lambda ref: ref.id, reverse=True):
+        result[ref.name] = ref
+    return result
+
+
+class ReferenceCache:
+    """서비스/직원 기준 데이터 프로세스 로컬 캐시
+
+    서비스/직원 변경이 커밋되면 버전이 올라가고 다음 조회 시 다시 읽는다.
+    다른 워커 프로세스에서의 변경은 ttl 초 이내에 반영된다.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self.version = 0
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self.version += 1
+
+    def _load(self, version: int) -> _Snapshot:
+        services = Service.query.all()
+        staff_list = Staff.query.all()
+
+        service_refs = [
+            ServiceRef(s.id, s.name, s.duration, s.base_price, bool(s.is_active)) for s in services
+        ]
+        staff_refs = [
+            StaffRef(s.id, s.name, bool(s.is_active), s.working_hours_start, s.working_hours_end,
+                     _json_list(s.working_days), _json_list(s.specialties))
+            for s in staff_list
+        ]
+
+        services_body, services_etag = _body_and_etag(
+            [s.to_dict() for s in sorted(services, key=lambda s: s.name) if s.is_active]
+        )
+        staff_body, staff_etag = _body_and_etag(
+            [s.to_dict() for s in sorted(staff_list, key=lambda s: s.name) if s.is_active]
+        )
+        logger.info(f"Reference cache loaded (version {version}): {len(services)} services, {len(staff_list)} staff")
+        return _Snapshot(
+            version, time.monotonic(),
+            _by_name(service_refs), {ref.id: ref for ref in service_refs},
+            _by_name(staff_refs), {ref.id: ref for ref in staff_refs},
+            services_body, services_etag, staff_body, staff_etag
+        )
+
+    def snapshot(self) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.version \
+                and time.monotonic() - snapshot.loaded_at < self.ttl:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != self.version \
+                    or time.monotonic() - snapshot.loaded_at >= self.ttl:
+                snapshot = self._snapshot = self._load(self.version)
+            return snapshot
+
+    def service(self, name: str) -> Optional[ServiceRef]:
+        return self.snapshot().services_by_name.get(name)
+
+    def staff(self, name: str) -> Optional[StaffRef]:
+        return self.snapshot().staff_by_name.get(name)
+
+    def service_by_id(self, service_id: int) -> Optional[ServiceRef]:
+        return self.snapshot().services_by_id.get(service_id)
+
+    def staff_by_id(self, staff_id: int) -> Optional[StaffRef]:
+        return self.snapshot().staff_by_id.get(staff_id)
+
+    def active_staff(self) -> List[StaffRef]:
+        return sorted((ref for ref in self.snapshot().staff_by_id.values() if ref.is_active), key=lambda ref: ref.name)
+
+
+reference_cache = ReferenceCache(ttl=float(os.environ.get('REFERENCE_CACHE_TTL', 60)))
+
+
+@event.listens_for(Service, 'after_insert')
+@event.listens_for(Service, 'after_update')
+@event.listens_for(Service, 'after_delete')
+@event.listens_for(Staff, 'after_insert')
+@event.listens_for(Staff, 'after_update')
+@event.listens_for(Staff, 'after_delete')
+def _reference_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info[CHANGED_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_on_commit(session):
+    if session.info.pop(CHANGED_KEY, False):
+        reference_cache.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session):
+    session.info.pop(CHANGED_KEY, None)
@@ -0,0 +1,386 @@
+import os
+import sys
+import hmac
+import time
+import logging
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from flask import Blueprint, Response, g, has_request_context, jsonify, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# 요청 단위 추적 (PERF_DEBUG=1 일 때만 설치)
+#
+# 요청마다 처리 시간을 DB 쿼리 / LLM 호출 / 서브프로세스 구간으로 나누어 기록하고,
+# 최근 요청과 느린 요청 예시를 메모리 링 버퍼에 보관한다. 샘플링 프로파일러를 켜면
+# 느린 요청의 스택을 collapsed 형식(flamegraph.pl, speedscope 호환)으로 남긴다.
+#
+#   GET  /debug/perf                       경로별 요약 + 최근/느린 요청
+#   GET  /debug/perf/flamegraph[?trace=ID] 느린 요청 스택 (text/plain, "a;b;c 12")
+#   POST /debug/perf/profiler              {"enabled": true, "interval_ms": 5}
+#
+# PERF_DEBUG_TOKEN 은 필수이며 X-Debug-Token 헤더가 일치해야 한다 (없으면 시작하지 않음).
+
+SPAN_KINDS = ('db', 'llm', 'subprocess')
+
+BUFFER_SIZE = int(os.environ.get('PERF_BUFFER', 500))
+SLOW_BUFFER_SIZE = int(os.environ.get('PERF_SLOW_BUFFER', 50))
+SLOW_MS = float(os.environ.get('PERF_SLOW_MS', 500))
+PROFILE_INTERVAL_MS = float(os.environ.get('PERF_PROFILE_INTERVAL_MS', 5))
+# 이보다 짧은 샘플링 간격은 GIL 경쟁으로 요청 처리 자체를 느리게 함
+MIN_PROFILE_INTERVAL_MS = 5.0
+TOKEN_ENV = 'PERF_DEBUG_TOKEN'
+# 요청별로 남기는 가장 느린 SQL 수
+TOP_QUERIES = 5
+MAX_STACK_DEPTH = 64
+
+
+class Trace:
+    """요청 하나의 처리 시간과 구간(span) 합계"""
+
+    __slots__ = ('id', 'method', 'path', 'route', 'blueprint', 'started_at', 'start',
+                 'duration_ms', 'status', 'spans', 'queries', 'stacks')
+
+    def __init__(self, trace_id: int):
+        self.id = trace_id
+        self.method = request.method
+        self.path = request.path
+        self.route = request.url_rule.rule if request.url_rule else None
+        self.blueprint = request.blueprint or 'app'
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.duration_ms = None
+        self.status = None
+        # 종류별 [횟수, 시간(ms)]
+        self.spans = {kind: [0, 0.0] for kind in SPAN_KINDS}
+        self.queries: List = []
+        self.stacks: Optional[Counter] = None
+
+    def add_span(self, kind: str, duration_ms: float):
+        span = self.spans.setdefault(kind, [0, 0.0])
+        span[0] += 1
+        span[1] += duration_ms
+
+    def add_query(self, statement: str, duration_ms: float):
+        self.add_span('db', duration_ms)
+        if len(self.queries) < TOP_QUERIES or duration_ms > self.queries[-1][0]:
+            self.queries.append((duration_ms, statement))
+            self.queries.sort(key=lambda item: -item[0])
+            del self.queries[TOP_QUERIES:]
+
+    def to_dict(self, include_queries: bool = False) -> Dict:
+        result = {
+            'id': self.id,
+            'method': self.method,
+            'path': self.path,
+            'route': self.route,
+            'blueprint': self.blueprint,
+            'started_at': self.started_at,
+            'duration_ms': round(self.duration_ms, 2) if self.duration_ms is not None else None,
+            'status': self.status,
+            'spans': {kind: {'count': count, 'ms': round(ms, 2)} for kind, (count, ms) in self.spans.items()},
+            'profiled': self.stacks is not None,
+        }
+        if include_queries:
+            result['slowest_queries'] = [{'ms': round(ms, 2), 'sql': sql} for ms, sql in self.queries]
+        return result
+
+
+class TraceBuffer:
+    """최근 요청 / 느린 요청 예시 링 버퍼"""
+
+    def __init__(self, size: int = BUFFER_SIZE, slow_size: int = SLOW_BUFFER_SIZE, slow_ms: float = SLOW_MS):
+        self.slow_ms = slow_ms
+        self.recent = deque(maxlen=size)
+        self.slow = deque(maxlen=slow_size)
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def next_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def add(self, trace: Trace):
+        with self._lock:
+            self.recent.append(trace)
+            if trace.duration_ms >= self.slow_ms:
+                self.slow.append(trace)
+
+    def find(self, trace_id: int) -> Optional[Trace]:
+        with self._lock:
+            for trace in list(self.slow) + list(self.recent):
+                if trace.id == trace_id:
+                    return trace
+        return None
+
+    def clear(self):
+        with self._lock:
+            self.recent.clear()
+            self.slow.clear()
+
+    def summary(self) -> List[Dict]:
+        """버퍼에 남은 요청의 경로별 평균 (어느 경로가 DB/LLM/서브프로세스에 시간을 쓰는지)"""
+        with self._lock:
+            traces = list(self.recent)
+        routes: Dict = {}
+        for trace in traces:
+            key = (trace.method, trace.route or trace.path)
+            routes.setdefault(key, []).append(trace)
+        result = []
+        for (method, route), items in routes.items():
+            durations = sorted(trace.duration_ms for trace in items)
+            count = len(items)
+            item = {
+                'method': method,
+                'route': route,
+                'count': count,
+                'avg_ms': round(sum(durations) / count, 2),
+                'p95_ms': round(durations[min(count - 1, int(count * 0.95))], 2),
+                'max_ms': round(durations[-1], 2),
+            }
+            for kind in SPAN_KINDS:
+                item[f'{kind}_count'] = round(sum(trace.spans[kind][0] for trace in items) / count, 2)
+                item[f'{kind}_ms'] = round(sum(trace.spans[kind][1] for trace in items) / count, 2)
+            result.append(item)
+        result.sort(key=lambda item: -item['avg_ms'] * item['count'])
+        return result
+
+
+trace_buffer = TraceBuffer()
+
+# 요청을 처리 중인 스레드 -> Trace (샘플링 프로파일러가 해당 스레드 스택만 수집)
+_active: Dict[int, Trace] = {}
+
+
+def current_trace() -> Optional[Trace]:
+    return g.get('_trace') if has_request_context() else None
+
+
+@contextmanager
+def trace_span(kind: str):
+    """현재 요청에 구간 시간 기록 (추적 중이 아니면 아무것도 하지 않음)"""
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(kind, (time.perf_counter() - start) * 1000)
+
+
+# ---------------------------------------------------------------------------
+# 샘플링 프로파일러
+# ---------------------------------------------------------------------------
+
+def _frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame) -> str:
+    """프레임 -> 'outer;...;inner' (collapsed stack 한 줄)"""
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        names.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class SamplingProfiler:
+    """interval 마다 요청 처리 중인 스레드의 스택을 수집 (sys._current_frames)"""
+
+    def __init__(self, interval_ms: float = PROFILE_INTERVAL_MS):
+        self.interval_ms = max(interval_ms, MIN_PROFILE_INTERVAL_MS)
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_ms: Optional[float] = None):
+        if interval_ms:
+            self.interval_ms = max(float(interval_ms), MIN_PROFILE_INTERVAL_MS)
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='perf-sampler', daemon=True)
+        self._thread.start()
+        logger.info(f"Sampling profiler started ({self.interval_ms:g}ms)")
+
+    def stop(self):
+        if self.running:
+            self._stop.set()
+            self._thread.join()
+            logger.info("Sampling profiler stopped")
+        self._thread = None
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_ms / 1000):
+            active = list(_active.items())
+            if not active:
+                continue
+            frames = sys._current_frames()
+            for ident, trace in active:
+                frame = frames.get(ident)
+                if frame is None or ident == own or trace.duration_ms is not None:
+                    continue
+                if trace.stacks is None:
+                    trace.stacks = Counter()
+                trace.stacks[collapse_stack(frame)] += 1
+
+
+profiler = SamplingProfiler()
+
+
+def folded_stacks(traces) -> str:
+    stacks = Counter()
+    for trace in traces:
+        if trace.stacks:
+            stacks.update(trace.stacks)
+    return ''.join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+# ---------------------------------------------------------------------------
+# 미들웨어 / SQLAlchemy 이벤트
+# ---------------------------------------------------------------------------
+
+def install_query_tracing(engine):
+    """엔진의 모든 SQL 실행 시간을 현재 요청의 db 구간으로 기록"""
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_trace_query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['_trace_query_started'].pop()
+        trace = current_trace()
+        if trace is not None:
+            trace.add_query(statement[:300], (time.perf_counter() - started) * 1000)
+
+    @event.listens_for(engine, 'handle_error')
+    def _handle_error(context):
+        stack = context.connection.info.get('_trace_query_started') if context.connection is not None else None
+        if stack:
+            stack.pop()
+
+
+def init_request_tracing(app, engine=None):
+    """요청 추적 미들웨어와 /debug/perf 등록 (PERF_DEBUG_TOKEN 이 없으면 RuntimeError)"""
+    if not os.environ.get(TOKEN_ENV):
+        raise RuntimeError(f'PERF_DEBUG=1 requires {TOKEN_ENV} to protect /debug/perf')
+
+    @app.before_request
+    def _start_trace():
+        if request.blueprint == perf_bp.name:
+            return
+        trace = Trace(trace_buffer.next_id())
+        g._trace = trace
+        _active[threading.get_ident()] = trace
+
+    @app.after_request
+    def _finish_trace(response):
+        trace = g.pop('_trace', None)
+        _active.pop(threading.get_ident(), None)
+        if trace is None:
+            return response
+        trace.duration_ms = (time.perf_counter() - trace.start) * 1000
+        trace.status = response.status_code
+        # 빠른 요청의 스택은 버림 (느린 요청 예시만 flamegraph 로 남김)
+        if trace.stacks is not None and trace.duration_ms < trace_buffer.slow_ms:
+            trace.stacks = None
+        trace_buffer.add(trace)
+        for kind, (count, ms) in trace.spans.items():
+            if count:
+                response.headers.add('Server-Timing', f'{kind};dur={ms:.2f};desc="{count}"')
+        response.headers['X-Trace-Id'] = str(trace.id)
+        return response
+
+    @app.teardown_request
+    def _drop_trace(error=None):
+        # after_request 까지 가지 못한 요청
+        _active.pop(threading.get_ident(), None)
+
+    if engine is not None:
+        install_query_tracing(engine)
+    app.register_blueprint(perf_bp, url_prefix='/debug')
+    if os.environ.get('PERF_PROFILE') == '1':
+        profiler.start()
+    return app
+
+
+# ---------------------------------------------------------------------------
+# /debug/perf
+# ---------------------------------------------------------------------------
+
+perf_bp = Blueprint('perf', __name__)
+
+
+@perf_bp.before_request
+def _check_debug_token():
+    token = os.environ.get(TOKEN_ENV)
+    supplied = request.headers.get('X-Debug-Token')
+    if not token or not supplied or not hmac.compare_digest(supplied.encode(), token.encode()):
+        return jsonify({'error': 'Forbidden'}), 403
+
+
+@perf_bp.route('/perf', methods=['GET'])
+def get_perf():
+    """경로별 요약 + 최근 요청 + 느린 요청 예시 (가장 느린 SQL 포함)"""
+    try:
+        limit = request.args.get('limit', 50, type=int)
+        recent = list(trace_buffer.recent)[-limit:] if limit > 0 else []
+        return jsonify({
+            'pid': os.getpid(),
+            'slow_ms': trace_buffer.slow_ms,
+            'profiler': {'running': profiler.running, 'interval_ms': profiler.interval_ms},
+            'routes': trace_buffer.summary(),
+            'recent': [trace.to_dict() for trace in reversed(recent)],
+            'slow': [trace.to_dict(include_queries=True) for trace in reversed(trace_buffer.slow)],
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@perf_bp.route('/perf', methods=['DELETE'])
+def clear_perf():
+    trace_buffer.clear()
+    return jsonify({'success': True})
+
+
+@perf_bp.route('/perf/flamegraph', methods=['GET'])
+def get_flamegraph():
+    """느린 요청 스택 (collapsed 형식) - trace 를 지정하면 해당 요청만"""
+    trace_id = request.args.get('trace', type=int)
+    if trace_id is not None:
+        trace = trace_buffer.find(trace_id)
+        if trace is None:
+            return jsonify({'error': f'Trace {trace_id} not found'}), 404
+        traces = [trace]
+    else:
+        traces = list(trace_buffer.slow)
+    return Response(folded_stacks(traces), mimetype='text/plain')
+
+
+@perf_bp.route('/perf/profiler', methods=['POST'])
+def toggle_profiler():
+    try:
+        data = request.get_json(silent=True) or {}
+        interval_ms = data.get('interval_ms')
+        if interval_ms is not None and float(interval_ms) < MIN_PROFILE_INTERVAL_MS:
+            raise ValueError(f'interval_ms must be at least {MIN_PROFILE_INTERVAL_MS:g}')
+        if data.get('enabled', True):
+            profiler.start(interval_ms)
+        else:
+            profiler.stop()
+        return jsonify({'running': profiler.running, 'interval_ms': profiler.interval_ms})
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
@@ -0,0 +1,152 @@
+import os
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from flask import Response, make_response, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from src.models.booking import Booking, Customer, Pet, Service, Staff
+
+logger = logging.getLogger(__name__)
+
+# 세션에 변경된 리소스를 모아 두었다가 커밋 시점에 버전 증가 (롤백되면 무시)
+CHANGED_KEY = 'response_cache_changed'
+
+# 모델 변경 -> 응답이 달라지는 리소스 (목록에는 고객/반려동물/서비스/직원 이름이 함께 나감)
+MODEL_RESOURCES = {
+    Booking: ('bookings', 'stats'),
+    Customer: ('bookings', 'customers'),
+    Pet: ('bookings',),
+    Service: ('bookings', 'stats'),
+    Staff: ('bookings', 'stats'),
+}
+
+# 이보다 큰 응답(전체 목록 등)은 메모리에 두지 않고 ETag 만 계산
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class _Entry(NamedTuple):
+    versions: Tuple[int, ...]
+    created: float
+    body: bytes
+    mimetype: str
+    etag: str
+
+
+class ResponseCache:
+    """리소스 버전 카운터 + 직렬화된 응답 본문 캐시
+
+    쓰기가 커밋되면 관련 리소스의 버전이 올라가 이전 본문은 더 이상 사용되지 않는다.
+    다른 워커 프로세스의 변경은 버전에 반영되지 않으므로 ttl 초 이내에 반영된다.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._versions: Dict[str, int] = {}
+        self._entries: 'OrderedDict[Tuple, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def version(self, resource: str) -> int:
+        return self._versions.get(resource, 0)
+
+    def bump(self, *resources: str):
+        with self._lock:
+            for resource in resources:
+                self._versions[resource] = self._versions.get(resource, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: Tuple, versions: Tuple[int, ...]) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.versions != versions or time.monotonic() - entry.created >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, versions: Tuple[int, ...], body: bytes, mimetype: str) -> _Entry:
+        entry = _Entry(versions, time.monotonic(), body, mimetype, hashlib.sha1(body).hexdigest())
+        if len(body) <= MAX_BODY_BYTES:
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+
+response_cache = ResponseCache(ttl=float(os.environ.get('RESPONSE_CACHE_TTL', 10)))
+
+
+def _request_key() -> Tuple:
+    # 쿼리 파라미터 순서와 관계없이 같은 키 (같은 이름이 여러 번 오면 값 순서는 유지)
+    return (request.path, tuple(sorted((name, tuple(request.args.getlist(name))) for name in request.args)))
+
+
+def cached_response(*resources: str):
+    """GET 응답 본문을 리소스 버전과 쿼리 파라미터로 캐시하고 강한 ETag/304 처리
+
+    버전은 조회 전에 읽으므로 조회 중에 커밋된 변경이 있으면 그 본문은 다음 요청에서 버려진다.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = _request_key()
+            versions = tuple(response_cache.version(resource) for resource in resources)
+            entry = response_cache.get(key, versions)
+            cache_status = 'HIT'
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                entry = response_cache.put(key, versions, response.get_data(), response.mimetype)
+                cache_status = 'MISS'
+            response = Response(entry.body, mimetype=entry.mimetype)
+            response.set_etag(entry.etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['X-Cache'] = cache_status
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+
+def mark_changed(session, *resources: str):
+    """커밋되면 리소스 버전 증가 (mapper 이벤트를 거치지 않는 core INSERT/UPDATE 용)"""
+    session.info.setdefault(CHANGED_KEY, set()).update(resources)
+
+
+def _model_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        mark_changed(session, *MODEL_RESOURCES[mapper.class_])
+
+
+for _model in MODEL_RESOURCES:
+    for _event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _event_name, _model_changed)
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_on_commit(session):
+    resources = session.info.pop(CHANGED_KEY, None)
+    if resources:
+        response_cache.bump(*resources)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session):
+    session.info.pop(CHANGED_KEY, None)
+
@@ -0,0 +1,305 @@
+import json
+import math
+import time
+import random
+import logging
+from datetime import date, timedelta
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import insert, inspect
+
+from src.models.booking import db, Booking, Customer, Pet, Service, Staff
+from src.booking_stats import BookingDailyStat, rebuild_daily_stats
+from src.booking_search import search_enabled, rebuild_search_index
+from src.reference_cache import reference_cache
+from src.availability import availability_index
+from src.response_cache import response_cache
+from src.booking_changes import record_reload
+from src.booking_guard import overlap_guard_installed, remove_overlap_guard, install_overlap_guard
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 10000
+
+# 기본 서비스/직원 (init_data 의 샘플 데이터와 동일)
+SERVICES = [
+    {'name': '미용', 'duration': 120, 'base_price': 50000, 'description': '기본 미용 서비스'},
+    {'name': '목욕', 'duration': 90, 'base_price': 30000, 'description': '목욕 및 드라이'},
+    {'name': '네일', 'duration': 30, 'base_price': 15000, 'description': '발톱 정리'},
+    {'name': '귀청소', 'duration': 20, 'base_price': 10000, 'description': '귀 청소 서비스'},
+    {'name': '부분미용', 'duration': 60, 'base_price': 35000, 'description': '얼굴, 발끝 등 부분 미용'},
+    {'name': '전체미용', 'duration': 180, 'base_price': 80000, 'description': '전체 미용 패키지'},
+]
+STAFF = [
+    {'name': '원장님', 'position': '원장', 'specialties': ['전체미용', '미용', '네일', '귀청소'],
+     'working_days': ['월', '화', '수', '목', '금', '토']},
+    {'name': '실장님', 'position': '실장', 'specialties': ['목욕', '부분미용', '전체미용'],
+     'working_days': ['월', '화', '수', '목', '금']},
+]
+
+# 분포 (가중치)
+SERVICE_WEIGHTS = {'미용': 30, '목욕': 35, '네일': 12, '귀청소': 8, '부분미용': 10, '전체미용': 5}
+SURNAMES = [('김', 21), ('이', 15), ('박', 8), ('최', 5), ('정', 4), ('강', 2), ('조', 2), ('윤', 2),
+            ('장', 2), ('임', 2), ('한', 1), ('오', 1), ('서', 1), ('신', 1), ('권', 1), ('황', 1)]
+GIVEN_SYLLABLES = '민서지현수영준우예하도윤성은재혜진동석경미유나아'
+PET_NAMES = ['초코', '콩이', '보리', '뽀삐', '루비', '몽이', '코코', '해피', '별이', '두부',
+             '라떼', '모카', '감자', '호두', '구름', '사랑', '밤이', '망고', '까미', '토리']
+BREEDS = [('말티즈', 20, 3.0), ('푸들', 18, 5.0), ('포메라니안', 12, 2.5), ('비숑 프리제', 10, 6.0),
+          ('시츄', 9, 6.0), ('믹스견', 9, 9.0), ('치와와', 5, 2.0), ('요크셔테리어', 4, 2.5),
+          ('웰시코기', 4, 12.0), ('골든 리트리버', 3, 28.0), ('시바견', 3, 10.0), ('진돗개', 3, 18.0)]
+DISTRICTS = ['강남구 역삼동', '서초구 서초동', '송파구 잠실동', '마포구 서교동', '영등포구 여의도동',
+             '용산구 한남동', '성동구 성수동', '강서구 화곡동', '노원구 상계동', '분당구 정자동']
+PETS_PER_CUSTOMER = [(1, 70), (2, 22), (3, 8)]
+GAPS = [(0, 50), (30, 30), (60, 15), (120, 5)]
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+# 하루 직원 1명당 평균 예약 수 (합성 직원 수 계산용)
+BOOKINGS_PER_STAFF_DAY = 4
+
+
+def _weighted(rng: random.Random, pairs):
+    values = [pair[0] for pair in pairs]
+    weights = [pair[1] for pair in pairs]
+    return lambda: rng.choices(values, weights)[0]
+
+
+def _batches(rows: Iterator[Dict], size: int = BATCH_SIZE) -> Iterator[List[Dict]]:
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+class SampleDataGenerator:
+    """합성 고객/반려동물/예약 데이터 생성기 (같은 seed 이면 같은 데이터)
+
+    - 고객 이름: 성씨 빈도 분포, 전화번호는 중복 없이 무작위
+    - 반려동물: 고객당 1~3마리, 품종 빈도와 품종별 체중
+    - 예약: 단골 고객 편중(파레토), 서비스 인기도, 직원 전문 분야/근무 요일/근무 시간 안에서
+      직원별로 겹치지 않게 배치, 지난 예약은 완료/취소, 이후 예약은 확정/대기
+    """
+
+    def __init__(self, customers: int, bookings: int, days: int = 365, seed: int = 42,
+                 end: Optional[date] = None):
+        self.customer_count = customers
+        self.booking_count = bookings
+        self.days = days
+        self.rng = random.Random(seed)
+        # 기간의 1/6 은 미래 예약
+        self.end = end or date.today() + timedelta(days=max(days // 6, 1))
+        self.start = self.end - timedelta(days=days - 1)
+
+    def staff_rows(self) -> List[Dict]:
+        """기본 직원 + 예약 수를 기간 안에 배치할 수 있도록 필요한 만큼 합성 직원"""
+        working_ratio = 6 / 7
+        needed = math.ceil(self.booking_count / (self.days * working_ratio * BOOKINGS_PER_STAFF_DAY))
+        rows = [dict(staff) for staff in STAFF]
+        names = list(SERVICE_WEIGHTS)
+        for index in range(max(needed - len(rows), 0)):
+            rows.append({
+                'name': f'디자이너{index + 1}',
+                'position': '디자이너',
+                'specialties': self.rng.sample(names, self.rng.randint(3, len(names))),
+                'working_days': self.rng.sample(WEEKDAYS[:6], 5) if index % 3 else WEEKDAYS[:6],
+            })
+        for row in rows:
+            row.setdefault('working_hours_start', '09:00')
+            row.setdefault('working_hours_end', '18:00')
+        return rows
+
+    def customer_rows(self, first_id: int, existing_phones=frozenset()) -> Iterator[Dict]:
+        surname = _weighted(self.rng, SURNAMES)
+        # 기존 고객(추가 적재 시)과 겹치지 않는 전화번호
+        phones = [
+            f'{number:08d}' for number in self.rng.sample(range(10 ** 8), self.customer_count + len(existing_phones))
+            if f'010-{number // 10 ** 4:04d}-{number % 10 ** 4:04d}' not in existing_phones
+        ]
+        for index in range(self.customer_count):
+            name = surname() + ''.join(self.rng.choices(GIVEN_SYLLABLES, k=2))
+            phone = phones[index]
+            yield {
+                'id': first_id + index,
+                'name': name,
+                'phone': f'010-{phone[:4]}-{phone[4:]}',
+                'email': f'user{first_id + index}@example.com',
+                'address': f'서울시 {self.rng.choice(DISTRICTS)}',
+            }
+
+    def pet_rows(self, first_customer_id: int, first_id: int, owners: Dict[int, List[int]]) -> Iterator[Dict]:
+        """반려동물 행 생성 - owners 에 고객 id -> 반려동물 id 목록을 채움"""
+        pet_count = _weighted(self.rng, PETS_PER_CUSTOMER)
+        breed = _weighted(self.rng, [((name, weight), share) for name, share, weight in BREEDS])
+        pet_id = first_id
+        for customer_id in range(first_customer_id, first_customer_id + self.customer_count):
+            # 고객별 반려동물 이름은 고유 (customer_keys.PET_NAME_INDEX)
+            for pet_name in self.rng.sample(PET_NAMES, pet_count()):
+                breed_name, weight = breed()
+                owners.setdefault(customer_id, []).append(pet_id)
+                yield {
+                    'id': pet_id,
+                    'name': pet_name,
+                    'breed': breed_name,
+                    'age': self.rng.randint(1, 15),
+                    'weight': round(weight * self.rng.uniform(0.7, 1.3), 1),
+                    'notes': '',
+                    'customer_id': customer_id,
+                }
+                pet_id += 1
+
+    def booking_rows(self, owners: Dict[int, List[int]], services: List[Dict], staff: List[Dict]) -> Iterator[Dict]:
+        """날짜/직원 순으로 근무 시간을 채우며 booking_count 개의 예약 생성
+
+        기간(days) 안에 다 배치하지 못하면 기간 끝에서 멈춘다. 예약을 배치할 수 있는
+        직원(근무 요일과 제공 가능한 서비스가 있는 직원)이 없으면 ValueError.
+        """
+        customer_ids = list(owners)
+        service_by_name = {service['name']: service for service in services}
+        if not any(member['working_days'] and any(name in service_by_name for name in member['specialties'])
+                   for member in staff):
+            raise ValueError('No staff member can take bookings (working days and matching services required)')
+        gap = _weighted(self.rng, GAPS)
+        today = date.today()
+        generated = 0
+        day = self.start
+        while generated < self.booking_count and day <= self.end:
+            weekday = WEEKDAYS[day.weekday()]
+            for member in staff:
+                if weekday not in member['working_days']:
+                    continue
+                choices = [(name, SERVICE_WEIGHTS.get(name, 1)) for name in member['specialties']
+                           if name in service_by_name]
+                if not choices:
+                    continue
+                pick = _weighted(self.rng, choices)
+                cursor = int(member['working_hours_start'][:2]) * 60 + gap()
+                close_at = int(member['working_hours_end'][:2]) * 60
+                while generated < self.booking_count:
+                    service = service_by_name[pick()]
+                    if cursor + service['duration'] > close_at:
+                        break
+                    # 파레토 분포로 일부 단골 고객에게 예약이 몰림
+                    customer_id = customer_ids[min(int(self.rng.paretovariate(1.2)) - 1, len(customer_ids) - 1)
+                                               if self.rng.random() < 0.3 else self.rng.randrange(len(customer_ids))]
+                    if day < today:
+                        status = self.rng.choices(['completed', 'cancelled', 'confirmed'], [88, 8, 4])[0]
+                    else:
+                        status = self.rng.choices(['confirmed', 'pending', 'cancelled'], [75, 20, 5])[0]
+                    yield {
+                        'customer_id': customer_id,
+                        'pet_id': self.rng.choice(owners[customer_id]),
+                        'service_id': service['id'],
+                        'staff_id': member['id'],
+                        'date': day,
+                        'time': f'{cursor // 60:02d}:{cursor % 60:02d}',
+                        'duration': service['duration'],
+                        'price': service['base_price'] + self.rng.choice([0, 0, 0, 5000, 10000]),
+                        'status': status,
+                        'notes': '',
+                    }
+                    generated += 1
+                    cursor += service['duration'] + gap()
+            day += timedelta(days=1)
+        if generated < self.booking_count:
+            logger.warning(f"Only {generated} of {self.booking_count} bookings fit in {self.days} days")
+
+
+def _ensure_reference_data(generator: SampleDataGenerator):
+    """서비스/직원이 없으면 생성하고 (id 포함) 목록 반환"""
+    existing = {service.name for service in Service.query.all()}
+    rows = [dict(row, is_active=True) for row in SERVICES if row['name'] not in existing]
+    if rows:
+        db.session.execute(insert(Service), rows)
+    existing = {staff.name for staff in Staff.query.all()}
+    rows = [
+        dict(row, specialties=json.dumps(row['specialties'], ensure_ascii=False),
+             working_days=json.dumps(row['working_days'], ensure_ascii=False), is_active=True)
+        for row in generator.staff_rows() if row['name'] not in existing
+    ]
+    if rows:
+        db.session.execute(insert(Staff), rows)
+    services = [{'id': s.id, 'name': s.name, 'duration': s.duration, 'base_price': s.base_price}
+                for s in Service.query.filter_by(is_active=True)]
+    staff = [{'id': s.id, 'name': s.name,
+              'specialties': json.loads(s.specialties) if s.specialties else list(SERVICE_WEIGHTS),
+              'working_days': json.loads(s.working_days) if s.working_days else WEEKDAYS,
+              'working_hours_start': s.working_hours_start or '09:00',
+              'working_hours_end': s.working_hours_end or '18:00'}
+             for s in Staff.query.filter_by(is_active=True).order_by(Staff.id)]
+    return services, staff
+
+
+def seed_bulk(customers: int = 1000, bookings: int = 10000, days: int = 365, seed: int = 42) -> Dict:
+    """합성 데이터를 executemany INSERT 로 한 트랜잭션에 적재
+
+    id 를 직접 배정하므로 고객/반려동물 id 를 다시 조회하지 않는다.
+    통계 요약은 같은 트랜잭션에서 재계산하고, 검색 인덱스는 커밋 후 재구성한다.
+    """
+    started = time.perf_counter()
+    generator = SampleDataGenerator(customers, bookings, days, seed)
+    try:
+        services, staff = _ensure_reference_data(generator)
+        first_customer_id = (db.session.query(db.func.max(Customer.id)).scalar() or 0) + 1
+        first_pet_id = (db.session.query(db.func.max(Pet.id)).scalar() or 0) + 1
+
+        existing_phones = {phone for phone, in db.session.query(Customer.phone)} if first_customer_id > 1 else frozenset()
+        for batch in _batches(generator.customer_rows(first_customer_id, existing_phones)):
+            db.session.execute(insert(Customer), batch)
+        owners: Dict[int, List[int]] = {}
+        pet_total = 0
+        for batch in _batches(generator.pet_rows(first_customer_id, first_pet_id, owners)):
+            db.session.execute(insert(Pet), batch)
+            pet_total += len(batch)
+        # 생성기가 직원/날짜별로 겹치지 않게 배치하므로 적재 동안 중복 방지 트리거를 빼 둠 (같은 트랜잭션)
+        guarded = overlap_guard_installed(db.session.connection())
+        if guarded:
+            remove_overlap_guard(db.session.connection())
+        booking_total = 0
+        for batch in _batches(generator.booking_rows(owners, services, staff)):
+            db.session.execute(insert(Booking), batch)
+            booking_total += len(batch)
+        if guarded:
+            install_overlap_guard(db.session.connection())
+
+        # mapper 이벤트를 거치지 않았으므로 통계 요약은 시작일 이후를 다시 계산
+        connection = db.session.connection()
+        if inspect(connection).has_table(BookingDailyStat.__tablename__):
+            rebuild_daily_stats(connection, generator.start)
+        record_reload(connection)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    if search_enabled():
+        rebuild_search_index()
+    reference_cache.invalidate()
+    availability_index.invalidate()
+    response_cache.bump('bookings', 'stats', 'customers')
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Seeded {customers} customers, {pet_total} pets, {booking_total} bookings in {elapsed:.1f}s")
+    return {
+        'customers': customers,
+        'pets': pet_total,
+        'bookings': booking_total,
+        'staff': len(staff),
+        'start': generator.start.strftime('%Y-%m-%d'),
+        'end': generator.end.strftime('%Y-%m-%d'),
+        'elapsed_seconds': round(elapsed, 2),
+    }
+
+
+def truncate_all():
+    """스키마/마이그레이션 기록은 두고 데이터만 삭제 (자식 테이블부터)"""
+    with db.engine.begin() as connection:
+        for table in reversed(db.metadata.sorted_tables):
+            if table.name != 'schema_migrations' and inspect(connection).has_table(table.name):
+                connection.execute(table.delete())
+        record_reload(connection)
+    if search_enabled():
+        rebuild_search_index()
+    reference_cache.invalidate()
+    availability_index.invalidate()
+    response_cache.bump('bookings', 'stats', 'customers')
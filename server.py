@@ -0,0 +1,135 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import signal
+import logging
+import multiprocessing
+from typing import NamedTuple
+
+from src.lifecycle import begin_shutdown, run_shutdown_callbacks
+
+logger = logging.getLogger(__name__)
+
+# 운영 서버 실행 (gunicorn, 멀티 프로세스 x 스레드)
+#
+#   python server.py                       # HOST/PORT, WEB_CONCURRENCY, WEB_THREADS 환경 변수 사용
+#   WEB_CONCURRENCY=4 WEB_THREADS=8 PORT=4000 python server.py
+#
+# 스키마는 먼저 python migrate.py upgrade 로 맞춘다 (워커는 시작 시 DDL 을 실행하지 않음).
+# SIGTERM: 새 연결을 받지 않고 진행 중인 요청을 GRACEFUL_TIMEOUT 초까지 마무리한 뒤 종료.
+#          예약 변경 SSE 스트림은 바로 끝나며 클라이언트는 커서(Last-Event-ID)로 다른 워커에 재연결한다.
+#
+# 셸 실행 블루프린트(terminal, executor)는 명령 작업과 터미널 세션(cd 위치)을 워커 메모리에 두므로
+# 이를 포함하면 워커 1개로 실행한다. 예약 API 와 나누려면 별도 프로세스로 띄운다:
+#   python server.py                                                   # 예약/AI API (여러 워커)
+#   APP_BLUEPRINTS=terminal,executor SHELL_API_TOKEN=... PORT=4000 python server.py   # 셸 API (워커 1개)
+# 워커가 종료되면 실행 중인 명령 작업은 취소된다 (다른 워커나 재시작 후에 이어 받을 수 없음).
+
+
+class ServerSettings(NamedTuple):
+    host: str = '0.0.0.0'
+    port: int = 5000
+    workers: int = 2
+    threads: int = 8
+    # SIGTERM 후 진행 중인 요청을 기다리는 시간 (초)
+    graceful_timeout: int = 30
+    # 응답 없는 워커를 재시작하기까지의 시간 (초, gthread 는 요청이 길어도 워커가 응답함)
+    timeout: int = 60
+    keepalive: int = 5
+    # 워커당 요청 수가 이를 넘으면 재시작 (0 이면 재시작하지 않음)
+    max_requests: int = 0
+    max_requests_jitter: int = 0
+    access_log: bool = False
+
+    @classmethod
+    def from_env(cls) -> 'ServerSettings':
+        default_workers = min(multiprocessing.cpu_count() * 2 + 1, 8)
+        return cls(
+            host=os.environ.get('HOST', cls._field_defaults['host']),
+            port=int(os.environ.get('PORT', cls._field_defaults['port'])),
+            workers=int(os.environ.get('WEB_CONCURRENCY', default_workers)),
+            threads=int(os.environ.get('WEB_THREADS', cls._field_defaults['threads'])),
+            graceful_timeout=int(os.environ.get('GRACEFUL_TIMEOUT', cls._field_defaults['graceful_timeout'])),
+            timeout=int(os.environ.get('WORKER_TIMEOUT', cls._field_defaults['timeout'])),
+            keepalive=int(os.environ.get('KEEPALIVE', cls._field_defaults['keepalive'])),
+            max_requests=int(os.environ.get('MAX_REQUESTS', cls._field_defaults['max_requests'])),
+            max_requests_jitter=int(os.environ.get('MAX_REQUESTS_JITTER', cls._field_defaults['max_requests_jitter'])),
+            access_log=os.environ.get('ACCESS_LOG') == '1',
+        )
+
+
+def _post_worker_init(worker):
+    # gunicorn 의 SIGTERM 처리(새 요청 중단) 앞에 종료 단계 표시를 추가 - 열린 스트림이 먼저 끝나도록
+    handle_exit = signal.getsignal(signal.SIGTERM)
+
+    def handle_term(signum, frame):
+        begin_shutdown()
+        handle_exit(signum, frame)
+
+    signal.signal(signal.SIGTERM, handle_term)
+
+
+def _worker_exit(server, worker):
+    # 진행 중인 요청이 끝난 뒤 - DB 연결 반환, 실행 중인 명령 종료, 요청 통계 기록
+    run_shutdown_callbacks()
+
+
+def gunicorn_options(settings: ServerSettings) -> dict:
+    options = {
+        'bind': f'{settings.host}:{settings.port}',
+        'workers': settings.workers,
+        'worker_class': 'gthread',
+        'threads': settings.threads,
+        'graceful_timeout': settings.graceful_timeout,
+        'timeout': settings.timeout,
+        'keepalive': settings.keepalive,
+        'max_requests': settings.max_requests,
+        'max_requests_jitter': settings.max_requests_jitter,
+        # 워커마다 앱을 만든다 (스레드 풀/DB 연결/프로세스 캐시는 fork 후 공유하지 않음)
+        'preload_app': False,
+        'post_worker_init': _post_worker_init,
+        'worker_exit': _worker_exit,
+    }
+    if settings.access_log:
+        options['accesslog'] = '-'
+    return options
+
+
+def pin_shell_workers(settings: ServerSettings) -> ServerSettings:
+    """셸 실행 블루프린트가 켜져 있으면 워커 1개로 고정 (작업/세션 상태가 프로세스 메모리에 있음)"""
+    from src.app_factory import SHELL_BLUEPRINTS, enabled_blueprints
+    shell = SHELL_BLUEPRINTS.intersection(enabled_blueprints())
+    if shell and settings.workers != 1:
+        logger.warning(f"{', '.join(sorted(shell))} keep jobs and terminal sessions in process memory, "
+                       f"running 1 worker instead of {settings.workers} "
+                       "(serve the other blueprints from a separate server process)")
+        settings = settings._replace(workers=1)
+    return settings
+
+
+def run(settings: ServerSettings):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise SystemExit('gunicorn is required for the production server (pip install gunicorn), '
+                         'or use python main.py for local development')
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options(settings).items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from src.app_factory import create_app
+            return create_app()
+
+    settings = pin_shell_workers(settings)
+    logger.info(f"Starting {settings.workers} worker(s) x {settings.threads} thread(s) "
+                f"on {settings.host}:{settings.port}")
+    Application().run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(process)d] %(levelname)s %(name)s: %(message)s')
+    run(ServerSettings.from_env())
@@ -0,0 +1,35 @@
+import os
+import hmac
+from typing import Optional
+
+from flask import request, jsonify
+
+# 셸 명령 실행 API(터미널, Gabriel 실행기) 인증 토큰 - 설정되지 않으면 해당 API 는 모두 거부
+TOKEN_ENV = 'SHELL_API_TOKEN'
+
+# 토큰 없이 허용하는 엔드포인트 (로드밸런서 readiness/health 프로브, 명령 실행 없음)
+PUBLIC_ENDPOINTS = frozenset(['executor.status', 'executor.health'])
+
+
+def shell_token() -> Optional[str]:
+    return os.environ.get(TOKEN_ENV) or None
+
+
+def _supplied_token() -> Optional[str]:
+    value = request.headers.get('Authorization', '')
+    if value.lower().startswith('bearer '):
+        return value[7:].strip()
+    return request.headers.get('X-Shell-Token')
+
+
+def require_shell_token():
+    """블루프린트 before_request - Authorization: Bearer <토큰> 또는 X-Shell-Token 헤더 확인"""
+    if request.endpoint in PUBLIC_ENDPOINTS:
+        return None
+    token = shell_token()
+    if not token:
+        return jsonify({'error': f'Shell API is disabled ({TOKEN_ENV} is not set)'}), 503
+    supplied = _supplied_token()
+    if not supplied or not hmac.compare_digest(supplied.encode(), token.encode()):
+        return jsonify({'error': 'Unauthorized'}), 401
+    return None
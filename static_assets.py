@@ -0,0 +1,269 @@
+import os
+import re
+import gzip
+import hashlib
+import logging
+import mimetypes
+import threading
+from io import BytesIO
+from typing import Dict, FrozenSet, NamedTuple, Optional
+
+from flask import request, send_file
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 - 없으면 미리 만든 .br 파일만 사용
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+INDEX = 'index.html'
+
+# 빌드 도구가 내용 해시를 붙인 파일 (main.3f2a9c1b.js, index-BkDf3x9a.css) 은 내용이 바뀌면 이름도 바뀜
+HASHED_NAME = re.compile(r'[.-][0-9a-f]{8,}\.[A-Za-z0-9]+$|-[A-Za-z0-9_]{8}\.(js|css|mjs)$')
+HASHED_DIRS = ('assets/', 'static/')
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+INDEX_CACHE = 'no-cache'
+DEFAULT_CACHE = 'public, max-age=3600'
+
+COMPRESSIBLE = ('text/', 'application/javascript', 'application/json', 'image/svg+xml',
+                'application/xml', 'application/manifest+json', 'font/ttf', 'font/otf')
+MIN_COMPRESS_BYTES = 1024
+# 첫 요청 때 메모리에 압축해 둘 원본 파일 최대 크기
+MAX_COMPRESS_BYTES = 8 * 1024 * 1024
+# 빌드 단계(flask precompress-static)는 최고 압축률, 요청 중 압축은 첫 응답 지연이 작도록 낮은 단계
+BUILD_GZIP_LEVEL = 9
+BUILD_BROTLI_QUALITY = 11
+LAZY_GZIP_LEVEL = 6
+LAZY_BROTLI_QUALITY = 5
+
+_compress_lock = threading.Lock()
+
+
+class Variant(NamedTuple):
+    """한 표현(원본/gzip/br) - path 가 있으면 파일, 없으면 메모리의 data"""
+    encoding: Optional[str]
+    size: int
+    etag: str
+    path: Optional[str] = None
+    data: Optional[bytes] = None
+
+
+class Asset(NamedTuple):
+    path: str
+    mimetype: str
+    mtime: float
+    cache_control: str
+    variants: Dict[Optional[str], Variant]
+    # 미리 만든 파일이 없어 첫 요청 때 압축해 variants 에 채울 인코딩
+    lazy: FrozenSet[str] = frozenset()
+
+
+def _is_compressible(mimetype: str) -> bool:
+    return mimetype.startswith(COMPRESSIBLE)
+
+
+def _cache_control(relative: str) -> str:
+    if relative == INDEX:
+        return INDEX_CACHE
+    if HASHED_NAME.search(relative) and (relative.startswith(HASHED_DIRS) or '/' not in relative):
+        return IMMUTABLE_CACHE
+    return DEFAULT_CACHE
+
+
+def _mimetype(relative: str) -> str:
+    mimetype = mimetypes.guess_type(relative)[0] or 'application/octet-stream'
+    if mimetype.startswith('text/') or mimetype == 'application/javascript':
+        mimetype += '; charset=utf-8'
+    return mimetype
+
+
+def _compress(data: bytes, encoding: str, build: bool = False) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=BUILD_BROTLI_QUALITY if build else LAZY_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=BUILD_GZIP_LEVEL if build else LAZY_GZIP_LEVEL, mtime=0)
+
+
+def _load_asset(root: str, relative: str, names) -> Asset:
+    """원본 해시(ETag)와 미리 만든 .br/.gz 만 확인 - 압축은 시작 시 하지 않음"""
+    path = os.path.join(root, relative)
+    stat = os.stat(path)
+    mimetype = _mimetype(relative)
+
+    data = None
+    if _is_compressible(mimetype) and stat.st_size <= MAX_COMPRESS_BYTES:
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha1(data).hexdigest()[:16]
+    else:
+        digest = f'{stat.st_size:x}-{int(stat.st_mtime):x}'
+
+    variants = {None: Variant(None, stat.st_size, digest, path=path)}
+    base = os.path.basename(relative)
+    # 빌드 단계에서 만든 .br/.gz 가 있으면 그대로 사용
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if base + suffix in names:
+            variant_path = path + suffix
+            variants[encoding] = Variant(encoding, os.path.getsize(variant_path), f'{digest}-{encoding}', path=variant_path)
+    lazy = frozenset()
+    if data is not None and len(data) >= MIN_COMPRESS_BYTES:
+        lazy = frozenset(encoding for encoding in ('br', 'gzip')
+                         if encoding not in variants and (encoding != 'br' or brotli is not None))
+    return Asset(path, mimetype, stat.st_mtime, _cache_control(relative), variants, lazy)
+
+
+def _lazy_variant(asset: Asset, encoding: str) -> Variant:
+    """첫 요청 때 압축해 asset.variants 에 보관 (압축해도 작아지지 않으면 원본을 보관)"""
+    variant = asset.variants.get(encoding)
+    if variant is not None:
+        return variant
+    with _compress_lock:
+        variant = asset.variants.get(encoding)
+        if variant is None:
+            original = asset.variants[None]
+            with open(asset.path, 'rb') as f:
+                compressed = _compress(f.read(), encoding)
+            if len(compressed) < original.size:
+                variant = Variant(encoding, len(compressed), f'{original.etag}-{encoding}', data=compressed)
+            else:
+                variant = original
+            asset.variants[encoding] = variant
+    return variant
+
+
+def precompress(root: str) -> int:
+    """빌드 단계용 - 압축할 만한 정적 파일 옆에 최고 압축률의 .gz/.br 생성 (원본보다 오래된 것만 갱신)"""
+    written = 0
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if name.endswith(('.gz', '.br')):
+                continue
+            path = os.path.join(directory, name)
+            if not _is_compressible(_mimetype(name)):
+                continue
+            stat = os.stat(path)
+            if stat.st_size < MIN_COMPRESS_BYTES:
+                continue
+            data = None
+            for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+                target = path + suffix
+                if encoding == 'br' and brotli is None:
+                    continue
+                if os.path.exists(target) and os.path.getmtime(target) >= stat.st_mtime:
+                    continue
+                if data is None:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                compressed = _compress(data, encoding, build=True)
+                if len(compressed) >= len(data):
+                    continue
+                with open(target, 'wb') as f:
+                    f.write(compressed)
+                written += 1
+    return written
+
+
+class StaticManifest:
+    """정적 폴더 매니페스트 - 시작 시 한 번 만들어 요청마다 파일 시스템을 확인하지 않음
+
+    STATIC_RELOAD=1 이면 없는 경로 요청 시 다시 만든다 (개발용).
+    """
+
+    def __init__(self, root: Optional[str], reload: bool = False):
+        self.root = root
+        self.reload = reload
+        self.assets: Dict[str, Asset] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        assets = {}
+        if self.root and os.path.isdir(self.root):
+            for directory, _, names in os.walk(self.root):
+                names = set(names)
+                for name in names:
+                    # 압축 파일은 원본의 변형으로만 제공
+                    if (name.endswith('.br') or name.endswith('.gz')) and name[:-3] in names:
+                        continue
+                    relative = os.path.relpath(os.path.join(directory, name), self.root).replace(os.sep, '/')
+                    try:
+                        assets[relative] = _load_asset(self.root, relative, names)
+                    except OSError as e:
+                        logger.warning(f"Static asset skipped {relative}: {str(e)}")
+        with self._lock:
+            self.assets = assets
+        compressed = sum(1 for asset in assets.values() if len(asset.variants) > 1)
+        lazy = sum(1 for asset in assets.values() if asset.lazy)
+        logger.info(f"Static manifest: {len(assets)} files ({compressed} precompressed, "
+                    f"{lazy} compressed on first request) from {self.root}")
+
+    def get(self, relative: str) -> Optional[Asset]:
+        asset = self.assets.get(relative)
+        if asset is None and self.reload:
+            self.refresh()
+            asset = self.assets.get(relative)
+        return asset
+
+
+def _accepted_encodings() -> Dict[str, float]:
+    accepted = {}
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.lower()] = quality
+    return accepted
+
+
+def _choose_variant(asset: Asset) -> Variant:
+    # Range 요청은 원본 기준으로 응답 (압축 표현의 부분 전송은 클라이언트 지원이 일정하지 않음)
+    if (len(asset.variants) == 1 and not asset.lazy) or request.headers.get('Range'):
+        return asset.variants[None]
+    accepted = _accepted_encodings()
+    for encoding in ('br', 'gzip'):
+        if accepted.get(encoding, accepted.get('*', 0)) <= 0:
+            continue
+        if encoding in asset.variants:
+            return asset.variants[encoding]
+        if encoding in asset.lazy:
+            return _lazy_variant(asset, encoding)
+    return asset.variants[None]
+
+
+def send_asset(asset: Asset):
+    """선택한 표현을 ETag/Last-Modified/Range 처리와 함께 전송"""
+    variant = _choose_variant(asset)
+    source = variant.path if variant.data is None else BytesIO(variant.data)
+    response = send_file(
+        source,
+        mimetype=asset.mimetype,
+        etag=variant.etag,
+        last_modified=asset.mtime,
+        conditional=True,
+        max_age=None,
+    )
+    if variant.encoding:
+        response.headers['Content-Encoding'] = variant.encoding
+    if len(asset.variants) > 1 or asset.lazy:
+        response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = asset.cache_control
+    response.accept_ranges = 'bytes'
+    return response
+
+
+def serve_static(manifest: StaticManifest, path: str):
+    """정적 파일 또는 SPA 진입점(index.html) 응답"""
+    if manifest.root is None:
+        return "Static folder not configured", 404
+    asset = manifest.get(path) if path else None
+    if asset is None:
+        asset = manifest.get(INDEX)
+        if asset is None:
+            return "index.html not found", 404
+    return send_asset(asset)
@@ -5,8 +5,14 @@ import threading
 import time
 from typing import Dict, Any
 import logging
+from src.command_policy import default_policy
+from src.job_queue import job_queue, parse_timeout, QueueFull
+from src.request_trace import trace_span
+from src.shell_auth import require_shell_token
 
 terminal_bp = Blueprint('terminal', __name__)
+# 셸 명령 실행 API - SHELL_API_TOKEN 인증 필수
+terminal_bp.before_request(require_shell_token)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -41,15 +47,16 @@ class TerminalSession:
                 return self._handle_cd_command(command)
             
             # 명령어 실행
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=self.working_dir,
-                env=self.env,
-                capture_output=True,
-                text=True,
-                timeout=30  # 30초 타임아웃
-            )
+            with trace_span('subprocess'):
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    cwd=self.working_dir,
+                    env=self.env,
+                    capture_output=True,
+                    text=True,
+                    timeout=30  # 30초 타임아웃
+                )
             
             output = result.stdout
             error = result.stderr
@@ -93,27 +100,7 @@ class TerminalSession:
         """
         위험한 명령어인지 확인
         """
-        dangerous_commands = [
-            'rm -rf /',
-            'sudo rm',
-            'mkfs',
-            'dd if=',
-            'shutdown',
-            'reboot',
-            'halt',
-            'init 0',
-            'init 6',
-            'killall',
-            'pkill -9',
-            'chmod 777 /',
-            'chown -R',
-            '> /dev/sda',
-            'format',
-            'fdisk'
-        ]
-        
-        command_lower = command.lower().strip()
-        return any(dangerous in command_lower for dangerous in dangerous_commands)
+        return not default_policy.is_safe(command)
     
     def _handle_cd_command(self, command: str) -> Dict[str, Any]:
         """
@@ -231,6 +218,87 @@ def execute_command():
             "status": "error"
         }), 500
 
+@terminal_bp.route('/jobs', methods=['POST'])
+def submit_job():
+    """
+    장시간 실행 명령어를 백그라운드 작업으로 등록 (30초 제한 없음)
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'command' not in data:
+            return jsonify({
+                "error": "명령어가 필요합니다.",
+                "status": "error"
+            }), 400
+        
+        command = data['command']
+        session_id = data.get('session_id', 'default')
+        
+        try:
+            timeout = parse_timeout(data.get('timeout'))
+        except ValueError as e:
+            return jsonify({
+                "error": f"timeout 값이 올바르지 않습니다: {str(e)}",
+                "status": "error"
+            }), 400
+        
+        if session_id not in terminal_sessions:
+            terminal_sessions[session_id] = TerminalSession(session_id)
+        
+        session = terminal_sessions[session_id]
+        session.last_activity = time.time()
+        
+        if session._is_dangerous_command(command):
+            return jsonify({
+                "error": "보안상 실행할 수 없는 명령어입니다.",
+                "status": "error"
+            }), 403
+        
+        job = job_queue.submit(command, timeout=timeout, cwd=session.working_dir)
+        
+        return jsonify({
+            "job_id": job.id,
+            "job_status": job.status,
+            "session_id": session_id,
+            "status": "success"
+        }), 202
+        
+    except QueueFull as e:
+        return jsonify({
+            "error": f"대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요: {str(e)}",
+            "status": "error"
+        }), 503, {"Retry-After": "5"}
+    except Exception as e:
+        logger.error(f"터미널 작업 등록 오류: {str(e)}")
+        return jsonify({
+            "error": f"서버 오류가 발생했습니다: {str(e)}",
+            "status": "error"
+        }), 500
+
+@terminal_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    백그라운드 작업 상태 및 출력 조회
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({
+            "error": "작업을 찾을 수 없습니다.",
+            "status": "error"
+        }), 404
+    
+    offset = request.args.get('offset', 0, type=int)
+    chunks, next_offset, _ = job.wait_for_output(offset, timeout=0)
+    result = job.to_dict(include_output=False)
+    result['output'] = ''.join(chunks)
+    result['next_offset'] = next_offset
+    
+    return jsonify({
+        "job": result,
+        "status": "success"
+    })
+
 @terminal_bp.route('/history', methods=['GET'])
 def get_history():
     """
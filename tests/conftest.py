@@ -0,0 +1,47 @@
+import os
+import sys
+import types
+
+# 저장소 루트는 배포 시 src 패키지가 된다 (from src.<module> import ...)
+# 테스트에서는 패키지 __init__ (Manus/AIIN 환경 로드) 없이 모듈만 import 하도록 src 를 등록
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if 'src' not in sys.modules:
+    package = types.ModuleType('src')
+    package.__path__ = [ROOT]
+    sys.modules['src'] = package
+
+
+import pytest
+
+
+@pytest.fixture
+def migrated_app(tmp_path):
+    """마이그레이션까지 적용한 임시 SQLite 파일 DB 의 앱 (서비스 '미용', 직원 '원장님' 포함)
+
+    모델이 있는 배포 트리(src.models)에서만 사용할 수 있다.
+    """
+    pytest.importorskip('src.models.booking')
+    from src.app_factory import create_app, init_schema
+    from src.models.booking import db, Service, Staff
+    from src.reference_cache import reference_cache
+    from src.availability import availability_index
+    from src.response_cache import response_cache
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'app.db'}", 'SCHEMA_CHECK': False})
+    with app.app_context():
+        init_schema()
+        db.session.add_all([
+            Service(name='미용', duration=120, base_price=50000),
+            Staff(name='원장님', position='원장', working_hours_start='09:00', working_hours_end='18:00',
+                  specialties='["미용"]', working_days='["월", "화", "수", "목", "금", "토", "일"]'),
+        ])
+        db.session.commit()
+    # 프로세스 전역 캐시는 이전 테스트의 DB 기준이므로 비움
+    reference_cache.invalidate()
+    availability_index.invalidate()
+    response_cache.clear()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
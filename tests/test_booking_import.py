@@ -0,0 +1,39 @@
+import pytest
+
+BOOKING = {
+    'customerName': '김철수', 'customerPhone': '010-1234-5678', 'petName': '멍멍이',
+    'serviceType': '미용', 'staff': '원장님', 'date': '2030-01-07', 'time': '10:00',
+}
+
+
+@pytest.fixture
+def client(migrated_app):
+    client = migrated_app.test_client()
+    assert client.post('/api/bookings', json=BOOKING).status_code == 201
+    return client
+
+
+def _rows():
+    return [
+        dict(BOOKING, customerPhone='010-2222-0001', time='11:00'),   # 기존 10:00 예약과 겹침
+        dict(BOOKING, customerPhone='010-2222-0002', time='14:00'),
+    ]
+
+
+def test_overlapping_rows_are_rejected_individually(client):
+    report = client.post('/api/bookings/bulk', json=_rows()).get_json()
+    assert report['imported'] == 1
+    assert [error['row'] for error in report['errors']] == [1]
+
+
+def test_allow_conflicts_imports_overlapping_rows(client, migrated_app):
+    report = client.post('/api/bookings/bulk?allow_conflicts=1', json=_rows()).get_json()
+    assert report['imported'] == 2 and report['failed'] == 0
+
+    # 가져온 뒤에는 중복 방지 트리거가 다시 동작
+    from src.models.booking import db
+    from src.booking_guard import overlap_guard_installed
+    with migrated_app.app_context():
+        assert overlap_guard_installed(db.session.connection())
+    response = client.post('/api/bookings', json=dict(BOOKING, customerPhone='010-2222-0003', time='10:30'))
+    assert response.status_code == 409
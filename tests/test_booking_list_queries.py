@@ -0,0 +1,38 @@
+import pytest
+
+# 모델/라우트가 있는 배포 트리(src.models, src.routes)에서만 실행
+pytest.importorskip('src.bench_booking_list')
+
+from src.bench_booking_list import count_queries, create_app, db, seed
+from src.booking_search import init_search_index
+
+ROUTES = [
+    '/api/bookings',
+    '/api/bookings?date=2025-01-05',
+    '/api/bookings?search=고객1',
+]
+
+
+@pytest.fixture(scope='module')
+def client():
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        # 검색 인덱스 사용 여부는 모듈 전역 - 이 DB 기준으로 다시 설정 (bulk insert 후 재구성)
+        init_search_index()
+        seed(bookings=2000, customers=400)
+        init_search_index(rebuild=True)
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.mark.parametrize('route', ROUTES)
+def test_booking_list_runs_constant_queries(client, route):
+    # 목록 조회는 예약 수와 무관하게 상수 개의 쿼리만 실행해야 함 (관계 지연 로딩 N+1 방지)
+    db.session.expire_all()
+    with count_queries() as counter:
+        response = client.get(route)
+    assert response.status_code == 200
+    assert response.get_json()
+    assert counter['count'] <= 3, f'{route} ran {counter["count"]} queries'
@@ -0,0 +1,54 @@
+import pytest
+
+# 모델/라우트가 있는 배포 트리(src.models, src.routes)에서만 실행
+pytest.importorskip('src.bench_booking_list')
+
+from datetime import date
+
+from src.bench_booking_list import create_app, db
+from src.models.booking import Booking, Customer, Pet, Service, Staff
+from src.booking_search import init_search_index
+
+PEOPLE = [
+    ('김철수', '010-1234-5678', '초코2호', '푸들'),
+    ('수철김', '010-9999-0000', '콩이', '말티즈'),
+    ('박영희', '010-5555-1212', 'R2D2', '푸들'),
+]
+
+
+@pytest.fixture(scope='module')
+def client():
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        # 검색 인덱스 사용 여부는 모듈 전역 - 고객/반려동물 색인 전에 이 DB 에 인덱스 생성
+        if not init_search_index():
+            pytest.skip('FTS5 unavailable')
+        db.session.add_all([Service(name='미용', duration=60, base_price=10000), Staff(name='원장님')])
+        db.session.flush()
+        for index, (name, phone, pet_name, breed) in enumerate(PEOPLE, 1):
+            db.session.add(Customer(id=index, name=name, phone=phone, email='', address=''))
+            db.session.add(Pet(id=index, name=pet_name, breed=breed, customer_id=index))
+            db.session.add(Booking(customer_id=index, pet_id=index, service_id=1, staff_id=1,
+                                   date=date(2030, 1, index), time='10:00', duration=60, price=10000,
+                                   status='confirmed', notes=''))
+        db.session.commit()
+        yield app.test_client()
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.mark.parametrize('search,names', [
+    ('철수', ['김철수']),
+    ('수철', ['수철김']),      # 같은 글자('철','수')를 가진 다른 이름은 제외
+    ('2호', ['김철수']),       # 숫자가 들어간 반려동물 이름
+    ('R2', ['박영희']),
+    ('5678', ['김철수']),      # 전화번호 뒤 4자리
+    ('01012345678', ['김철수']),
+    ('박 푸들', ['박영희']),   # 단어가 고객 이름과 반려동물 품종에 나뉘어 있음
+    ('박 말티즈', []),         # 단어마다 같은 예약의 이름/전화번호/품종 중 하나에 포함되어야 함
+])
+def test_search_checks_original_term(client, search, names):
+    response = client.get('/api/bookings', query_string={'search': search})
+    assert response.status_code == 200
+    assert sorted(booking['customer_name'] for booking in response.get_json()) == names
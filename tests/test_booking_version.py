@@ -0,0 +1,45 @@
+from datetime import date, timedelta
+
+import pytest
+
+SERIES = {
+    'customerName': '김철수', 'customerPhone': '010-1234-5678', 'petName': '멍멍이',
+    'serviceType': '미용', 'staff': '원장님', 'time': '10:00', 'intervalWeeks': 1, 'occurrences': 3,
+}
+
+
+@pytest.fixture
+def client(migrated_app):
+    from src.booking_series import init_booking_series
+    with migrated_app.app_context():
+        assert init_booking_series()
+    return migrated_app.test_client()
+
+
+def test_cancel_series_invalidates_if_match(client):
+    start = date.today() + timedelta(days=7)
+    response = client.post('/api/bookings/series', json=dict(SERIES, date=start.isoformat()))
+    assert response.status_code == 201
+    series = response.get_json()
+    booking = series['bookings'][0]
+
+    response = client.delete(f"/api/bookings/series/{series['id']}?from={start.isoformat()}")
+    assert response.status_code == 200
+    cancelled = client.get(f"/api/bookings/series/{series['id']}").get_json()['bookings'][0]
+    assert cancelled['version'] == booking['version'] + 1
+
+    # 반복 예약 취소도 버전을 올리므로 취소 전에 읽은 버전으로는 수정할 수 없음
+    response = client.put(f"/api/bookings/{booking['id']}", json={'notes': '늦게 도착'},
+                          headers={'If-Match': f'"{booking["version"]}"'})
+    assert response.status_code == 409
+
+
+def test_update_bumps_version_once(client):
+    start = date.today() + timedelta(days=7)
+    series = client.post('/api/bookings/series', json=dict(SERIES, date=start.isoformat())).get_json()
+    booking = series['bookings'][0]
+
+    response = client.put(f"/api/bookings/{booking['id']}", json={'notes': '메모'},
+                          headers={'If-Match': f'"{booking["version"]}"'})
+    assert response.status_code == 200
+    assert response.get_json()['version'] == booking['version'] + 1
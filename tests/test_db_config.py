@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.db_config import SqliteSettings, install_sqlite_settings
+
+
+def make_engine(path, **settings):
+    engine = create_engine(f'sqlite:///{path}')
+    install_sqlite_settings(engine, SqliteSettings(**settings))
+    return engine
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / 'app.db'
+    engine = make_engine(path)
+    with engine.begin() as connection:
+        connection.execute(text('CREATE TABLE bookings (id INTEGER PRIMARY KEY, notes TEXT)'))
+        connection.execute(text("INSERT INTO bookings (notes) VALUES ('seed')"))
+    engine.dispose()
+    return path
+
+
+def test_connection_pragmas(db_path):
+    engine = make_engine(db_path, busy_timeout_ms=1234)
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql('PRAGMA journal_mode').scalar() == 'wal'
+        assert connection.exec_driver_sql('PRAGMA busy_timeout').scalar() == 1234
+        assert connection.exec_driver_sql('PRAGMA synchronous').scalar() == 1  # NORMAL
+    engine.dispose()
+
+
+def test_readers_are_not_blocked_by_open_write(db_path):
+    writer, reader = make_engine(db_path), make_engine(db_path, busy_timeout_ms=0)
+    with writer.begin() as connection:
+        connection.execute(text("INSERT INTO bookings (notes) VALUES ('pending')"))
+        # WAL: 커밋 전 쓰기 트랜잭션이 있어도 읽기는 기다리지 않고 커밋된 데이터를 봄
+        with reader.connect() as other:
+            assert other.execute(text('SELECT count(*) FROM bookings')).scalar() == 1
+    writer.dispose()
+    reader.dispose()
+
+
+def test_busy_timeout_waits_for_writer(db_path):
+    holder = make_engine(db_path)
+    impatient = make_engine(db_path, busy_timeout_ms=0)
+    patient = make_engine(db_path, busy_timeout_ms=5000)
+    app = Flask(__name__)
+
+    connection = holder.connect()
+    transaction = connection.begin()
+    connection.execute(text("INSERT INTO bookings (notes) VALUES ('holder')"))
+
+    # busy_timeout 이 없으면 쓰기 잠금을 기다리지 않고 바로 실패
+    with app.test_request_context(method='POST'):
+        with pytest.raises(OperationalError, match='locked'):
+            with impatient.begin():
+                pass
+
+    release = threading.Timer(0.3, lambda: (transaction.commit(), connection.close()))
+    release.start()
+    started = time.perf_counter()
+    # 쓰기 요청은 BEGIN IMMEDIATE 로 시작 - busy_timeout 안에 잠금이 풀리면 성공
+    with app.test_request_context(method='POST'):
+        with patient.begin() as other:
+            other.execute(text("INSERT INTO bookings (notes) VALUES ('waited')"))
+    assert time.perf_counter() - started >= 0.2
+    release.join()
+
+    with patient.connect() as other:
+        assert other.execute(text('SELECT count(*) FROM bookings')).scalar() == 3
+    for engine in (holder, impatient, patient):
+        engine.dispose()
+
+
+def test_write_requests_take_the_write_lock_at_begin(db_path):
+    writer, other = make_engine(db_path), make_engine(db_path, busy_timeout_ms=0)
+    app = Flask(__name__)
+    with app.test_request_context(method='PUT'):
+        with writer.begin():
+            # 아직 아무것도 쓰지 않았지만 BEGIN IMMEDIATE 로 쓰기 잠금을 잡고 있음
+            with pytest.raises(OperationalError, match='locked'):
+                with other.connect() as connection:
+                    connection.exec_driver_sql('BEGIN IMMEDIATE')
+    writer.dispose()
+    other.dispose()
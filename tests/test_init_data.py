@@ -0,0 +1,21 @@
+import importlib
+
+import pytest
+
+# 모델이 있는 배포 트리(src.models)에서만 실행
+pytest.importorskip('src.models.booking')
+
+
+def test_sample_data_loads_on_migrated_database(tmp_path, monkeypatch):
+    # src.main 은 import 시 앱을 만들므로 DB 경로를 먼저 지정
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'app.db'}")
+    init_data = importlib.import_module('src.init_data')
+
+    from src.models.booking import db, Booking
+    from src.booking_guard import overlap_guard_installed
+
+    # 마이그레이션(중복 방지 트리거 포함) 후 샘플 예약을 넣으므로 샘플끼리 겹치면 실패
+    init_data.init_sample_data()
+    with init_data.app.app_context():
+        assert overlap_guard_installed(db.session.connection())
+        assert Booking.query.count() == 5
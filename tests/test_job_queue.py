@@ -0,0 +1,79 @@
+import pytest
+from flask import Flask
+
+from src.job_queue import JobQueue, QueueFull, parse_timeout
+
+HEADERS = {'Authorization': 'Bearer test-token'}
+
+
+@pytest.fixture(autouse=True)
+def shell_token(monkeypatch):
+    monkeypatch.setenv('SHELL_API_TOKEN', 'test-token')
+
+
+@pytest.fixture
+def full_queue(monkeypatch):
+    # 끝나지 않은 작업 수와 관계없이 새 작업을 받지 않는 큐 (명령은 실행되지 않음)
+    import src.app
+    import src.terminal
+    queue = JobQueue(workers=1, max_pending=0)
+    monkeypatch.setattr(src.app, 'job_queue', queue)
+    monkeypatch.setattr(src.terminal, 'job_queue', queue)
+    yield queue
+    queue.shutdown()
+
+
+@pytest.fixture
+def executor_client():
+    from src.app import app
+    return app.test_client()
+
+
+@pytest.fixture
+def terminal_client():
+    from src.terminal import terminal_bp
+    app = Flask(__name__)
+    app.register_blueprint(terminal_bp, url_prefix='/api/terminal')
+    return app.test_client()
+
+
+@pytest.mark.parametrize('value', ['abc', '-1', '0', 'nan', 'inf', [5]])
+def test_parse_timeout_rejects_invalid_values(value):
+    with pytest.raises(ValueError, match='Invalid timeout'):
+        parse_timeout(value)
+
+
+def test_parse_timeout_accepts_numbers():
+    assert parse_timeout(None) is None
+    assert parse_timeout('') is None
+    assert parse_timeout('90') == 90.0
+    assert parse_timeout(2.5) == 2.5
+
+
+def test_submit_rejects_when_pending_limit_reached(full_queue):
+    with pytest.raises(QueueFull):
+        full_queue.submit('true')
+    assert full_queue.list() == []
+
+
+def test_executor_rejects_invalid_timeout(executor_client):
+    response = executor_client.post('/api/jobs', json={'command': 'uptime', 'timeout': 'abc'}, headers=HEADERS)
+    assert response.status_code == 400
+    assert 'timeout' in response.get_json()['message']
+
+
+def test_executor_reports_full_queue(executor_client, full_queue):
+    response = executor_client.post('/api/jobs', json={'command': 'uptime'}, headers=HEADERS)
+    assert response.status_code == 503
+    assert response.headers['Retry-After']
+
+
+def test_terminal_rejects_invalid_timeout(terminal_client):
+    response = terminal_client.post('/api/terminal/jobs', json={'command': 'ls', 'timeout': 'soon'}, headers=HEADERS)
+    assert response.status_code == 400
+    assert 'timeout' in response.get_json()['error']
+
+
+def test_terminal_reports_full_queue(terminal_client, full_queue):
+    response = terminal_client.post('/api/terminal/jobs', json={'command': 'ls'}, headers=HEADERS)
+    assert response.status_code == 503
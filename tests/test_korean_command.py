@@ -0,0 +1,32 @@
+import pytest
+
+from src.korean_command import parse_korean_command, translate
+
+TRANSLATED = [
+    ('AIIN, nginx 재시작해줘', 'sudo systemctl restart nginx'),
+    ('웹 서버 설정 검사해줘', 'nginx -t'),
+    ('메모리 확인해줘', 'free -h'),
+    ('현재 위치 알려줘', 'pwd'),
+    ('AIIN, echo hello 해줘', 'echo hello'),
+    ('ls -la', 'ls -la'),
+]
+
+UNRECOGNIZED = [
+    'nginx 중지해줘',
+    '도커 삭제해줘',
+    'nginx 재시작 블라블라',
+    'echo hello 실행해줘',
+]
+
+
+@pytest.mark.parametrize('phrase,command', TRANSLATED)
+def test_translates_known_phrases(phrase, command):
+    assert parse_korean_command(phrase) == command
+
+
+@pytest.mark.parametrize('phrase', UNRECOGNIZED)
+def test_unrecognized_words_are_reported(phrase):
+    translation = translate(phrase)
+    assert translation.error and not translation.command
+    with pytest.raises(ValueError):
+        parse_korean_command(phrase)
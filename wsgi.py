@@ -0,0 +1,9 @@
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from src.app_factory import create_app
+
+# 다른 WSGI 서버용 진입점 (예: gunicorn -k gthread --threads 8 src.wsgi:app)
+# 워커 수/스레드/graceful shutdown 설정은 server.py 참고
+app = create_app()